@@ -0,0 +1,73 @@
+"""Add partial indexes for file upload and notification list pages.
+
+Revision ID: 019_list_feed_indexes
+Revises: 018_backfill_username
+Create Date: 2026-10-17
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "019_list_feed_indexes"
+down_revision = "018_backfill_username"
+branch_labels = None
+depends_on = None
+
+# (table, index name, columns, partial predicate)
+_INDEXES: list[tuple[str, str, list[str], str]] = [
+    (
+        "file_uploads",
+        "ix_file_uploads_list",
+        ["uploaded_by", "category", "created_at DESC"],
+        "is_active AND status = 'active'",
+    ),
+    (
+        "notifications",
+        "ix_notifications_recipient_feed",
+        ["recipient_id", "is_read", "created_at DESC"],
+        "is_active",
+    ),
+    (
+        "notifications",
+        "ix_notifications_recipient_unread",
+        ["recipient_id"],
+        "is_active AND NOT is_read",
+    ),
+]
+
+
+def _has_index(inspector, table: str, name: str) -> bool:
+    return any(idx.get("name") == name for idx in inspector.get_indexes(table))
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        for table, name, columns, predicate in _INDEXES:
+            if not inspector.has_table(table) or _has_index(inspector, table, name):
+                continue
+            op.create_index(
+                name,
+                table,
+                [sa.text(column) for column in columns],
+                postgresql_where=sa.text(predicate),
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+
+    with op.get_context().autocommit_block():
+        for table, name, _columns, _predicate in reversed(_INDEXES):
+            if inspector.has_table(table) and _has_index(inspector, table, name):
+                op.drop_index(
+                    name,
+                    table_name=table,
+                    postgresql_concurrently=True,
+                )
@@ -0,0 +1,61 @@
+"""Add pg_trgm GIN indexes for school name/state/city search.
+
+Revision ID: 020_school_search_trgm
+Revises: 019_list_feed_indexes
+Create Date: 2026-10-17
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "020_school_search_trgm"
+down_revision = "019_list_feed_indexes"
+branch_labels = None
+depends_on = None
+
+# (index name, column) — trigram indexes let ILIKE '%term%' use an index scan.
+_INDEXES: list[tuple[str, str]] = [
+    ("ix_schools_name_trgm", "name"),
+    ("ix_schools_state_trgm", "state"),
+    ("ix_schools_city_trgm", "city"),
+]
+
+
+def _has_index(inspector, table: str, name: str) -> bool:
+    return any(idx.get("name") == name for idx in inspector.get_indexes(table))
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        for name, column in _INDEXES:
+            if _has_index(inspector, "schools", name):
+                continue
+            op.create_index(
+                name,
+                "schools",
+                [column],
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+
+    with op.get_context().autocommit_block():
+        for name, _column in reversed(_INDEXES):
+            if _has_index(inspector, "schools", name):
+                op.drop_index(
+                    name,
+                    table_name="schools",
+                    postgresql_concurrently=True,
+                )
+    # pg_trgm is left installed; other objects may depend on it.
@@ -0,0 +1,67 @@
+"""Add keyset indexes for the filtered audit log list.
+
+Revision ID: 022_audit_filter_indexes
+Revises: 021_keyset_list_indexes
+Create Date: 2026-10-17
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "022_audit_filter_indexes"
+down_revision = "021_keyset_list_indexes"
+branch_labels = None
+depends_on = None
+
+# (table, index name, columns, partial predicate or None)
+_INDEXES: list[tuple[str, str, list[str], str | None]] = [
+    (
+        "audit_events",
+        "ix_audit_events_action_list",
+        ["action", "occurred_at DESC", "id DESC"],
+        "is_active",
+    ),
+    (
+        "audit_events",
+        "ix_audit_events_entity_type_list",
+        ["entity_type", "occurred_at DESC", "id DESC"],
+        "is_active",
+    ),
+]
+
+
+def _has_index(inspector, table: str, name: str) -> bool:
+    return any(idx.get("name") == name for idx in inspector.get_indexes(table))
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        for table, name, columns, predicate in _INDEXES:
+            if not inspector.has_table(table) or _has_index(inspector, table, name):
+                continue
+            op.create_index(
+                name,
+                table,
+                [sa.text(column) for column in columns],
+                postgresql_where=sa.text(predicate) if predicate else None,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+
+    with op.get_context().autocommit_block():
+        for table, name, _columns, _predicate in reversed(_INDEXES):
+            if inspector.has_table(table) and _has_index(inspector, table, name):
+                op.drop_index(
+                    name,
+                    table_name=table,
+                    postgresql_concurrently=True,
+                )
@@ -0,0 +1,63 @@
+"""Add keyset pagination indexes for the customer, invoice and entitlement lists.
+
+Revision ID: 023_billing_keyset_indexes
+Revises: 022_audit_filter_indexes
+Create Date: 2026-10-17
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "023_billing_keyset_indexes"
+down_revision = "022_audit_filter_indexes"
+branch_labels = None
+depends_on = None
+
+# (table, index name, columns, partial predicate or None)
+_INDEXES: list[tuple[str, str, list[str], str | None]] = [
+    ("customers", "ix_customers_created_id", ["created_at DESC", "id DESC"], None),
+    ("invoices", "ix_invoices_created_id", ["created_at DESC", "id DESC"], None),
+    (
+        "entitlements",
+        "ix_entitlements_created_id",
+        ["created_at DESC", "id DESC"],
+        None,
+    ),
+]
+
+
+def _has_index(inspector, table: str, name: str) -> bool:
+    return any(idx.get("name") == name for idx in inspector.get_indexes(table))
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        for table, name, columns, predicate in _INDEXES:
+            if not inspector.has_table(table) or _has_index(inspector, table, name):
+                continue
+            op.create_index(
+                name,
+                table,
+                [sa.text(column) for column in columns],
+                postgresql_where=sa.text(predicate) if predicate else None,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+
+    with op.get_context().autocommit_block():
+        for table, name, _columns, _predicate in reversed(_INDEXES):
+            if inspector.has_table(table) and _has_index(inspector, table, name):
+                op.drop_index(
+                    name,
+                    table_name=table,
+                    postgresql_concurrently=True,
+                )
@@ -225,11 +225,20 @@ def list_customers(
     order_dir: str = Query(default="desc", pattern="^(asc|desc)$"),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = None,
     db: Session = Depends(get_db),
 ):
     try:
         return billing_service.customers.list_response(
-            db, person_id, email, is_active, order_by, order_dir, limit, offset
+            db,
+            person_id,
+            email,
+            is_active,
+            order_by,
+            order_dir,
+            limit,
+            offset,
+            cursor=cursor,
         )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -452,6 +461,7 @@ def list_invoices(
     order_dir: str = Query(default="desc", pattern="^(asc|desc)$"),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = None,
     db: Session = Depends(get_db),
 ):
     try:
@@ -464,6 +474,7 @@ def list_invoices(
             order_dir,
             limit,
             offset,
+            cursor=cursor,
         )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -787,11 +798,12 @@ def list_coupons(
     order_dir: str = Query(default="desc", pattern="^(asc|desc)$"),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = None,
     db: Session = Depends(get_db),
 ):
     try:
         return billing_service.coupons.list_response(
-            db, valid, code, order_by, order_dir, limit, offset
+            db, valid, code, order_by, order_dir, limit, offset, cursor=cursor
         )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -923,11 +935,19 @@ def list_entitlements(
     order_dir: str = Query(default="desc", pattern="^(asc|desc)$"),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = None,
     db: Session = Depends(get_db),
 ):
     try:
         return billing_service.entitlements.list_response(
-            db, product_id, feature_key, order_by, order_dir, limit, offset
+            db,
+            product_id,
+            feature_key,
+            order_by,
+            order_dir,
+            limit,
+            offset,
+            cursor=cursor,
         )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
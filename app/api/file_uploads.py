@@ -1,11 +1,21 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, Form, Query, UploadFile, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Form,
+    HTTPException,
+    Query,
+    UploadFile,
+    status,
+)
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db
 from app.schemas.common import ListResponse
 from app.schemas.file_upload import FileUploadRead
+from app.services.common import decode_cursor, encode_cursor, next_cursor
 from app.services.file_upload import FileUploadService
 
 router = APIRouter(prefix="/file-uploads", tags=["file-uploads"])
@@ -38,8 +48,6 @@ def get_file_upload(file_id: UUID, db: Session = Depends(get_db)) -> FileUploadR
     svc = FileUploadService(db)
     record = svc.get_by_id(file_id)
     if not record or not record.is_active:
-        from fastapi import HTTPException
-
         raise HTTPException(status_code=404, detail="File upload not found")
     return FileUploadRead.model_validate(record)
 
@@ -51,8 +59,13 @@ def list_file_uploads(
     entity_id: str | None = None,
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = None,
     db: Session = Depends(get_db),
 ) -> ListResponse[FileUploadRead]:
+    try:
+        position = decode_cursor(cursor) if cursor else None
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
     svc = FileUploadService(db)
     items = svc.list_uploads(
         category=category,
@@ -60,7 +73,9 @@ def list_file_uploads(
         entity_id=entity_id,
         limit=limit,
         offset=offset,
+        cursor=position,
     )
+    following = next_cursor(items, limit)
     total = svc.count(category=category)
     return ListResponse(
         items=[FileUploadRead.model_validate(i) for i in items],
@@ -68,6 +83,7 @@ def list_file_uploads(
         limit=limit,
         offset=offset,
         total=total,
+        next_cursor=encode_cursor(following) if following else None,
     )
 
 
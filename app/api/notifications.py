@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db, require_user_auth
@@ -10,6 +10,7 @@ from app.schemas.notification import (
     NotificationRead,
     UnreadCountResponse,
 )
+from app.services.common import decode_cursor, encode_cursor, next_cursor
 from app.services.notification import NotificationService
 
 router = APIRouter(prefix="/notifications", tags=["notifications"])
@@ -31,14 +32,24 @@ def list_my_notifications(
     unread_only: bool = False,
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = None,
     db: Session = Depends(get_db),
     auth: dict = Depends(require_user_auth),
 ) -> ListResponse[NotificationRead]:
     person_id = UUID(auth["person_id"])
+    try:
+        position = decode_cursor(cursor) if cursor else None
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
     svc = NotificationService(db)
     items = svc.list_for_recipient(
-        person_id, unread_only=unread_only, limit=limit, offset=offset
+        person_id,
+        unread_only=unread_only,
+        limit=limit,
+        offset=offset,
+        cursor=position,
     )
+    following = next_cursor(items, limit)
     total = svc.unread_count(person_id) if unread_only else len(items)
     return ListResponse(
         items=[NotificationRead.model_validate(n) for n in items],
@@ -46,6 +57,7 @@ def list_my_notifications(
         limit=limit,
         offset=offset,
         total=total,
+        next_cursor=encode_cursor(following) if following else None,
     )
 
 
@@ -70,8 +82,6 @@ def mark_notification_read(
     svc = NotificationService(db)
     record = svc.mark_read(notification_id, person_id)
     if not record:
-        from fastapi import HTTPException
-
         raise HTTPException(status_code=404, detail="Notification not found")
     db.commit()
     return NotificationRead.model_validate(record)
@@ -50,11 +50,12 @@ def list_roles(
     order_dir: str = Query(default="asc", pattern="^(asc|desc)$"),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = None,
     db: Session = Depends(get_db),
 ):
     try:
         return rbac_service.roles.list_response(
-            db, is_active, order_by, order_dir, limit, offset
+            db, is_active, order_by, order_dir, limit, offset, cursor=cursor
         )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -112,11 +113,12 @@ def list_permissions(
     order_dir: str = Query(default="asc", pattern="^(asc|desc)$"),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = None,
     db: Session = Depends(get_db),
 ):
     try:
         return rbac_service.permissions.list_response(
-            db, is_active, order_by, order_dir, limit, offset
+            db, is_active, order_by, order_dir, limit, offset, cursor=cursor
         )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -187,11 +189,19 @@ def list_role_permissions(
     order_dir: str = Query(default="asc", pattern="^(asc|desc)$"),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = None,
     db: Session = Depends(get_db),
 ):
     try:
         return rbac_service.role_permissions.list_response(
-            db, role_id, permission_id, order_by, order_dir, limit, offset
+            db,
+            role_id,
+            permission_id,
+            order_by,
+            order_dir,
+            limit,
+            offset,
+            cursor=cursor,
         )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -261,11 +271,12 @@ def list_person_roles(
     order_dir: str = Query(default="desc", pattern="^(asc|desc)$"),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = None,
     db: Session = Depends(get_db),
 ):
     try:
         return rbac_service.person_roles.list_response(
-            db, person_id, role_id, order_by, order_dir, limit, offset
+            db, person_id, role_id, order_by, order_dir, limit, offset, cursor=cursor
         )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -24,11 +24,12 @@ def list_scheduled_tasks(
     order_dir: str = Query(default="desc", pattern="^(asc|desc)$"),
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = None,
     db: Session = Depends(get_db),
 ):
     try:
         return scheduler_service.scheduled_tasks.list_response(
-            db, enabled, order_by, order_dir, limit, offset
+            db, enabled, order_by, order_dir, limit, offset, cursor=cursor
         )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -21,6 +21,8 @@ class Settings:
     db_max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
     db_pool_timeout: int = int(os.getenv("DB_POOL_TIMEOUT", "30"))
     db_pool_recycle: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    # Compiled SQL cache entries per engine (SQLAlchemy's default is 500).
+    db_query_cache_size: int = int(os.getenv("DB_QUERY_CACHE_SIZE", "1200"))
 
     # Avatar settings
     avatar_upload_dir: str = os.getenv("AVATAR_UPLOAD_DIR", "static/avatars")
@@ -75,6 +77,13 @@ class Settings:
     )  # basis points (10%)
     schoolnet_currency: str = os.getenv("SCHOOLNET_CURRENCY", "NGN")
 
+    # Threads for password hashing during registration; 0 uses Python's
+    # default ThreadPoolExecutor size
+    password_hash_workers: int = int(os.getenv("PASSWORD_HASH_WORKERS", "0"))
+
+    # Jinja bytecode cache directory; empty disables it
+    jinja_bytecode_cache_dir: str = os.getenv("JINJA_BYTECODE_CACHE_DIR", "")
+
     # CORS
     cors_origins: str = os.getenv("CORS_ORIGINS", "")  # Comma-separated origins
 
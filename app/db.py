@@ -41,6 +41,7 @@ def get_engine():
         max_overflow=settings.db_max_overflow,
         pool_timeout=settings.db_pool_timeout,
         pool_recycle=settings.db_pool_recycle,
+        query_cache_size=settings.db_query_cache_size,
     )
 
 
@@ -2,7 +2,17 @@ import enum
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import JSON, Boolean, DateTime, Enum, Index, Integer, String
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    DateTime,
+    Enum,
+    Index,
+    Integer,
+    String,
+    desc,
+    text,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -20,6 +30,31 @@ class AuditEvent(Base):
     __tablename__ = "audit_events"
     __table_args__ = (
         Index("ix_audit_events_occurred_at", "occurred_at"),
+        # Keyset pagination of the admin audit log on (occurred_at, id).
+        Index(
+            "ix_audit_events_list",
+            desc("occurred_at"),
+            desc("id"),
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active"),
+        ),
+        # Same ordering behind the optional action / entity_type filters.
+        Index(
+            "ix_audit_events_action_list",
+            "action",
+            desc("occurred_at"),
+            desc("id"),
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active"),
+        ),
+        Index(
+            "ix_audit_events_entity_type_list",
+            "entity_type",
+            desc("occurred_at"),
+            desc("id"),
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active"),
+        ),
         Index("ix_audit_events_actor_occurred", "actor_id", "occurred_at"),
         Index("ix_audit_events_entity", "entity_type", "entity_id"),
         Index("ix_audit_events_request_id", "request_id"),
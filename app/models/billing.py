@@ -8,10 +8,12 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     UniqueConstraint,
+    desc,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -167,6 +169,10 @@ class Price(Base):
 
 class Customer(Base):
     __tablename__ = "customers"
+    __table_args__ = (
+        # Keyset pagination of the customer list on (created_at, id).
+        Index("ix_customers_created_id", desc("created_at"), desc("id")),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -282,7 +288,11 @@ class SubscriptionItem(Base):
 
 class Invoice(Base):
     __tablename__ = "invoices"
-    __table_args__ = (UniqueConstraint("number", name="uq_invoices_number"),)
+    __table_args__ = (
+        UniqueConstraint("number", name="uq_invoices_number"),
+        # Keyset pagination of the invoice list on (created_at, id).
+        Index("ix_invoices_created_id", desc("created_at"), desc("id")),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -476,7 +486,11 @@ class UsageRecord(Base):
 
 class Coupon(Base):
     __tablename__ = "coupons"
-    __table_args__ = (UniqueConstraint("code", name="uq_coupons_code"),)
+    __table_args__ = (
+        UniqueConstraint("code", name="uq_coupons_code"),
+        # Keyset pagination of the coupon list on (created_at, id).
+        Index("ix_coupons_created_id", desc("created_at"), desc("id")),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -554,6 +568,8 @@ class Entitlement(Base):
             "feature_key",
             name="uq_entitlements_product_feature",
         ),
+        # Keyset pagination of the entitlement list on (created_at, id).
+        Index("ix_entitlements_created_id", desc("created_at"), desc("id")),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
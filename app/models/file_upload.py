@@ -13,6 +13,8 @@ from sqlalchemy import (
     Integer,
     String,
     Text,
+    desc,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
@@ -31,6 +33,14 @@ class FileUpload(Base):
     __table_args__ = (
         CheckConstraint("file_size > 0", name="ck_file_uploads_file_size_positive"),
         Index("ix_file_uploads_entity", "entity_type", "entity_id", "is_active"),
+        Index(
+            "ix_file_uploads_list",
+            "uploaded_by",
+            "category",
+            desc("created_at"),
+            postgresql_where=text("is_active AND status = 'active'"),
+            sqlite_where=text("is_active AND status = 'active'"),
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
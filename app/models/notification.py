@@ -2,7 +2,18 @@ import enum
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import JSON, Boolean, DateTime, Enum, ForeignKey, Index, String, Text
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+    desc,
+    text,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -22,6 +33,20 @@ class Notification(Base):
     __table_args__ = (
         Index("ix_notifications_recipient_read", "recipient_id", "is_read"),
         Index("ix_notifications_recipient_created", "recipient_id", "created_at"),
+        Index(
+            "ix_notifications_recipient_feed",
+            "recipient_id",
+            "is_read",
+            desc("created_at"),
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active"),
+        ),
+        Index(
+            "ix_notifications_recipient_unread",
+            "recipient_id",
+            postgresql_where=text("is_active AND NOT is_read"),
+            sqlite_where=text("is_active AND NOT is_read"),
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -78,7 +78,28 @@ class ApplicationStatus(str, enum.Enum):
 
 class School(Base):
     __tablename__ = "schools"
-    __table_args__ = (UniqueConstraint("slug", name="uq_schools_slug"),)
+    __table_args__ = (
+        UniqueConstraint("slug", name="uq_schools_slug"),
+        # Trigram GIN indexes (pg_trgm) serve the ILIKE '%term%' search filters.
+        Index(
+            "ix_schools_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_schools_state_trgm",
+            "state",
+            postgresql_using="gin",
+            postgresql_ops={"state": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_schools_city_trgm",
+            "city",
+            postgresql_using="gin",
+            postgresql_ops={"city": "gin_trgm_ops"},
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -11,3 +11,4 @@ class ListResponse(BaseModel, Generic[T]):
     limit: int
     offset: int
     total: int
+    next_cursor: str | None = None
@@ -4,7 +4,7 @@ from datetime import UTC, datetime
 from typing import cast
 
 from fastapi import Depends, Header, HTTPException, Request
-from sqlalchemy import select
+from sqlalchemy import and_, exists, select
 from sqlalchemy.orm import Session
 
 from app.db import SessionLocal
@@ -221,16 +221,22 @@ def require_role(role_name: str):
         roles = set(auth.get("roles") or [])
         if role_name in roles:
             return auth
-        stmt = select(Role).where(Role.name == role_name, Role.is_active.is_(True))
-        role = db.scalar(stmt)
-        if not role:
-            raise HTTPException(status_code=403, detail="Role not found")
-        link_stmt = select(PersonRole).where(
-            PersonRole.person_id == person_id,
-            PersonRole.role_id == role.id,
+        # Resolve the role and the person's membership in one round trip.
+        stmt = (
+            select(Role.id, PersonRole.id)
+            .outerjoin(
+                PersonRole,
+                and_(
+                    PersonRole.role_id == Role.id,
+                    PersonRole.person_id == person_id,
+                ),
+            )
+            .where(Role.name == role_name, Role.is_active.is_(True))
         )
-        link = db.scalar(link_stmt)
-        if not link:
+        row = db.execute(stmt).first()
+        if row is None:
+            raise HTTPException(status_code=403, detail="Role not found")
+        if row[1] is None:
             raise HTTPException(status_code=403, detail="Forbidden")
         return auth
 
@@ -256,24 +262,26 @@ def require_permission(permission_key: str):
         if cached is False:
             raise HTTPException(status_code=403, detail="Forbidden")
 
-        # Cache miss — query DB
-        stmt = select(Permission).where(
-            Permission.key == permission_key, Permission.is_active.is_(True)
-        )
-        permission = db.scalar(stmt)
-        if not permission:
-            raise HTTPException(status_code=403, detail="Permission not found")
-        has_perm_stmt = (
-            select(RolePermission)
-            .join(Role, RolePermission.role_id == Role.id)
-            .join(PersonRole, PersonRole.role_id == Role.id)
+        # Cache miss — resolve the permission and the person's grant in one
+        # round trip instead of walking person -> roles -> permissions.
+        granted = (
+            exists()
             .where(
+                RolePermission.permission_id == Permission.id,
+                RolePermission.role_id == Role.id,
+                PersonRole.role_id == Role.id,
                 PersonRole.person_id == person_id,
-                RolePermission.permission_id == permission.id,
                 Role.is_active.is_(True),
             )
+            .correlate(Permission)
+        )
+        stmt = select(Permission.id, granted).where(
+            Permission.key == permission_key, Permission.is_active.is_(True)
         )
-        has_permission = db.scalar(has_perm_stmt)
+        row = db.execute(stmt).first()
+        if row is None:
+            raise HTTPException(status_code=403, detail="Permission not found")
+        has_permission = row[1]
         _set_cached_permission(str(person_id), permission_key, bool(has_permission))
         if not has_permission:
             raise HTTPException(status_code=403, detail="Forbidden")
@@ -4,6 +4,7 @@ import hashlib
 import logging
 import os
 import secrets
+from collections.abc import Iterable, Mapping
 from datetime import UTC, datetime, timedelta
 from typing import Any, NoReturn, cast
 
@@ -92,7 +93,21 @@ def _truncate_user_agent(value: str | None, max_len: int = 512) -> str | None:
     return value[:max_len]
 
 
-def _setting_value(db: Session | None, key: str) -> str | None:
+def _stored_value(setting: DomainSetting | None) -> str | None:
+    if not setting:
+        return None
+    if setting.value_text:
+        return setting.value_text
+    if setting.value_json is not None:
+        return str(setting.value_json)
+    return None
+
+
+def _setting_value(
+    db: Session | None, key: str, prefetched: Mapping[str, str | None] | None = None
+) -> str | None:
+    if prefetched is not None:
+        return prefetched.get(key)
     if db is None:
         return None
     setting = db.scalar(
@@ -102,13 +117,20 @@ def _setting_value(db: Session | None, key: str) -> str | None:
         .where(DomainSetting.is_active.is_(True))
         .limit(1)
     )
-    if not setting:
-        return None
-    if setting.value_text:
-        return setting.value_text
-    if setting.value_json is not None:
-        return str(setting.value_json)
-    return None
+    return _stored_value(setting)
+
+
+def _setting_values(db: Session | None, keys: Iterable[str]) -> dict[str, str | None]:
+    """Load several auth settings in one query, keyed like ``_setting_value``."""
+    if db is None:
+        return {}
+    settings = db.scalars(
+        select(DomainSetting)
+        .where(DomainSetting.domain == SettingDomain.auth)
+        .where(DomainSetting.key.in_(list(keys)))
+        .where(DomainSetting.is_active.is_(True))
+    )
+    return {setting.key: _stored_value(setting) for setting in settings}
 
 
 def _jwt_secret(db: Session | None) -> str:
@@ -136,11 +158,13 @@ def _access_ttl_minutes(db: Session | None) -> int:
     return 15
 
 
-def _refresh_ttl_days(db: Session | None) -> int:
+def _refresh_ttl_days(
+    db: Session | None, prefetched: Mapping[str, str | None] | None = None
+) -> int:
     env_value = _env_int("JWT_REFRESH_TTL_DAYS")
     if env_value is not None:
         return env_value
-    value = _setting_value(db, "jwt_refresh_ttl_days")
+    value = _setting_value(db, "jwt_refresh_ttl_days", prefetched)
     if value is not None:
         try:
             return int(value)
@@ -153,46 +177,66 @@ def _totp_issuer(db: Session | None) -> str:
     return _env_value("TOTP_ISSUER") or _setting_value(db, "totp_issuer") or "schoolnet"
 
 
-def _refresh_cookie_name(db: Session | None) -> str:
+def _refresh_cookie_name(
+    db: Session | None, prefetched: Mapping[str, str | None] | None = None
+) -> str:
     return (
         _env_value("REFRESH_COOKIE_NAME")
-        or _setting_value(db, "refresh_cookie_name")
+        or _setting_value(db, "refresh_cookie_name", prefetched)
         or "refresh_token"
     )
 
 
-def _refresh_cookie_secure(db: Session | None) -> bool:
+def _refresh_cookie_secure(
+    db: Session | None, prefetched: Mapping[str, str | None] | None = None
+) -> bool:
     env_value = _env_value("REFRESH_COOKIE_SECURE")
     if env_value is not None:
         return env_value.lower() in {"1", "true", "yes", "on"}
-    value = _setting_value(db, "refresh_cookie_secure")
+    value = _setting_value(db, "refresh_cookie_secure", prefetched)
     if value is not None:
         return str(value).lower() in {"1", "true", "yes", "on"}
     return False
 
 
-def _refresh_cookie_samesite(db: Session | None) -> str:
+def _refresh_cookie_samesite(
+    db: Session | None, prefetched: Mapping[str, str | None] | None = None
+) -> str:
     return (
         _env_value("REFRESH_COOKIE_SAMESITE")
-        or _setting_value(db, "refresh_cookie_samesite")
+        or _setting_value(db, "refresh_cookie_samesite", prefetched)
         or "lax"
     )
 
 
-def _refresh_cookie_domain(db: Session | None) -> str | None:
+def _refresh_cookie_domain(
+    db: Session | None, prefetched: Mapping[str, str | None] | None = None
+) -> str | None:
     return _env_value("REFRESH_COOKIE_DOMAIN") or _setting_value(
-        db, "refresh_cookie_domain"
+        db, "refresh_cookie_domain", prefetched
     )
 
 
-def _refresh_cookie_path(db: Session | None) -> str:
+def _refresh_cookie_path(
+    db: Session | None, prefetched: Mapping[str, str | None] | None = None
+) -> str:
     return (
         _env_value("REFRESH_COOKIE_PATH")
-        or _setting_value(db, "refresh_cookie_path")
+        or _setting_value(db, "refresh_cookie_path", prefetched)
         or "/"
     )
 
 
+_REFRESH_COOKIE_SETTING_KEYS = (
+    "refresh_cookie_name",
+    "refresh_cookie_secure",
+    "refresh_cookie_samesite",
+    "refresh_cookie_domain",
+    "refresh_cookie_path",
+    "jwt_refresh_ttl_days",
+)
+
+
 def _mfa_key(db: Session | None) -> bytes:
     key = _env_value("TOTP_ENCRYPTION_KEY") or _setting_value(db, "totp_encryption_key")
     key = resolve_secret(key)
@@ -797,14 +841,16 @@ class AuthFlow(ListResponseMixin):
 
     @staticmethod
     def refresh_cookie_settings(db: Session | None = None):
+        # One query for all six settings instead of one per helper.
+        stored = _setting_values(db, _REFRESH_COOKIE_SETTING_KEYS)
         return {
-            "key": _refresh_cookie_name(db),
+            "key": _refresh_cookie_name(db, stored),
             "httponly": True,
-            "secure": _refresh_cookie_secure(db),
-            "samesite": _refresh_cookie_samesite(db),
-            "domain": _refresh_cookie_domain(db),
-            "path": _refresh_cookie_path(db),
-            "max_age": _refresh_ttl_days(db) * 24 * 60 * 60,
+            "secure": _refresh_cookie_secure(db, stored),
+            "samesite": _refresh_cookie_samesite(db, stored),
+            "domain": _refresh_cookie_domain(db, stored),
+            "path": _refresh_cookie_path(db, stored),
+            "max_age": _refresh_ttl_days(db, stored) * 24 * 60 * 60,
         }
 
     @staticmethod
@@ -1,8 +1,8 @@
 import logging
 from enum import Enum
 
-from sqlalchemy import func, select
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.orm import Session, joinedload
 
 from app.models.billing import (
     Coupon,
@@ -54,7 +54,14 @@ from app.schemas.billing import (
     WebhookEventCreate,
     WebhookEventUpdate,
 )
-from app.services.common import coerce_uuid, escape_like
+from app.services.billing_options import invalidate_product_options
+from app.services.common import (
+    coerce_uuid,
+    escape_like,
+    fetch_with_total,
+    keyset_page,
+    run_after_commit,
+)
 from app.services.response import ListResponseMixin
 
 logger = logging.getLogger(__name__)
@@ -153,6 +160,7 @@ class Products(ListResponseMixin):
         item = Product(**payload.model_dump())
         db.add(item)
         db.flush()
+        run_after_commit(db, invalidate_product_options, on_rollback=True)
         db.refresh(item)
         logger.info("Created Product: %s", item.id)
         return item
@@ -176,12 +184,8 @@ class Products(ListResponseMixin):
         stmt = select(Product)
         if is_active is not None:
             stmt = stmt.where(Product.is_active == is_active)
-        count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
-        total = db.scalar(count_stmt) or 0
-        stmt = Products._apply_ordering(stmt, order_by, order_dir)
-        stmt = stmt.limit(limit).offset(offset)
-        items = list(db.scalars(stmt).all())
-        return items, total
+        page = Products._apply_ordering(stmt, order_by, order_dir)
+        return fetch_with_total(db, stmt, page.limit(limit).offset(offset))
 
     @staticmethod
     def update(db: Session, item_id: str, payload: ProductUpdate) -> Product:
@@ -191,6 +195,7 @@ class Products(ListResponseMixin):
         for key, value in payload.model_dump(exclude_unset=True).items():
             setattr(item, key, value)
         db.flush()
+        run_after_commit(db, invalidate_product_options, on_rollback=True)
         db.refresh(item)
         logger.info("Updated %s: %s", Product.__name__, item.id)
         return item
@@ -202,6 +207,7 @@ class Products(ListResponseMixin):
             raise ProductNotFoundError("Product not found")
         item.is_active = False
         db.flush()
+        run_after_commit(db, invalidate_product_options, on_rollback=True)
         db.refresh(item)
         logger.info("Soft-deleted %s: %s", Product.__name__, item.id)
 
@@ -264,12 +270,8 @@ class Prices(ListResponseMixin):
             stmt = stmt.where(Price.currency == currency)
         if is_active is not None:
             stmt = stmt.where(Price.is_active == is_active)
-        count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
-        total = db.scalar(count_stmt) or 0
-        stmt = Prices._apply_ordering(stmt, order_by, order_dir)
-        stmt = stmt.limit(limit).offset(offset)
-        items = list(db.scalars(stmt).all())
-        return items, total
+        page = Prices._apply_ordering(stmt, order_by, order_dir)
+        return fetch_with_total(db, stmt, page.limit(limit).offset(offset))
 
     @staticmethod
     def update(db: Session, item_id: str, payload: PriceUpdate) -> Price:
@@ -339,7 +341,8 @@ class Customers(ListResponseMixin):
         order_dir: str,
         limit: int,
         offset: int,
-    ) -> tuple[list[Customer], int]:
+        cursor: str | None = None,
+    ) -> tuple[list[Customer], int, str | None]:
         stmt = select(Customer)
         if person_id:
             stmt = stmt.where(Customer.person_id == coerce_uuid(person_id))
@@ -347,12 +350,23 @@ class Customers(ListResponseMixin):
             stmt = stmt.where(Customer.email.ilike(f"%{escape_like(email)}%"))
         if is_active is not None:
             stmt = stmt.where(Customer.is_active == is_active)
-        count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
-        total = db.scalar(count_stmt) or 0
-        stmt = Customers._apply_ordering(stmt, order_by, order_dir)
-        stmt = stmt.limit(limit).offset(offset)
-        items = list(db.scalars(stmt).all())
-        return items, total
+        if order_by == "created_at":
+            return keyset_page(
+                db,
+                stmt,
+                Customer.created_at,
+                Customer.id,
+                limit=limit,
+                offset=offset,
+                cursor=cursor,
+                descending=order_dir == "desc",
+            )
+        if cursor:
+            raise ValueError("cursor pagination requires order_by=created_at")
+
+        page = Customers._apply_ordering(stmt, order_by, order_dir)
+        items, total = fetch_with_total(db, stmt, page.limit(limit).offset(offset))
+        return items, total, None
 
     @staticmethod
     def update(db: Session, item_id: str, payload: CustomerUpdate) -> Customer:
@@ -448,7 +462,8 @@ class Subscriptions(ListResponseMixin):
         limit: int,
         offset: int,
     ) -> tuple[list[Subscription], int]:
-        stmt = select(Subscription)
+        # The admin list shows each row's customer; load it with the page.
+        stmt = select(Subscription).options(joinedload(Subscription.customer))
         if customer_id:
             stmt = stmt.where(Subscription.customer_id == coerce_uuid(customer_id))
         if status:
@@ -457,12 +472,8 @@ class Subscriptions(ListResponseMixin):
             )
         if is_active is not None:
             stmt = stmt.where(Subscription.is_active == is_active)
-        count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
-        total = db.scalar(count_stmt) or 0
-        stmt = Subscriptions._apply_ordering(stmt, order_by, order_dir)
-        stmt = stmt.limit(limit).offset(offset)
-        items = list(db.scalars(stmt).all())
-        return items, total
+        page = Subscriptions._apply_ordering(stmt, order_by, order_dir)
+        return fetch_with_total(db, stmt, page.limit(limit).offset(offset))
 
     @staticmethod
     def update(db: Session, item_id: str, payload: SubscriptionUpdate) -> Subscription:
@@ -566,12 +577,8 @@ class SubscriptionItems(ListResponseMixin):
             )
         if price_id:
             stmt = stmt.where(SubscriptionItem.price_id == coerce_uuid(price_id))
-        count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
-        total = db.scalar(count_stmt) or 0
-        stmt = SubscriptionItems._apply_ordering(stmt, order_by, order_dir)
-        stmt = stmt.limit(limit).offset(offset)
-        items = list(db.scalars(stmt).all())
-        return items, total
+        page = SubscriptionItems._apply_ordering(stmt, order_by, order_dir)
+        return fetch_with_total(db, stmt, page.limit(limit).offset(offset))
 
     @staticmethod
     def update(
@@ -639,6 +646,26 @@ class Invoices(ListResponseMixin):
             raise InvoiceNotFoundError("Invoice not found")
         return item
 
+    @staticmethod
+    def get_with_relations(db: Session, item_id: str) -> Invoice:
+        """Load an invoice with its customer and subscription joined in.
+
+        Line items and payment intents are unbounded, so callers page them
+        through ``invoice_items.list`` / ``payment_intents.list`` instead.
+        """
+        stmt = (
+            select(Invoice)
+            .options(
+                joinedload(Invoice.customer),
+                joinedload(Invoice.subscription),
+            )
+            .where(Invoice.id == coerce_uuid(item_id))
+        )
+        item = db.scalars(stmt).first()
+        if not item:
+            raise InvoiceNotFoundError("Invoice not found")
+        return item
+
     @staticmethod
     def list(
         db: Session,
@@ -649,8 +676,10 @@ class Invoices(ListResponseMixin):
         order_dir: str,
         limit: int,
         offset: int,
-    ) -> tuple[list[Invoice], int]:
-        stmt = select(Invoice)
+        cursor: str | None = None,
+    ) -> tuple[list[Invoice], int, str | None]:
+        # The admin list shows each row's customer; load it with the page.
+        stmt = select(Invoice).options(joinedload(Invoice.customer))
         if customer_id:
             stmt = stmt.where(Invoice.customer_id == coerce_uuid(customer_id))
         if subscription_id:
@@ -659,12 +688,23 @@ class Invoices(ListResponseMixin):
             stmt = stmt.where(
                 Invoice.status == _parse_enum(status, InvoiceStatus, "status")
             )
-        count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
-        total = db.scalar(count_stmt) or 0
-        stmt = Invoices._apply_ordering(stmt, order_by, order_dir)
-        stmt = stmt.limit(limit).offset(offset)
-        items = list(db.scalars(stmt).all())
-        return items, total
+        if order_by == "created_at":
+            return keyset_page(
+                db,
+                stmt,
+                Invoice.created_at,
+                Invoice.id,
+                limit=limit,
+                offset=offset,
+                cursor=cursor,
+                descending=order_dir == "desc",
+            )
+        if cursor:
+            raise ValueError("cursor pagination requires order_by=created_at")
+
+        page = Invoices._apply_ordering(stmt, order_by, order_dir)
+        items, total = fetch_with_total(db, stmt, page.limit(limit).offset(offset))
+        return items, total, None
 
     @staticmethod
     def update(db: Session, item_id: str, payload: InvoiceUpdate) -> Invoice:
@@ -770,12 +810,8 @@ class InvoiceItems(ListResponseMixin):
         stmt = select(InvoiceItem)
         if invoice_id:
             stmt = stmt.where(InvoiceItem.invoice_id == coerce_uuid(invoice_id))
-        count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
-        total = db.scalar(count_stmt) or 0
-        stmt = InvoiceItems._apply_ordering(stmt, order_by, order_dir)
-        stmt = stmt.limit(limit).offset(offset)
-        items = list(db.scalars(stmt).all())
-        return items, total
+        page = InvoiceItems._apply_ordering(stmt, order_by, order_dir)
+        return fetch_with_total(db, stmt, page.limit(limit).offset(offset))
 
     @staticmethod
     def update(db: Session, item_id: str, payload: InvoiceItemUpdate) -> InvoiceItem:
@@ -846,7 +882,8 @@ class PaymentMethods(ListResponseMixin):
         limit: int,
         offset: int,
     ) -> tuple[list[PaymentMethod], int]:
-        stmt = select(PaymentMethod)
+        # The admin list shows each row's customer; load it with the page.
+        stmt = select(PaymentMethod).options(joinedload(PaymentMethod.customer))
         if customer_id:
             stmt = stmt.where(PaymentMethod.customer_id == coerce_uuid(customer_id))
         if type:
@@ -855,12 +892,8 @@ class PaymentMethods(ListResponseMixin):
             )
         if is_active is not None:
             stmt = stmt.where(PaymentMethod.is_active == is_active)
-        count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
-        total = db.scalar(count_stmt) or 0
-        stmt = PaymentMethods._apply_ordering(stmt, order_by, order_dir)
-        stmt = stmt.limit(limit).offset(offset)
-        items = list(db.scalars(stmt).all())
-        return items, total
+        page = PaymentMethods._apply_ordering(stmt, order_by, order_dir)
+        return fetch_with_total(db, stmt, page.limit(limit).offset(offset))
 
     @staticmethod
     def update(
@@ -950,12 +983,8 @@ class PaymentIntents(ListResponseMixin):
                 PaymentIntent.status
                 == _parse_enum(status, PaymentIntentStatus, "status")
             )
-        count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
-        total = db.scalar(count_stmt) or 0
-        stmt = PaymentIntents._apply_ordering(stmt, order_by, order_dir)
-        stmt = stmt.limit(limit).offset(offset)
-        items = list(db.scalars(stmt).all())
-        return items, total
+        page = PaymentIntents._apply_ordering(stmt, order_by, order_dir)
+        return fetch_with_total(db, stmt, page.limit(limit).offset(offset))
 
     @staticmethod
     def update(
@@ -1023,12 +1052,8 @@ class UsageRecords(ListResponseMixin):
             stmt = stmt.where(
                 UsageRecord.subscription_item_id == coerce_uuid(subscription_item_id)
             )
-        count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
-        total = db.scalar(count_stmt) or 0
-        stmt = UsageRecords._apply_ordering(stmt, order_by, order_dir)
-        stmt = stmt.limit(limit).offset(offset)
-        items = list(db.scalars(stmt).all())
-        return items, total
+        page = UsageRecords._apply_ordering(stmt, order_by, order_dir)
+        return fetch_with_total(db, stmt, page.limit(limit).offset(offset))
 
 
 # ── Coupons ──────────────────────────────────────────────
@@ -1075,18 +1100,30 @@ class Coupons(ListResponseMixin):
         order_dir: str,
         limit: int,
         offset: int,
-    ) -> tuple[list[Coupon], int]:
+        cursor: str | None = None,
+    ) -> tuple[list[Coupon], int, str | None]:
         stmt = select(Coupon)
         if valid is not None:
             stmt = stmt.where(Coupon.valid == valid)
         if code:
             stmt = stmt.where(Coupon.code == code)
-        count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
-        total = db.scalar(count_stmt) or 0
-        stmt = Coupons._apply_ordering(stmt, order_by, order_dir)
-        stmt = stmt.limit(limit).offset(offset)
-        items = list(db.scalars(stmt).all())
-        return items, total
+        if order_by == "created_at":
+            return keyset_page(
+                db,
+                stmt,
+                Coupon.created_at,
+                Coupon.id,
+                limit=limit,
+                offset=offset,
+                cursor=cursor,
+                descending=order_dir == "desc",
+            )
+        if cursor:
+            raise ValueError("cursor pagination requires order_by=created_at")
+
+        page = Coupons._apply_ordering(stmt, order_by, order_dir)
+        items, total = fetch_with_total(db, stmt, page.limit(limit).offset(offset))
+        return items, total, None
 
     @staticmethod
     def update(db: Session, item_id: str, payload: CouponUpdate) -> Coupon:
@@ -1191,12 +1228,8 @@ class Discounts(ListResponseMixin):
             stmt = stmt.where(Discount.subscription_id == coerce_uuid(subscription_id))
         if coupon_id:
             stmt = stmt.where(Discount.coupon_id == coerce_uuid(coupon_id))
-        count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
-        total = db.scalar(count_stmt) or 0
-        stmt = Discounts._apply_ordering(stmt, order_by, order_dir)
-        stmt = stmt.limit(limit).offset(offset)
-        items = list(db.scalars(stmt).all())
-        return items, total
+        page = Discounts._apply_ordering(stmt, order_by, order_dir)
+        return fetch_with_total(db, stmt, page.limit(limit).offset(offset))
 
     @staticmethod
     def delete(db: Session, item_id: str) -> None:
@@ -1253,18 +1286,30 @@ class Entitlements(ListResponseMixin):
         order_dir: str,
         limit: int,
         offset: int,
-    ) -> tuple[list[Entitlement], int]:
+        cursor: str | None = None,
+    ) -> tuple[list[Entitlement], int, str | None]:
         stmt = select(Entitlement)
         if product_id:
             stmt = stmt.where(Entitlement.product_id == coerce_uuid(product_id))
         if feature_key:
             stmt = stmt.where(Entitlement.feature_key == feature_key)
-        count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
-        total = db.scalar(count_stmt) or 0
-        stmt = Entitlements._apply_ordering(stmt, order_by, order_dir)
-        stmt = stmt.limit(limit).offset(offset)
-        items = list(db.scalars(stmt).all())
-        return items, total
+        if order_by == "created_at":
+            return keyset_page(
+                db,
+                stmt,
+                Entitlement.created_at,
+                Entitlement.id,
+                limit=limit,
+                offset=offset,
+                cursor=cursor,
+                descending=order_dir == "desc",
+            )
+        if cursor:
+            raise ValueError("cursor pagination requires order_by=created_at")
+
+        page = Entitlements._apply_ordering(stmt, order_by, order_dir)
+        items, total = fetch_with_total(db, stmt, page.limit(limit).offset(offset))
+        return items, total, None
 
     @staticmethod
     def update(db: Session, item_id: str, payload: EntitlementUpdate) -> Entitlement:
@@ -1342,12 +1387,8 @@ class WebhookEvents(ListResponseMixin):
             stmt = stmt.where(
                 WebhookEvent.status == _parse_enum(status, WebhookEventStatus, "status")
             )
-        count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
-        total = db.scalar(count_stmt) or 0
-        stmt = WebhookEvents._apply_ordering(stmt, order_by, order_dir)
-        stmt = stmt.limit(limit).offset(offset)
-        items = list(db.scalars(stmt).all())
-        return items, total
+        page = WebhookEvents._apply_ordering(stmt, order_by, order_dir)
+        return fetch_with_total(db, stmt, page.limit(limit).offset(offset))
 
     @staticmethod
     def update(db: Session, item_id: str, payload: WebhookEventUpdate) -> WebhookEvent:
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import threading
+
+from cachetools import TTLCache
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.billing import Product
+
+# Product <select> options for the price and entitlement forms. Products are
+# rarely edited, so the options are shared for up to 30 s; the product
+# service clears them on every write. Entries are plain dicts, not ORM rows,
+# so they are safe to reuse across sessions.
+_OPTIONS_LIMIT = 500
+_options_cache: TTLCache[bool, list[dict[str, str]]] = TTLCache(maxsize=2, ttl=30)
+_options_cache_lock = threading.Lock()
+
+
+def invalidate_product_options() -> None:
+    with _options_cache_lock:
+        _options_cache.clear()
+
+
+def product_options(db: Session, *, active_only: bool = False) -> list[dict[str, str]]:
+    """Return ``{"value", "label"}`` options for products, ordered by name."""
+    with _options_cache_lock:
+        options = _options_cache.get(active_only)
+    if options is None:
+        stmt = select(Product.id, Product.name).order_by(Product.name.asc())
+        if active_only:
+            stmt = stmt.where(Product.is_active.is_(True))
+        options = [
+            {"value": str(row.id), "label": row.name}
+            for row in db.execute(stmt.limit(_OPTIONS_LIMIT))
+        ]
+        with _options_cache_lock:
+            _options_cache[active_only] = options
+    return options
@@ -9,6 +9,7 @@ from sqlalchemy.orm import Session
 
 from app.config import settings
 from app.models.domain_settings import DomainSetting, SettingDomain, SettingValueType
+from app.services.common import run_after_commit
 
 _SETTING_KEY = "ui_branding"
 _HEX_COLOR = re.compile(r"^#[0-9A-Fa-f]{6}$")
@@ -146,6 +147,12 @@ def save_branding(db: Session, payload: dict[str, Any]) -> dict[str, Any]:
         setting.is_active = True
 
     db.flush()
+    # branding_context imports this module, so resolve the hook lazily.
+    from app.services.branding_context import invalidate_branding_context
+
+    # Clearing before the commit would let a concurrent render re-cache the
+    # old committed row for another 30 s.
+    run_after_commit(db, invalidate_branding_context, on_rollback=True)
     return current
 
 
@@ -1,12 +1,20 @@
 from __future__ import annotations
 
+import threading
 from typing import Any
 
+from cachetools import TTLCache
 from sqlalchemy.orm import Session
 
 from app.config import settings
 from app.services.branding import generate_css, get_branding, google_fonts_url
 
+# Branding is global and rarely edited, so every page render shares one
+# context for up to 30 s; save_branding() clears it once the save commits.
+_CONTEXT_KEY = "branding"
+_context_cache: TTLCache[str, dict[str, Any]] = TTLCache(maxsize=1, ttl=30)
+_context_cache_lock = threading.Lock()
+
 
 def _brand_mark(name: str) -> str:
     parts = [part for part in name.split() if part]
@@ -35,5 +43,16 @@ def branding_context_from_values(branding: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+def invalidate_branding_context() -> None:
+    with _context_cache_lock:
+        _context_cache.clear()
+
+
 def load_branding_context(db: Session) -> dict[str, Any]:
-    return branding_context_from_values(get_branding(db))
+    with _context_cache_lock:
+        context = _context_cache.get(_CONTEXT_KEY)
+    if context is None:
+        context = branding_context_from_values(get_branding(db))
+        with _context_cache_lock:
+            _context_cache[_CONTEXT_KEY] = context
+    return context
@@ -1,20 +1,48 @@
-"""Shared service utilities: UUID coercion, ordering, pagination."""
+"""Shared service utilities: UUID coercion, ordering, pagination, commit hooks."""
 
 from __future__ import annotations
 
+import base64
+import binascii
 import math
 import uuid
+from collections.abc import Callable, Sequence
+from datetime import datetime
+from functools import lru_cache
 from typing import Any, TypeVar
 
-from sqlalchemy import Select, func, select
+from sqlalchemy import Select, event, func, select, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 
 T = TypeVar("T")
 
 
 def escape_like(value: str) -> str:
-    """Escape SQL LIKE wildcard characters."""
-    return value.replace("%", "\\%").replace("_", "\\_")
+    """Escape SQL LIKE wildcard characters (and the ``\\`` escape itself)."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def contains_pattern(value: str | None, min_length: int = 2) -> str | None:
+    """Return an escaped ``%value%`` pattern, or None for too-short input.
+
+    Use with ``escape="\\"``. Terms shorter than ``min_length`` after trimming
+    match nearly every row and cannot use a trigram index, so callers skip the
+    filter instead.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if len(value) < min_length:
+        return None
+    return f"%{escape_like(value)}%"
+
+
+@lru_cache(maxsize=1024)
+def _parse_uuid(value: str) -> uuid.UUID:
+    # The same ids are parsed several times per request (path param, lookups,
+    # link validation); memoize the hex parsing.
+    return uuid.UUID(hex=value)
 
 
 def coerce_uuid(value: Any) -> uuid.UUID | None:
@@ -24,7 +52,7 @@ def coerce_uuid(value: Any) -> uuid.UUID | None:
     if isinstance(value, uuid.UUID):
         return value
     try:
-        return uuid.UUID(str(value))
+        return _parse_uuid(value if isinstance(value, str) else str(value))
     except (AttributeError, TypeError, ValueError):
         return None
 
@@ -37,6 +65,16 @@ def require_uuid(value: Any) -> uuid.UUID:
     return result
 
 
+def dialect_insert(db: Session, model: Any) -> Any:
+    """Return an INSERT for ``model`` that supports ``on_conflict_*`` clauses.
+
+    PostgreSQL in production, SQLite in tests; both share the same API.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql.insert(model)
+    return sqlite.insert(model)
+
+
 def apply_ordering(
     query: Select[Any],
     order_by: str,
@@ -59,6 +97,166 @@ def apply_pagination(query: Select[Any], limit: int, offset: int) -> Select[Any]
     return query.limit(limit).offset(offset)
 
 
+# Keyset position: the sort column value of the last row seen, plus its id
+# as a tie-breaker. Sort values are timestamps or (for link tables) UUIDs.
+Cursor = tuple[datetime | uuid.UUID, uuid.UUID]
+
+
+def encode_cursor(cursor: Cursor) -> str:
+    """Encode a ``(sort_value, id)`` keyset position as an opaque token."""
+    value, row_id = cursor
+    if isinstance(value, datetime):
+        raw = f"t|{value.isoformat()}|{row_id}"
+    else:
+        raw = f"u|{value}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> Cursor:
+    """Decode a token produced by :func:`encode_cursor`."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        kind, value, row_id = base64.urlsafe_b64decode(padded).decode().split("|")
+        if kind == "t":
+            return datetime.fromisoformat(value), uuid.UUID(row_id)
+        if kind == "u":
+            return uuid.UUID(value), uuid.UUID(row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise ValueError("Invalid cursor") from exc
+    raise ValueError("Invalid cursor")
+
+
+def valid_cursor(cursor: str | None) -> str | None:
+    """Return ``cursor`` if it decodes, else None (for lenient web pagination)."""
+    if not cursor:
+        return None
+    try:
+        decode_cursor(cursor)
+    except ValueError:
+        return None
+    return cursor
+
+
+def apply_keyset(
+    query: Select[Any],
+    sort_column: Any,
+    id_column: Any,
+    limit: int,
+    *,
+    cursor: Cursor | None = None,
+    offset: int = 0,
+    descending: bool = True,
+) -> Select[Any]:
+    """Order on ``(sort_column, id)`` and page by cursor or offset.
+
+    With a cursor the page starts strictly after that position, so deep pages
+    cost the same as the first one; ``offset`` is only used without a cursor.
+    """
+    if descending:
+        query = query.order_by(sort_column.desc(), id_column.desc())
+    else:
+        query = query.order_by(sort_column.asc(), id_column.asc())
+    query = query.limit(limit)
+    if cursor is None:
+        return query.offset(offset)
+    position = tuple_(sort_column, id_column)
+    return query.where(position < cursor if descending else position > cursor)
+
+
+def next_cursor(
+    items: Sequence[Any], limit: int, sort_attr: str = "created_at"
+) -> Cursor | None:
+    """Return the keyset position after ``items`` if another page may exist."""
+    if not items or len(items) < limit:
+        return None
+    last = items[-1]
+    return getattr(last, sort_attr), last.id
+
+
+def count_rows(db: Session, query: Select[Any]) -> int:
+    """Count the rows ``query`` matches, ignoring its ordering.
+
+    A plain filtered select is counted as ``SELECT count(*) FROM … WHERE …``
+    so the planner can answer from an index on the filter columns. DISTINCT,
+    GROUP BY and LIMIT change what a row is, so those keep the subquery.
+    """
+    if (
+        query._distinct
+        or query._group_by_clauses
+        or query._limit_clause is not None
+        or query._offset_clause is not None
+    ):
+        count_query = select(func.count()).select_from(query.order_by(None).subquery())
+    else:
+        count_query = query.with_only_columns(
+            func.count(), maintain_column_froms=True
+        ).order_by(None)
+    return db.scalar(count_query) or 0
+
+
+def fetch_with_total(
+    db: Session,
+    query: Select[Any],
+    page: Select[Any],
+    *,
+    rows: bool = False,
+) -> tuple[list[Any], int]:
+    """Run ``page`` (``query`` plus ordering and LIMIT/OFFSET) and count ``query``.
+
+    The total rides along on each row as ``count(*) OVER ()``, which is
+    evaluated before LIMIT/OFFSET, so a separate COUNT query is only needed
+    when a page past the first comes back empty. With ``rows=True`` the
+    ``Row`` items keep the extra ``total_count`` column.
+    """
+    result = db.execute(
+        page.add_columns(func.count().over().label("total_count"))
+    ).all()
+    if not result:
+        # An empty first page means nothing matched at all.
+        return [], count_rows(db, query) if page._offset else 0
+    total = result[0].total_count
+    return (list(result) if rows else [row[0] for row in result]), total
+
+
+def keyset_page(
+    db: Session,
+    query: Select[Any],
+    sort_column: Any,
+    id_column: Any,
+    *,
+    limit: int,
+    offset: int = 0,
+    cursor: str | None = None,
+    descending: bool = True,
+    rows: bool = False,
+) -> tuple[list[Any], int, str | None]:
+    """Fetch one keyset page and return ``(items, total, next_cursor_token)``.
+
+    With ``rows=True`` the statement selects plain columns and items are
+    ``Row`` tuples rather than ORM entities.
+    Raises ValueError if ``cursor`` is not a valid token.
+    """
+    position = decode_cursor(cursor) if cursor else None
+    page = apply_keyset(
+        query,
+        sort_column,
+        id_column,
+        limit,
+        cursor=position,
+        offset=offset,
+        descending=descending,
+    )
+    if position is None:
+        items, total = fetch_with_total(db, query, page, rows=rows)
+    else:
+        # The cursor predicate narrows the page query, so a window count
+        # would only cover rows after the cursor.
+        items = list(db.execute(page).all() if rows else db.scalars(page).all())
+        total = count_rows(db, query)
+    following = next_cursor(items, limit, sort_column.key)
+    return items, total, encode_cursor(following) if following else None
+
+
 def validate_enum(value: Any, enum_cls: Any, label: str) -> Any:
     """Coerce a value to enum type or raise ValueError."""
     if value is None:
@@ -106,3 +304,46 @@ def paginate(
         "page_size": page_size,
         "pages": math.ceil(total / page_size) if page_size else 0,
     }
+
+
+_AFTER_COMMIT_KEY = "after_commit_callbacks"
+
+
+def run_after_commit(
+    db: Session, callback: Callable[[], None], *, on_rollback: bool = False
+) -> None:
+    """Run ``callback`` once the session's current transaction commits.
+
+    Services flush and the caller commits, so side effects that other
+    processes observe (queued tasks, shared cache invalidation) must wait for
+    the commit or they can act on the previously committed state. Callbacks
+    are dropped if the transaction rolls back, unless ``on_rollback`` is set:
+    cache invalidation wants that, since the writer's own session may have
+    filled the cache with the uncommitted values.
+    """
+    callbacks = db.info.get(_AFTER_COMMIT_KEY)
+    if callbacks is None:
+        callbacks = db.info[_AFTER_COMMIT_KEY] = []
+        event.listen(db, "after_commit", _run_after_commit_callbacks)
+        event.listen(db, "after_soft_rollback", _run_after_rollback_callbacks)
+    callbacks.append((callback, on_rollback))
+
+
+def _run_after_commit_callbacks(session: Session) -> None:
+    callbacks = session.info.get(_AFTER_COMMIT_KEY, [])
+    pending = list(callbacks)
+    callbacks.clear()
+    for callback, _on_rollback in pending:
+        callback()
+
+
+def _run_after_rollback_callbacks(session: Session, previous_transaction) -> None:
+    # Savepoint rollbacks leave the outer transaction (and its work) intact.
+    if previous_transaction.parent is not None:
+        return
+    callbacks = session.info.get(_AFTER_COMMIT_KEY, [])
+    pending = list(callbacks)
+    callbacks.clear()
+    for callback, on_rollback in pending:
+        if on_rollback:
+            callback()
@@ -6,7 +6,7 @@ from sqlalchemy.orm import Session
 
 from app.models.domain_settings import DomainSetting, SettingDomain, SettingValueType
 from app.schemas.settings import DomainSettingCreate, DomainSettingUpdate
-from app.services.common import coerce_uuid
+from app.services.common import coerce_uuid, dialect_insert, run_after_commit
 from app.services.response import ListResponseMixin
 
 logger = logging.getLogger(__name__)
@@ -24,6 +24,15 @@ class SettingDomainRequiredError(ValueError):
     pass
 
 
+def _invalidate_resolved(
+    db: Session, domain: SettingDomain, key: str | None = None
+) -> None:
+    # settings_spec imports this module, so resolve the hook lazily.
+    from app.services.settings_spec import invalidate_resolved
+
+    run_after_commit(db, lambda: invalidate_resolved(domain, key), on_rollback=True)
+
+
 class DomainSettings(ListResponseMixin):
     def __init__(self, domain: SettingDomain | None = None) -> None:
         self.domain = domain
@@ -59,6 +68,7 @@ class DomainSettings(ListResponseMixin):
         db.add(setting)
         db.flush()
         db.refresh(setting)
+        _invalidate_resolved(db, setting.domain, setting.key)
         return setting
 
     def get(self, db: Session, setting_id: str):
@@ -105,6 +115,7 @@ class DomainSettings(ListResponseMixin):
             setattr(setting, key, value)
         db.flush()
         db.refresh(setting)
+        _invalidate_resolved(db, setting.domain, setting.key)
         return setting
 
     def get_by_key(self, db: Session, key: str):
@@ -135,6 +146,7 @@ class DomainSettings(ListResponseMixin):
                 setattr(setting, field, value)
             db.flush()
             db.refresh(setting)
+            _invalidate_resolved(db, setting.domain, setting.key)
             return setting
         create_payload = DomainSettingCreate(
             domain=self.domain,
@@ -177,12 +189,35 @@ class DomainSettings(ListResponseMixin):
         )
         return self.create(db, payload)
 
+    def ensure_many(self, db: Session, rows: builtins.list[dict]) -> None:
+        """Insert any of ``rows`` whose key is missing, in one statement.
+
+        Each row takes the ``ensure_by_key`` arguments (``key``, ``value_type``,
+        ``value_text``, ``value_json``, ``is_secret``). Existing keys are left
+        untouched via ON CONFLICT (domain, key) DO NOTHING.
+        """
+        if not self.domain:
+            raise SettingDomainRequiredError("Setting domain is required")
+        if not rows:
+            return
+        values = [
+            DomainSettingCreate(domain=self.domain, is_active=True, **row).model_dump()
+            for row in rows
+        ]
+        db.execute(
+            dialect_insert(db, DomainSetting)
+            .values(values)
+            .on_conflict_do_nothing(index_elements=["domain", "key"])
+        )
+        _invalidate_resolved(db, self.domain)
+
     def delete(self, db: Session, setting_id: str):
         setting = db.get(DomainSetting, coerce_uuid(setting_id))
         if not setting or (self.domain and setting.domain != self.domain):
             raise SettingNotFoundError("Setting not found")
         setting.is_active = False
         db.flush()
+        _invalidate_resolved(db, setting.domain, setting.key)
 
 
 settings = DomainSettings()
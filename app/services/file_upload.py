@@ -11,6 +11,7 @@ from starlette.datastructures import UploadFile
 
 from app.config import settings
 from app.models.file_upload import FileUpload, FileUploadStatus
+from app.services.common import Cursor, apply_keyset
 from app.services.storage import StorageBackend, get_storage_backend
 
 logger = logging.getLogger(__name__)
@@ -103,8 +104,13 @@ class FileUploadService:
         entity_id: str | None = None,
         limit: int = 50,
         offset: int = 0,
+        cursor: Cursor | None = None,
     ) -> list[FileUpload]:
-        """List file uploads with optional filters."""
+        """List file uploads with optional filters, newest first.
+
+        Pass ``cursor`` (the ``(created_at, id)`` of the last row seen) to
+        page by keyset instead of ``offset``.
+        """
         stmt = select(FileUpload).where(
             FileUpload.is_active.is_(True),
             FileUpload.status == FileUploadStatus.active,
@@ -117,7 +123,14 @@ class FileUploadService:
             stmt = stmt.where(FileUpload.entity_type == entity_type)
         if entity_id is not None:
             stmt = stmt.where(FileUpload.entity_id == entity_id)
-        stmt = stmt.order_by(FileUpload.created_at.desc()).limit(limit).offset(offset)
+        stmt = apply_keyset(
+            stmt,
+            FileUpload.created_at,
+            FileUpload.id,
+            limit,
+            cursor=cursor,
+            offset=offset,
+        )
         return list(self.db.scalars(stmt).all())
 
     def count(
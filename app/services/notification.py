@@ -12,6 +12,7 @@ from sqlalchemy.orm import Session
 
 from app.models.notification import Notification, NotificationType
 from app.schemas.notification import NotificationCreate
+from app.services.common import Cursor, apply_keyset
 
 logger = logging.getLogger(__name__)
 
@@ -83,15 +84,27 @@ class NotificationService:
         unread_only: bool = False,
         limit: int = 50,
         offset: int = 0,
+        cursor: Cursor | None = None,
     ) -> list[Notification]:
-        """List notifications for a recipient."""
+        """List notifications for a recipient, newest first.
+
+        Pass ``cursor`` (the ``(created_at, id)`` of the last row seen) to
+        page by keyset instead of ``offset``.
+        """
         stmt = select(Notification).where(
             Notification.recipient_id == recipient_id,
             Notification.is_active.is_(True),
         )
         if unread_only:
             stmt = stmt.where(Notification.is_read.is_(False))
-        stmt = stmt.order_by(Notification.created_at.desc()).limit(limit).offset(offset)
+        stmt = apply_keyset(
+            stmt,
+            Notification.created_at,
+            Notification.id,
+            limit,
+            cursor=cursor,
+            offset=offset,
+        )
         return list(self.db.scalars(stmt).all())
 
     def unread_count(self, recipient_id: UUID) -> int:
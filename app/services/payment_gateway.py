@@ -3,6 +3,8 @@
 import hashlib
 import hmac
 import logging
+import threading
+import time
 from typing import Any
 
 import httpx
@@ -13,12 +15,75 @@ logger = logging.getLogger(__name__)
 
 PAYSTACK_BASE_URL = "https://api.paystack.co"
 
+# Lookups are quick and safe to repeat; subaccount/transaction mutations
+# get a longer read budget.
+READ_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+WRITE_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+# Connection-level retries happen in the transport (the request never
+# reached Paystack). 5xx responses are only retried for idempotent GETs,
+# with a short backoff so a sync worker is never held for long.
+TRANSPORT_RETRIES = 3
+IDEMPOTENT_ATTEMPTS = 3
+RETRY_BACKOFF_SECONDS = 0.25
+
+
+class CircuitBreaker:
+    """Per-process breaker that fails fast while Paystack is degraded.
+
+    After ``fail_max`` consecutive failures the breaker opens and calls raise
+    immediately for ``reset_timeout`` seconds. The next call after that is let
+    through; success closes the breaker, failure re-opens it.
+    """
+
+    def __init__(self, fail_max: int = 5, reset_timeout: float = 30.0) -> None:
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        with self._lock:
+            return (
+                self._opened_at is not None
+                and time.monotonic() - self._opened_at < self.reset_timeout
+            )
+
+    def before_call(self) -> None:
+        if self.is_open:
+            raise RuntimeError("Paystack degraded")
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.fail_max:
+                if self._opened_at is None:
+                    logger.warning(
+                        "Paystack circuit opened after %d failures", self._failures
+                    )
+                self._opened_at = time.monotonic()
+
 
 class PaystackGateway:
     """Thin wrapper around Paystack REST API."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        transport: httpx.BaseTransport | None = None,
+        breaker: CircuitBreaker | None = None,
+    ) -> None:
         self._secret_key = settings.paystack_secret_key
+        self._transport = transport
+        self._client: httpx.Client | None = None
+        self._client_lock = threading.Lock()
+        self.breaker = breaker or CircuitBreaker()
 
     def _headers(self) -> dict[str, str]:
         return {
@@ -29,6 +94,54 @@ class PaystackGateway:
     def is_configured(self) -> bool:
         return bool(self._secret_key)
 
+    def _get_client(self) -> httpx.Client:
+        """Return the shared client, creating it on first use."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        base_url=PAYSTACK_BASE_URL,
+                        transport=self._transport
+                        or httpx.HTTPTransport(retries=TRANSPORT_RETRIES),
+                        timeout=WRITE_TIMEOUT,
+                    )
+        return self._client
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        timeout: httpx.Timeout,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Send a request through the circuit breaker and return the JSON body.
+
+        Raises RuntimeError when the breaker is open, the request cannot be
+        delivered, or Paystack keeps answering with a 5xx.
+        """
+        self.breaker.before_call()
+        client = self._get_client()
+        attempts = IDEMPOTENT_ATTEMPTS if method == "GET" else 1
+        for attempt in range(attempts):
+            try:
+                resp = client.request(
+                    method, path, headers=self._headers(), timeout=timeout, **kwargs
+                )
+            except httpx.TransportError as exc:
+                self.breaker.record_failure()
+                raise RuntimeError(f"Paystack request failed: {exc}") from exc
+            if resp.status_code < 500:
+                break
+            if attempt + 1 < attempts:
+                time.sleep(RETRY_BACKOFF_SECONDS * 2**attempt)
+        if resp.status_code >= 500:
+            self.breaker.record_failure()
+            raise RuntimeError(f"Paystack unavailable (HTTP {resp.status_code})")
+        self.breaker.record_success()
+        data: dict[str, Any] = resp.json()
+        return data
+
     # ── Subaccount management ────────────────────────────
 
     def create_subaccount(
@@ -47,13 +160,7 @@ class PaystackGateway:
             "account_number": account_number,
             "percentage_charge": percentage_charge,
         }
-        with httpx.Client(timeout=30) as client:
-            resp = client.post(
-                f"{PAYSTACK_BASE_URL}/subaccount",
-                json=payload,
-                headers=self._headers(),
-            )
-        data = resp.json()
+        data = self._request("POST", "/subaccount", json=payload, timeout=WRITE_TIMEOUT)
         if not data.get("status"):
             logger.error("Paystack create_subaccount failed: %s", data.get("message"))
             raise ValueError(data.get("message", "Failed to create subaccount"))
@@ -69,13 +176,9 @@ class PaystackGateway:
         """Update a Paystack subaccount."""
         if not self.is_configured():
             raise RuntimeError("Paystack is not configured")
-        with httpx.Client(timeout=30) as client:
-            resp = client.put(
-                f"{PAYSTACK_BASE_URL}/subaccount/{subaccount_code}",
-                json=kwargs,
-                headers=self._headers(),
-            )
-        data = resp.json()
+        data = self._request(
+            "PUT", f"/subaccount/{subaccount_code}", json=kwargs, timeout=WRITE_TIMEOUT
+        )
         if not data.get("status"):
             logger.error("Paystack update_subaccount failed: %s", data.get("message"))
             raise ValueError(data.get("message", "Failed to update subaccount"))
@@ -86,13 +189,9 @@ class PaystackGateway:
         """Get list of Nigerian banks."""
         if not self.is_configured():
             raise RuntimeError("Paystack is not configured")
-        with httpx.Client(timeout=30) as client:
-            resp = client.get(
-                f"{PAYSTACK_BASE_URL}/bank",
-                params={"country": country},
-                headers=self._headers(),
-            )
-        data = resp.json()
+        data = self._request(
+            "GET", "/bank", params={"country": country}, timeout=READ_TIMEOUT
+        )
         if not data.get("status"):
             return []
         result: list[dict[str, Any]] = data["data"]
@@ -121,13 +220,9 @@ class PaystackGateway:
         if subaccount_code:
             payload["subaccount"] = subaccount_code
             payload["bearer"] = bearer
-        with httpx.Client(timeout=30) as client:
-            resp = client.post(
-                f"{PAYSTACK_BASE_URL}/transaction/initialize",
-                json=payload,
-                headers=self._headers(),
-            )
-        data = resp.json()
+        data = self._request(
+            "POST", "/transaction/initialize", json=payload, timeout=WRITE_TIMEOUT
+        )
         if not data.get("status"):
             logger.error("Paystack initialize failed: %s", data.get("message"))
             raise ValueError(data.get("message", "Failed to initialize transaction"))
@@ -139,12 +234,9 @@ class PaystackGateway:
         """Verify a Paystack transaction by reference."""
         if not self.is_configured():
             raise RuntimeError("Paystack is not configured")
-        with httpx.Client(timeout=30) as client:
-            resp = client.get(
-                f"{PAYSTACK_BASE_URL}/transaction/verify/{reference}",
-                headers=self._headers(),
-            )
-        data = resp.json()
+        data = self._request(
+            "GET", f"/transaction/verify/{reference}", timeout=READ_TIMEOUT
+        )
         if not data.get("status"):
             logger.error("Paystack verify failed: %s", data.get("message"))
             raise ValueError(data.get("message", "Failed to verify transaction"))
@@ -7,6 +7,8 @@ from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from app.models.school import Application, Rating
+from app.services.common import run_after_commit
+from app.services.school import invalidate_average_rating
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +17,13 @@ class RatingService:
     def __init__(self, db: Session) -> None:
         self.db = db
 
+    def _invalidate_average(self, school_id: UUID) -> None:
+        # Clear once the rating commits (or rolls back), so no request can
+        # re-cache the old average, or keep an uncommitted one, in between.
+        run_after_commit(
+            self.db, lambda: invalidate_average_rating(school_id), on_rollback=True
+        )
+
     def create(
         self,
         school_id: UUID,
@@ -50,6 +59,7 @@ class RatingService:
         )
         self.db.add(rating)
         self.db.flush()
+        self._invalidate_average(school_id)
         logger.info("Created rating: %s for school %s", rating.id, school_id)
         return rating
 
@@ -70,6 +80,7 @@ class RatingService:
             if score < 1 or score > 5:
                 raise ValueError("Score must be between 1 and 5")
             rating.score = score
+            self._invalidate_average(rating.school_id)
         if comment is not None:
             if len(comment) > 500:
                 raise ValueError("Comment must be 500 characters or fewer")
@@ -1,22 +1,25 @@
 import logging
 from uuid import UUID
 
-from sqlalchemy import func, select
+from pydantic import BaseModel
+from sqlalchemy import delete, select, update
 from sqlalchemy.orm import Session
 
 from app.models.person import Person
 from app.models.rbac import Permission, PersonRole, Role, RolePermission
 from app.schemas.rbac import (
     PermissionCreate,
+    PermissionRead,
     PermissionUpdate,
     PersonRoleCreate,
     PersonRoleUpdate,
     RoleCreate,
     RolePermissionCreate,
     RolePermissionUpdate,
+    RoleRead,
     RoleUpdate,
 )
-from app.services.common import coerce_uuid
+from app.services.common import coerce_uuid, fetch_with_total, keyset_page
 from app.services.response import ListResponseMixin
 
 logger = logging.getLogger(__name__)
@@ -42,17 +45,95 @@ class PersonNotFoundError(ValueError):
     pass
 
 
+def _read_columns(model: type, schema: type[BaseModel]) -> list:
+    """Model columns backing each field of a read schema."""
+    return [getattr(model, field) for field in schema.model_fields]
+
+
+# Role and permission listings only feed their read schemas, so they select
+# those columns as plain rows and skip ORM hydration and the identity map.
+_ROLE_READ_COLUMNS = _read_columns(Role, RoleRead)
+_PERMISSION_READ_COLUMNS = _read_columns(Permission, PermissionRead)
+
+# List statements are immutable, so build the filtered base select once per
+# is_active value rather than on every request. SQLAlchemy's
+# compiled cache then only has to look up the cache key; limit/offset and
+# cursor values are bound parameters.
+_ROLE_LIST_STMTS = {
+    flag: select(*_ROLE_READ_COLUMNS).where(Role.is_active.is_(flag))
+    for flag in (True, False)
+}
+_PERMISSION_LIST_STMTS = {
+    flag: select(*_PERMISSION_READ_COLUMNS).where(Permission.is_active.is_(flag))
+    for flag in (True, False)
+}
+
+
+def get_person_role_names(db: Session, person_id: UUID) -> set[str]:
+    """Return the names of roles assigned to a person."""
+    stmt = (
+        select(Role.name)
+        .join(PersonRole, PersonRole.role_id == Role.id)
+        .where(PersonRole.person_id == person_id)
+    )
+    return set(db.scalars(stmt))
+
+
+_NOT_FOUND_ERRORS: dict[type, type[ValueError]] = {
+    Person: PersonNotFoundError,
+    Role: RoleNotFoundError,
+    Permission: PermissionNotFoundError,
+}
+
+
+def _changed_value(link: object, data: dict, field: str) -> UUID | None:
+    """The new value of ``field`` if the update actually changes it, else None.
+
+    Links are validated by their FK constraints once written; only a target
+    the patch moves to needs the existence check (and its friendly 404).
+    """
+    value = data.get(field)
+    if value is None or value == getattr(link, field):
+        return None
+    return value
+
+
+def _ensure_exist(db: Session, targets: dict[type, UUID | None]) -> None:
+    """Check that each ``model -> id`` target exists in a single round trip.
+
+    Targets whose id is None are skipped. Raises the matching *NotFoundError
+    for the first missing row.
+    """
+    lookups = {model: pk for model, pk in targets.items() if pk is not None}
+    if not lookups:
+        return
+    row = db.execute(
+        select(
+            *(
+                select(model.id).where(model.id == pk).scalar_subquery()
+                for model, pk in lookups.items()
+            )
+        )
+    ).one()
+    for model, found in zip(lookups, row, strict=True):
+        if found is None:
+            raise _NOT_FOUND_ERRORS[model](f"{model.__name__} not found")
+
+
 class Roles(ListResponseMixin):
-    @staticmethod
-    def _apply_ordering(stmt, order_by: str, order_dir: str):
-        allowed_columns = {
-            "created_at": Role.created_at,
-            "name": Role.name,
-        }
-        column = allowed_columns.get(order_by)
+    __slots__ = ()
+
+    _order_columns = {
+        "created_at": Role.created_at,
+        "name": Role.name,
+    }
+
+    @classmethod
+    def _apply_ordering(cls, stmt, order_by: str, order_dir: str):
+        column = cls._order_columns.get(order_by)
         if column is None:
             raise ValueError(
-                f"Invalid order_by. Allowed: {', '.join(sorted(allowed_columns))}"
+                f"Invalid order_by. Allowed: {', '.join(sorted(cls._order_columns))}"
             )
         if order_dir == "desc":
             return stmt.order_by(column.desc())
@@ -63,7 +144,6 @@ class Roles(ListResponseMixin):
         role = Role(**payload.model_dump())
         db.add(role)
         db.flush()
-        db.refresh(role)
         return role
 
     @staticmethod
@@ -81,52 +161,65 @@ class Roles(ListResponseMixin):
         order_dir: str,
         limit: int,
         offset: int,
+        cursor: str | None = None,
     ):
-        stmt = select(Role)
-        if is_active is None:
-            stmt = stmt.where(Role.is_active.is_(True))
-        else:
-            stmt = stmt.where(Role.is_active == is_active)
-
-        count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
-        total = db.scalar(count_stmt) or 0
+        # Inactive rows are only listed when asked for explicitly.
+        stmt = _ROLE_LIST_STMTS[True if is_active is None else is_active]
+        if order_by == "created_at":
+            items, total, next_cursor = keyset_page(
+                db,
+                stmt,
+                Role.created_at,
+                Role.id,
+                limit=limit,
+                offset=offset,
+                cursor=cursor,
+                descending=order_dir == "desc",
+                rows=True,
+            )
+            return items, total, next_cursor
+        if cursor:
+            raise ValueError("cursor pagination requires order_by=created_at")
 
-        stmt = Roles._apply_ordering(stmt, order_by, order_dir)
-        stmt = stmt.limit(limit).offset(offset)
-        items = list(db.scalars(stmt).all())
-        return items, total
+        page = Roles._apply_ordering(stmt, order_by, order_dir)
+        items, total = fetch_with_total(
+            db, stmt, page.limit(limit).offset(offset), rows=True
+        )
+        return items, total, None
 
     @staticmethod
     def update(db: Session, role_id: str, payload: RoleUpdate):
         role = db.get(Role, coerce_uuid(role_id))
         if not role:
             raise RoleNotFoundError("Role not found")
-        for key, value in payload.model_dump(exclude_unset=True).items():
-            setattr(role, key, value)
+        for field in payload.model_fields_set:
+            setattr(role, field, getattr(payload, field))
         db.flush()
-        db.refresh(role)
         return role
 
     @staticmethod
     def delete(db: Session, role_id: str):
-        role = db.get(Role, coerce_uuid(role_id))
-        if not role:
+        result = db.execute(
+            update(Role).where(Role.id == coerce_uuid(role_id)).values(is_active=False)
+        )
+        if result.rowcount == 0:
             raise RoleNotFoundError("Role not found")
-        role.is_active = False
-        db.flush()
 
 
 class Permissions(ListResponseMixin):
-    @staticmethod
-    def _apply_ordering(stmt, order_by: str, order_dir: str):
-        allowed_columns = {
-            "created_at": Permission.created_at,
-            "key": Permission.key,
-        }
-        column = allowed_columns.get(order_by)
+    __slots__ = ()
+
+    _order_columns = {
+        "created_at": Permission.created_at,
+        "key": Permission.key,
+    }
+
+    @classmethod
+    def _apply_ordering(cls, stmt, order_by: str, order_dir: str):
+        column = cls._order_columns.get(order_by)
         if column is None:
             raise ValueError(
-                f"Invalid order_by. Allowed: {', '.join(sorted(allowed_columns))}"
+                f"Invalid order_by. Allowed: {', '.join(sorted(cls._order_columns))}"
             )
         if order_dir == "desc":
             return stmt.order_by(column.desc())
@@ -137,7 +230,6 @@ class Permissions(ListResponseMixin):
         permission = Permission(**payload.model_dump())
         db.add(permission)
         db.flush()
-        db.refresh(permission)
         return permission
 
     @staticmethod
@@ -155,51 +247,66 @@ class Permissions(ListResponseMixin):
         order_dir: str,
         limit: int,
         offset: int,
+        cursor: str | None = None,
     ):
-        stmt = select(Permission)
-        if is_active is None:
-            stmt = stmt.where(Permission.is_active.is_(True))
-        else:
-            stmt = stmt.where(Permission.is_active == is_active)
-
-        count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
-        total = db.scalar(count_stmt) or 0
+        # Inactive rows are only listed when asked for explicitly.
+        stmt = _PERMISSION_LIST_STMTS[True if is_active is None else is_active]
+        if order_by == "created_at":
+            items, total, next_cursor = keyset_page(
+                db,
+                stmt,
+                Permission.created_at,
+                Permission.id,
+                limit=limit,
+                offset=offset,
+                cursor=cursor,
+                descending=order_dir == "desc",
+                rows=True,
+            )
+            return items, total, next_cursor
+        if cursor:
+            raise ValueError("cursor pagination requires order_by=created_at")
 
-        stmt = Permissions._apply_ordering(stmt, order_by, order_dir)
-        stmt = stmt.limit(limit).offset(offset)
-        items = list(db.scalars(stmt).all())
-        return items, total
+        page = Permissions._apply_ordering(stmt, order_by, order_dir)
+        items, total = fetch_with_total(
+            db, stmt, page.limit(limit).offset(offset), rows=True
+        )
+        return items, total, None
 
     @staticmethod
     def update(db: Session, permission_id: str, payload: PermissionUpdate):
         permission = db.get(Permission, coerce_uuid(permission_id))
         if not permission:
             raise PermissionNotFoundError("Permission not found")
-        for key, value in payload.model_dump(exclude_unset=True).items():
-            setattr(permission, key, value)
+        for field in payload.model_fields_set:
+            setattr(permission, field, getattr(payload, field))
         db.flush()
-        db.refresh(permission)
         return permission
 
     @staticmethod
     def delete(db: Session, permission_id: str):
-        permission = db.get(Permission, coerce_uuid(permission_id))
-        if not permission:
+        result = db.execute(
+            update(Permission)
+            .where(Permission.id == coerce_uuid(permission_id))
+            .values(is_active=False)
+        )
+        if result.rowcount == 0:
             raise PermissionNotFoundError("Permission not found")
-        permission.is_active = False
-        db.flush()
 
 
 class RolePermissions(ListResponseMixin):
-    @staticmethod
-    def _apply_ordering(stmt, order_by: str, order_dir: str):
-        allowed_columns = {
-            "role_id": RolePermission.role_id,
-        }
-        column = allowed_columns.get(order_by)
+    __slots__ = ()
+
+    _order_columns = {
+        "role_id": RolePermission.role_id,
+    }
+
+    @classmethod
+    def _apply_ordering(cls, stmt, order_by: str, order_dir: str):
+        column = cls._order_columns.get(order_by)
         if column is None:
             raise ValueError(
-                f"Invalid order_by. Allowed: {', '.join(sorted(allowed_columns))}"
+                f"Invalid order_by. Allowed: {', '.join(sorted(cls._order_columns))}"
             )
         if order_dir == "desc":
             return stmt.order_by(column.desc())
@@ -207,17 +314,11 @@ class RolePermissions(ListResponseMixin):
 
     @staticmethod
     def create(db: Session, payload: RolePermissionCreate):
-        role = db.get(Role, coerce_uuid(str(payload.role_id)))
-        if not role:
-            raise RoleNotFoundError("Role not found")
-        permission = db.get(Permission, coerce_uuid(str(payload.permission_id)))
-        if not permission:
-            raise PermissionNotFoundError("Permission not found")
+        _ensure_exist(db, {Role: payload.role_id, Permission: payload.permission_id})
 
         link = RolePermission(**payload.model_dump())
         db.add(link)
         db.flush()
-        db.refresh(link)
         return link
 
     @staticmethod
@@ -236,6 +337,7 @@ class RolePermissions(ListResponseMixin):
         order_dir: str,
         limit: int,
         offset: int,
+        cursor: str | None = None,
     ):
         stmt = select(RolePermission)
         if role_id:
@@ -245,63 +347,65 @@ class RolePermissions(ListResponseMixin):
                 RolePermission.permission_id == coerce_uuid(permission_id)
             )
 
-        count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
-        total = db.scalar(count_stmt) or 0
+        if order_by == "role_id":
+            items, total, next_cursor = keyset_page(
+                db,
+                stmt,
+                RolePermission.role_id,
+                RolePermission.id,
+                limit=limit,
+                offset=offset,
+                cursor=cursor,
+                descending=order_dir == "desc",
+            )
+            return items, total, next_cursor
+        if cursor:
+            raise ValueError("cursor pagination requires order_by=role_id")
 
-        stmt = RolePermissions._apply_ordering(stmt, order_by, order_dir)
-        stmt = stmt.limit(limit).offset(offset)
-        items = list(db.scalars(stmt).all())
-        return items, total
-
-    @staticmethod
-    def _validate_link_ids(
-        db: Session, role_id: UUID | None, permission_id: UUID | None
-    ):
-        if role_id is not None:
-            role = db.get(Role, role_id)
-            if not role:
-                raise RoleNotFoundError("Role not found")
-        if permission_id is not None:
-            permission = db.get(Permission, permission_id)
-            if not permission:
-                raise PermissionNotFoundError("Permission not found")
+        page = RolePermissions._apply_ordering(stmt, order_by, order_dir)
+        items, total = fetch_with_total(db, stmt, page.limit(limit).offset(offset))
+        return items, total, None
 
     @staticmethod
     def update(db: Session, link_id: str, payload: RolePermissionUpdate):
         link = db.get(RolePermission, coerce_uuid(link_id))
         if not link:
             raise RolePermissionNotFoundError("Role permission not found")
-        data = payload.model_dump(exclude_unset=True)
-        RolePermissions._validate_link_ids(
+        data = {field: getattr(payload, field) for field in payload.model_fields_set}
+        _ensure_exist(
             db,
-            role_id=data.get("role_id"),
-            permission_id=data.get("permission_id"),
+            {
+                Role: _changed_value(link, data, "role_id"),
+                Permission: _changed_value(link, data, "permission_id"),
+            },
         )
         for key, value in data.items():
             setattr(link, key, value)
         db.flush()
-        db.refresh(link)
         return link
 
     @staticmethod
     def delete(db: Session, link_id: str):
-        link = db.get(RolePermission, coerce_uuid(link_id))
-        if not link:
+        result = db.execute(
+            delete(RolePermission).where(RolePermission.id == coerce_uuid(link_id))
+        )
+        if result.rowcount == 0:
             raise RolePermissionNotFoundError("Role permission not found")
-        db.delete(link)
-        db.flush()
 
 
 class PersonRoles(ListResponseMixin):
-    @staticmethod
-    def _apply_ordering(stmt, order_by: str, order_dir: str):
-        allowed_columns = {
-            "assigned_at": PersonRole.assigned_at,
-        }
-        column = allowed_columns.get(order_by)
+    __slots__ = ()
+
+    _order_columns = {
+        "assigned_at": PersonRole.assigned_at,
+    }
+
+    @classmethod
+    def _apply_ordering(cls, stmt, order_by: str, order_dir: str):
+        column = cls._order_columns.get(order_by)
         if column is None:
             raise ValueError(
-                f"Invalid order_by. Allowed: {', '.join(sorted(allowed_columns))}"
+                f"Invalid order_by. Allowed: {', '.join(sorted(cls._order_columns))}"
             )
         if order_dir == "desc":
             return stmt.order_by(column.desc())
@@ -309,17 +413,11 @@ class PersonRoles(ListResponseMixin):
 
     @staticmethod
     def create(db: Session, payload: PersonRoleCreate):
-        person = db.get(Person, coerce_uuid(str(payload.person_id)))
-        if not person:
-            raise PersonNotFoundError("Person not found")
-        role = db.get(Role, coerce_uuid(str(payload.role_id)))
-        if not role:
-            raise RoleNotFoundError("Role not found")
+        _ensure_exist(db, {Person: payload.person_id, Role: payload.role_id})
 
         link = PersonRole(**payload.model_dump())
         db.add(link)
         db.flush()
-        db.refresh(link)
         return link
 
     @staticmethod
@@ -338,6 +436,7 @@ class PersonRoles(ListResponseMixin):
         order_dir: str,
         limit: int,
         offset: int,
+        cursor: str | None = None,
     ):
         stmt = select(PersonRole)
         if person_id:
@@ -345,51 +444,56 @@ class PersonRoles(ListResponseMixin):
         if role_id:
             stmt = stmt.where(PersonRole.role_id == coerce_uuid(role_id))
 
-        count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
-        total = db.scalar(count_stmt) or 0
-
-        stmt = PersonRoles._apply_ordering(stmt, order_by, order_dir)
-        stmt = stmt.limit(limit).offset(offset)
-        items = list(db.scalars(stmt).all())
-        return items, total
+        if order_by == "assigned_at":
+            items, total, next_cursor = keyset_page(
+                db,
+                stmt,
+                PersonRole.assigned_at,
+                PersonRole.id,
+                limit=limit,
+                offset=offset,
+                cursor=cursor,
+                descending=order_dir == "desc",
+            )
+            return items, total, next_cursor
+        if cursor:
+            raise ValueError("cursor pagination requires order_by=assigned_at")
 
-    @staticmethod
-    def _validate_link_ids(db: Session, person_id: UUID | None, role_id: UUID | None):
-        if person_id is not None:
-            person = db.get(Person, person_id)
-            if not person:
-                raise PersonNotFoundError("Person not found")
-        if role_id is not None:
-            role = db.get(Role, role_id)
-            if not role:
-                raise RoleNotFoundError("Role not found")
+        page = PersonRoles._apply_ordering(stmt, order_by, order_dir)
+        items, total = fetch_with_total(db, stmt, page.limit(limit).offset(offset))
+        return items, total, None
 
     @staticmethod
     def update(db: Session, link_id: str, payload: PersonRoleUpdate):
         link = db.get(PersonRole, coerce_uuid(link_id))
         if not link:
             raise PersonRoleNotFoundError("Person role not found")
-        data = payload.model_dump(exclude_unset=True)
-        PersonRoles._validate_link_ids(
+        data = {field: getattr(payload, field) for field in payload.model_fields_set}
+        _ensure_exist(
             db,
-            person_id=data.get("person_id"),
-            role_id=data.get("role_id"),
+            {
+                Person: _changed_value(link, data, "person_id"),
+                Role: _changed_value(link, data, "role_id"),
+            },
         )
         for key, value in data.items():
             setattr(link, key, value)
         db.flush()
-        db.refresh(link)
         return link
 
     @staticmethod
     def delete(db: Session, link_id: str):
-        link = db.get(PersonRole, coerce_uuid(link_id))
-        if not link:
+        person_id = db.scalar(
+            delete(PersonRole)
+            .where(PersonRole.id == coerce_uuid(link_id))
+            .returning(PersonRole.person_id)
+        )
+        if person_id is None:
             raise PersonRoleNotFoundError("Person role not found")
-        db.delete(link)
-        db.flush()
 
 
+# Stateless singletons: the classes declare empty __slots__, so these
+# instances carry no __dict__ and method lookups go straight to the class.
 roles = Roles()
 permissions = Permissions()
 role_permissions = RolePermissions()
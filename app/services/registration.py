@@ -1,20 +1,33 @@
 """Registration service — parent and school admin onboarding."""
 
 import logging
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import insert, literal, select
 from sqlalchemy.orm import Session
 
+from app.config import settings
 from app.models.auth import AuthProvider, UserCredential
 from app.models.person import Person
 from app.models.rbac import PersonRole, Role
 from app.schemas.school import SchoolCreate
+from app.services import rbac as rbac_service
 from app.services.auth_flow import hash_password, validate_password_strength
+from app.services.common import dialect_insert
 from app.services.school import SchoolService
 
 logger = logging.getLogger(__name__)
 
+# Password hashing (pbkdf2 via hashlib) releases the GIL, so it can run on a
+# worker thread while the role lookup and person INSERT are in flight. The
+# pool is shared by every registration in the process, so size it from config
+# (0 falls back to Python's default of min(32, cpu_count + 4)).
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.password_hash_workers or None, thread_name_prefix="pwhash"
+)
+
 
 class RegistrationService:
     """Handles user registration and role assignment."""
@@ -26,46 +39,64 @@ class RegistrationService:
         stmt = select(Person.id).where(Person.email == email)
         return self.db.scalar(stmt) is not None
 
-    def _create_person(
+    def _validate_password(self, password: str) -> None:
+        validate_password_strength(password)
+
+    def _create_account(
         self,
         first_name: str,
         last_name: str,
         email: str,
         phone: str | None,
+        password: str,
+        role_name: str,
     ) -> Person:
-        person = Person(
-            first_name=first_name,
-            last_name=last_name,
-            email=email,
-            phone=phone,
-            email_verified=False,
-        )
-        self.db.add(person)
-        self.db.flush()
-        return person
+        """Insert the person, its role link and its credential.
 
-    def _create_credential(
-        self, person_id: UUID, password: str, username: str | None = None
-    ) -> UserCredential:
-        cred = UserCredential(
-            person_id=person_id,
-            provider=AuthProvider.local,
-            password_hash=hash_password(password),
-            username=username,
+        Raises ValueError if the email is already registered.
+        """
+        password_hash = _hash_executor.submit(hash_password, password)
+        # INSERT ... ON CONFLICT (email) DO NOTHING detects a taken email in the
+        # same round trip as the insert, with no check-then-insert race.
+        stmt = (
+            dialect_insert(self.db, Person)
+            .values(
+                id=uuid.uuid4(),
+                first_name=first_name,
+                last_name=last_name,
+                email=email,
+                phone=phone,
+                email_verified=False,
+            )
+            .on_conflict_do_nothing(index_elements=[Person.email])
+            .returning(Person)
+        )
+        person = self.db.scalars(stmt).first()
+        if person is None:
+            # Skip the hash if it has not started yet; the result is unused.
+            password_hash.cancel()
+            raise ValueError("An account with this email already exists")
+        # Resolve the role and link it in one INSERT ... SELECT; an unknown or
+        # inactive role simply inserts nothing.
+        self.db.execute(
+            insert(PersonRole).from_select(
+                ["person_id", "role_id"],
+                select(literal(person.id, PersonRole.person_id.type), Role.id)
+                .where(Role.name == role_name)
+                .where(Role.is_active.is_(True))
+                .limit(1),
+            )
+        )
+        self.db.add(
+            UserCredential(
+                person_id=person.id,
+                provider=AuthProvider.local,
+                password_hash=password_hash.result(),
+                username=email,
+            )
         )
-        self.db.add(cred)
         self.db.flush()
-        return cred
-
-    def _validate_password(self, password: str) -> None:
-        validate_password_strength(password)
-
-    def _assign_role(self, person_id: UUID, role_name: str) -> None:
-        stmt = select(Role).where(Role.name == role_name, Role.is_active.is_(True))
-        role = self.db.scalar(stmt)
-        if role:
-            self.db.add(PersonRole(person_id=person_id, role_id=role.id))
-            self.db.flush()
+        return person
 
     def register_parent(
         self,
@@ -75,12 +106,10 @@ class RegistrationService:
         password: str,
         phone: str | None = None,
     ) -> Person:
-        if self.email_exists(email):
-            raise ValueError("An account with this email already exists")
         self._validate_password(password)
-        person = self._create_person(first_name, last_name, email, phone)
-        self._create_credential(person.id, password, username=email)
-        self._assign_role(person.id, "parent")
+        person = self._create_account(
+            first_name, last_name, email, phone, password, "parent"
+        )
 
         logger.info("Registered parent: %s", person.id)
         return person
@@ -99,12 +128,10 @@ class RegistrationService:
         city: str | None = None,
         address: str | None = None,
     ) -> tuple[Person, object]:
-        if self.email_exists(email):
-            raise ValueError("An account with this email already exists")
         self._validate_password(password)
-        person = self._create_person(first_name, last_name, email, phone)
-        self._create_credential(person.id, password, username=email)
-        self._assign_role(person.id, "school_admin")
+        person = self._create_account(
+            first_name, last_name, email, phone, password, "school_admin"
+        )
 
         payload = SchoolCreate(
             name=school_name,
@@ -123,9 +150,4 @@ class RegistrationService:
         return person, school
 
     def get_person_role_names(self, person_id: UUID) -> set[str]:
-        stmt = (
-            select(Role.name)
-            .join(PersonRole, PersonRole.role_id == Role.id)
-            .where(PersonRole.person_id == person_id)
-        )
-        return set(self.db.scalars(stmt).all())
+        return rbac_service.get_person_role_names(self.db, person_id)
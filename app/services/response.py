@@ -1,5 +1,10 @@
 def list_response(
-    items: list, limit: int, offset: int, *, total: int | None = None
+    items: list,
+    limit: int,
+    offset: int,
+    *,
+    total: int | None = None,
+    next_cursor: str | None = None,
 ) -> dict:
     return {
         "items": items,
@@ -7,10 +12,13 @@ def list_response(
         "limit": limit,
         "offset": offset,
         "total": total if total is not None else len(items),
+        "next_cursor": next_cursor,
     }
 
 
 class ListResponseMixin:
+    __slots__ = ()
+
     def list(self, db, *args, **kwargs):
         raise NotImplementedError
 
@@ -25,9 +33,12 @@ class ListResponseMixin:
             *list_args, limit, offset = args
             result = self.list(db, *list_args, limit=limit, offset=offset, **kwargs)
 
+        next_cursor = None
         if isinstance(result, tuple):
-            items, total = result
+            items, total, *rest = result
+            if rest:
+                next_cursor = rest[0]
         else:
             items = result
             total = len(items)
-        return list_response(items, limit, offset, total=total)
+        return list_response(items, limit, offset, total=total, next_cursor=next_cursor)
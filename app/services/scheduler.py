@@ -1,11 +1,11 @@
 import logging
 
-from sqlalchemy import func, select
+from sqlalchemy import delete, select
 from sqlalchemy.orm import Session
 
 from app.models.scheduler import ScheduledTask, ScheduleType
 from app.schemas.scheduler import ScheduledTaskCreate, ScheduledTaskUpdate
-from app.services.common import coerce_uuid
+from app.services.common import coerce_uuid, fetch_with_total, keyset_page
 from app.services.response import ListResponseMixin
 
 logger = logging.getLogger(__name__)
@@ -30,17 +30,28 @@ def _validate_schedule_type(value):
         raise ValueError("Invalid schedule_type") from exc
 
 
+# Base list statement per ``enabled`` filter, built once at import time.
+_LIST_STMTS = {
+    None: select(ScheduledTask),
+    True: select(ScheduledTask).where(ScheduledTask.enabled.is_(True)),
+    False: select(ScheduledTask).where(ScheduledTask.enabled.is_(False)),
+}
+
+
 class ScheduledTasks(ListResponseMixin):
-    @staticmethod
-    def _apply_ordering(stmt, order_by: str, order_dir: str):
-        allowed_columns = {
-            "created_at": ScheduledTask.created_at,
-            "name": ScheduledTask.name,
-        }
-        column = allowed_columns.get(order_by)
+    __slots__ = ()
+
+    _order_columns = {
+        "created_at": ScheduledTask.created_at,
+        "name": ScheduledTask.name,
+    }
+
+    @classmethod
+    def _apply_ordering(cls, stmt, order_by: str, order_dir: str):
+        column = cls._order_columns.get(order_by)
         if column is None:
             raise ValueError(
-                f"Invalid order_by. Allowed: {', '.join(sorted(allowed_columns))}"
+                f"Invalid order_by. Allowed: {', '.join(sorted(cls._order_columns))}"
             )
         if order_dir == "desc":
             return stmt.order_by(column.desc())
@@ -53,7 +64,6 @@ class ScheduledTasks(ListResponseMixin):
         task = ScheduledTask(**payload.model_dump())
         db.add(task)
         db.flush()
-        db.refresh(task)
         return task
 
     @staticmethod
@@ -71,25 +81,35 @@ class ScheduledTasks(ListResponseMixin):
         order_dir: str,
         limit: int,
         offset: int,
+        cursor: str | None = None,
     ):
-        stmt = select(ScheduledTask)
-        if enabled is not None:
-            stmt = stmt.where(ScheduledTask.enabled == enabled)
-
-        count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
-        total = db.scalar(count_stmt) or 0
+        stmt = _LIST_STMTS[enabled]
+
+        if order_by == "created_at":
+            items, total, next_cursor = keyset_page(
+                db,
+                stmt,
+                ScheduledTask.created_at,
+                ScheduledTask.id,
+                limit=limit,
+                offset=offset,
+                cursor=cursor,
+                descending=order_dir == "desc",
+            )
+            return items, total, next_cursor
+        if cursor:
+            raise ValueError("cursor pagination requires order_by=created_at")
 
-        stmt = ScheduledTasks._apply_ordering(stmt, order_by, order_dir)
-        stmt = stmt.limit(limit).offset(offset)
-        items = list(db.scalars(stmt).all())
-        return items, total
+        page = ScheduledTasks._apply_ordering(stmt, order_by, order_dir)
+        items, total = fetch_with_total(db, stmt, page.limit(limit).offset(offset))
+        return items, total, None
 
     @staticmethod
     def update(db: Session, task_id: str, payload: ScheduledTaskUpdate):
         task = db.get(ScheduledTask, coerce_uuid(task_id))
         if not task:
             raise ScheduledTaskNotFoundError("Scheduled task not found")
-        data = payload.model_dump(exclude_unset=True)
+        data = {field: getattr(payload, field) for field in payload.model_fields_set}
         if "schedule_type" in data:
             data["schedule_type"] = _validate_schedule_type(data["schedule_type"])
         if "interval_seconds" in data and data["interval_seconds"] is not None:
@@ -98,16 +118,15 @@ class ScheduledTasks(ListResponseMixin):
         for key, value in data.items():
             setattr(task, key, value)
         db.flush()
-        db.refresh(task)
         return task
 
     @staticmethod
     def delete(db: Session, task_id: str):
-        task = db.get(ScheduledTask, coerce_uuid(task_id))
-        if not task:
+        result = db.execute(
+            delete(ScheduledTask).where(ScheduledTask.id == coerce_uuid(task_id))
+        )
+        if result.rowcount == 0:
             raise ScheduledTaskNotFoundError("Scheduled task not found")
-        db.delete(task)
-        db.flush()
 
 
 scheduled_tasks = ScheduledTasks()
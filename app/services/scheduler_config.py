@@ -1,9 +1,11 @@
 import logging
 import os
+import threading
+import time
 from datetime import timedelta
 from typing import Any, cast
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
@@ -21,133 +23,182 @@ def _env_value(name: str) -> str | None:
     return value
 
 
-def _env_int(name: str) -> int | None:
-    raw = _env_value(name)
-    if raw is None:
+def _parse_int(value: str | None) -> int | None:
+    if value is None:
         return None
     try:
-        return int(raw)
+        return int(value)
     except ValueError:
         return None
 
 
-def _get_setting_value(db: Session, domain: SettingDomain, key: str) -> str | None:
-    setting = db.scalar(
-        select(DomainSetting)
-        .where(DomainSetting.domain == domain)
-        .where(DomainSetting.key == key)
-        .where(DomainSetting.is_active.is_(True))
-    )
-    if not setting:
-        return None
-    if setting.value_text:
-        return cast(str, setting.value_text)
-    if setting.value_json is not None:
-        return str(setting.value_json)
-    return None
-
-
-def _effective_int(
-    db: Session, domain: SettingDomain, key: str, env_key: str, default: int
-) -> int:
-    env_value = _env_int(env_key)
-    if env_value is not None:
-        return env_value
-    value = _get_setting_value(db, domain, key)
-    if value is None:
-        return default
-    try:
-        return int(value)
-    except ValueError:
-        return default
+def _env_int(name: str) -> int | None:
+    return _parse_int(_env_value(name))
 
 
-def _effective_str(
-    db: Session, domain: SettingDomain, key: str, env_key: str, default: str | None
-) -> str | None:
-    env_value = _env_value(env_key)
-    if env_value is not None:
-        return env_value
-    value = _get_setting_value(db, domain, key)
-    if value is None:
-        return default
-    return str(value)
+def _get_setting_values(
+    db: Session, domain: SettingDomain, keys: list[str]
+) -> dict[str, str]:
+    """Fetch several active settings of one domain in a single query."""
+    rows = db.execute(
+        select(DomainSetting.key, DomainSetting.value_text, DomainSetting.value_json)
+        .where(DomainSetting.domain == domain)
+        .where(DomainSetting.key.in_(keys))
+        .where(DomainSetting.is_active.is_(True))
+    ).all()
+    values: dict[str, str] = {}
+    for key, value_text, value_json in rows:
+        if value_text:
+            values[key] = cast(str, value_text)
+        elif value_json is not None:
+            values[key] = str(value_json)
+    return values
+
+
+# Setting key -> environment override. Integer settings only honour env values
+# that parse as int, otherwise the database value applies.
+_CELERY_STR_SETTINGS: dict[str, str] = {
+    "broker_url": "CELERY_BROKER_URL",
+    "result_backend": "CELERY_RESULT_BACKEND",
+    "timezone": "CELERY_TIMEZONE",
+}
+_CELERY_INT_SETTINGS: dict[str, tuple[str, int]] = {
+    "beat_max_loop_interval": ("CELERY_BEAT_MAX_LOOP_INTERVAL", 5),
+    "beat_refresh_seconds": ("CELERY_BEAT_REFRESH_SECONDS", 30),
+}
+
+# Beat re-reads its config and schedule on every refresh tick. Results are
+# cached in-process; the last good value is kept as a fallback so a transient
+# database outage does not take beat down with it.
+CONFIG_CACHE_TTL_SECONDS = 60.0
+_config_cache: dict[str, Any] = {"value": None, "expires": 0.0, "stale": None}
+_schedule_cache: dict[str, Any] = {"version": None, "value": None}
+_cache_lock = threading.Lock()
+
+
+def clear_scheduler_config_cache() -> None:
+    """Drop cached Celery config and beat schedule (e.g. after settings change)."""
+    with _cache_lock:
+        _config_cache.update(value=None, expires=0.0, stale=None)
+        _schedule_cache.update(version=None, value=None)
 
 
 def get_celery_config() -> dict:
-    broker = None
-    backend = None
-    timezone = None
-    beat_max_loop_interval = 5
-    beat_refresh_seconds = 30
-    session = SessionLocal()
-    try:
-        broker = _effective_str(
-            session, SettingDomain.scheduler, "broker_url", "CELERY_BROKER_URL", None
-        )
-        backend = _effective_str(
-            session,
-            SettingDomain.scheduler,
-            "result_backend",
-            "CELERY_RESULT_BACKEND",
-            None,
-        )
-        timezone = _effective_str(
-            session, SettingDomain.scheduler, "timezone", "CELERY_TIMEZONE", None
-        )
-        beat_max_loop_interval = _effective_int(
-            session,
-            SettingDomain.scheduler,
-            "beat_max_loop_interval",
-            "CELERY_BEAT_MAX_LOOP_INTERVAL",
-            5,
-        )
-        beat_refresh_seconds = _effective_int(
-            session,
-            SettingDomain.scheduler,
-            "beat_refresh_seconds",
-            "CELERY_BEAT_REFRESH_SECONDS",
-            30,
-        )
-    except SQLAlchemyError:
-        logger.exception("Failed to load scheduler settings from database.")
-    finally:
-        session.close()
-
-    broker = broker or _env_value("REDIS_URL") or "redis://localhost:6379/0"
-    backend = backend or _env_value("REDIS_URL") or "redis://localhost:6379/1"
-    timezone = timezone or "UTC"
+    with _cache_lock:
+        cached = _config_cache["value"]
+        if cached is not None and time.monotonic() < _config_cache["expires"]:
+            return dict(cached)
+
+    config, db_failed = _load_celery_config()
+    with _cache_lock:
+        stale = _config_cache["stale"]
+        if db_failed and stale is not None:
+            logger.warning("Using last known Celery config after database error.")
+            return dict(stale)
+        if not db_failed:
+            _config_cache.update(
+                value=config,
+                expires=time.monotonic() + CONFIG_CACHE_TTL_SECONDS,
+                stale=config,
+            )
+    return dict(config)
+
+
+def _load_celery_config() -> tuple[dict, bool]:
+    """Resolve the Celery config; the flag is set if the database read failed."""
+    resolved: dict[str, str | int | None] = {
+        key: _env_value(env_key) for key, env_key in _CELERY_STR_SETTINGS.items()
+    }
+    for key, (env_key, _default) in _CELERY_INT_SETTINGS.items():
+        resolved[key] = _env_int(env_key)
+
+    # Only keys without an environment override need the database.
+    pending = [key for key, value in resolved.items() if value is None]
+    db_values: dict[str, str] = {}
+    db_failed = False
+    if pending:
+        session = SessionLocal()
+        try:
+            db_values = _get_setting_values(session, SettingDomain.scheduler, pending)
+        except SQLAlchemyError:
+            db_failed = True
+            logger.exception("Failed to load scheduler settings from database.")
+        finally:
+            session.close()
+
+    for key in pending:
+        if key in _CELERY_INT_SETTINGS:
+            resolved[key] = _parse_int(db_values.get(key))
+        else:
+            resolved[key] = db_values.get(key)
+    for key, (_env_key, default) in _CELERY_INT_SETTINGS.items():
+        if resolved[key] is None:
+            resolved[key] = default
+
+    broker = (
+        resolved["broker_url"] or _env_value("REDIS_URL") or "redis://localhost:6379/0"
+    )
+    backend = (
+        resolved["result_backend"]
+        or _env_value("REDIS_URL")
+        or "redis://localhost:6379/1"
+    )
     config: dict[str, object] = {
         "broker_url": broker,
         "result_backend": backend,
-        "timezone": timezone,
-        "beat_max_loop_interval": beat_max_loop_interval,
-        "beat_refresh_seconds": beat_refresh_seconds,
+        "timezone": resolved["timezone"] or "UTC",
+        "beat_max_loop_interval": resolved["beat_max_loop_interval"],
+        "beat_refresh_seconds": resolved["beat_refresh_seconds"],
     }
-    return config
+    return config, db_failed
+
+
+def _schedule_version(session: Session) -> tuple[int, Any]:
+    """Cheap fingerprint of the task table; changes on any insert/update/delete."""
+    count, last_update = session.execute(
+        select(func.count(ScheduledTask.id), func.max(ScheduledTask.updated_at))
+    ).one()
+    return count, last_update
 
 
 def build_beat_schedule() -> dict[str, dict[str, Any]]:
     schedule: dict[str, dict[str, Any]] = {}
     session = SessionLocal()
     try:
-        tasks = list(
-            session.scalars(
-                select(ScheduledTask).where(ScheduledTask.enabled.is_(True))
-            ).all()
+        version = _schedule_version(session)
+        with _cache_lock:
+            if (
+                _schedule_cache["value"] is not None
+                and _schedule_cache["version"] == version
+            ):
+                return dict(_schedule_cache["value"])
+        rows = session.execute(
+            select(
+                ScheduledTask.id,
+                ScheduledTask.task_name,
+                ScheduledTask.interval_seconds,
+                ScheduledTask.args_json,
+                ScheduledTask.kwargs_json,
+            )
+            .where(ScheduledTask.enabled.is_(True))
+            .where(ScheduledTask.schedule_type == ScheduleType.interval)
+            .execution_options(yield_per=500)
         )
-        for task in tasks:
-            if task.schedule_type != ScheduleType.interval:
-                continue
-            interval_seconds = max(task.interval_seconds or 0, 1)
-            schedule[f"scheduled_task_{task.id}"] = {
-                "task": task.task_name,
-                "schedule": timedelta(seconds=interval_seconds),
-                "args": task.args_json or [],
-                "kwargs": task.kwargs_json or {},
+        for task_id, task_name, interval, args_json, kwargs_json in rows:
+            schedule[f"scheduled_task_{task_id}"] = {
+                "task": task_name,
+                "schedule": timedelta(seconds=max(interval or 0, 1)),
+                "args": args_json or [],
+                "kwargs": kwargs_json or {},
             }
     except SQLAlchemyError:
         logger.exception("Failed to build Celery beat schedule.")
+        with _cache_lock:
+            if _schedule_cache["value"] is not None:
+                return dict(_schedule_cache["value"])
+        return {}
     finally:
         session.close()
-    return schedule
+    with _cache_lock:
+        _schedule_cache.update(version=version, value=schedule)
+    return dict(schedule)
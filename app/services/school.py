@@ -2,11 +2,14 @@
 
 import logging
 import re
+import threading
 from datetime import datetime, timezone
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import case, func, select
-from sqlalchemy.orm import Session
+from cachetools import TTLCache
+from sqlalchemy import Select, case, exists, func, select, true
+from sqlalchemy.orm import Session, load_only
 from starlette.datastructures import UploadFile
 
 from app.config import settings
@@ -21,29 +24,97 @@ from app.models.school import (
     SchoolStatus,
 )
 from app.schemas.school import SchoolCreate, SchoolDashboardStats, SchoolUpdate
-from app.services.common import escape_like
+from app.services.common import (
+    contains_pattern,
+    escape_like,
+    fetch_with_total,
+    run_after_commit,
+)
 from app.services.file_upload import FileUploadService
 from app.services.payment_gateway import paystack_gateway
 
 logger = logging.getLogger(__name__)
 
 
+_SLUG_NONWORD = re.compile(r"[^\w\s-]")
+_SLUG_WHITESPACE = re.compile(r"[\s_]+")
+_SLUG_DASHES = re.compile(r"-+")
+_SLUG_SUFFIX = re.compile(r"-(\d+)")
+
+
 def _slugify(name: str) -> str:
-    slug = name.lower().strip()
-    slug = re.sub(r"[^\w\s-]", "", slug)
-    slug = re.sub(r"[\s_]+", "-", slug)
-    slug = re.sub(r"-+", "-", slug).strip("-")
-    return slug
+    slug = _SLUG_NONWORD.sub("", name.lower().strip())
+    slug = _SLUG_WHITESPACE.sub("-", slug)
+    return _SLUG_DASHES.sub("-", slug).strip("-")
 
 
 def _unique_slug(db: Session, name: str) -> str:
+    """Return ``base`` or ``base-N`` using at most two queries."""
     base = _slugify(name)
-    slug = base
-    counter = 1
-    while db.scalar(select(School.id).where(School.slug == slug)):
-        slug = f"{base}-{counter}"
-        counter += 1
-    return slug
+    # Usually the base slug is free: an EXISTS probe on the unique index
+    # answers that without reading any rows.
+    if not db.scalar(select(exists().where(School.slug == base))):
+        return base
+    taken = db.scalars(
+        select(School.slug).where(
+            School.slug.like(f"{escape_like(base)}-%", escape="\\")
+        )
+    )
+    # Every match starts with "base-"; the numeric suffix follows it.
+    counters = [
+        int(match.group(1))
+        for slug in taken
+        if (match := _SLUG_SUFFIX.fullmatch(slug, len(base)))
+    ]
+    return f"{base}-{max(counters, default=0) + 1}"
+
+
+# Columns rendered on a search result card (see SchoolSearchResult).
+_SEARCH_CARD_COLUMNS = (
+    School.id,
+    School.name,
+    School.slug,
+    School.school_type,
+    School.category,
+    School.city,
+    School.state,
+    School.logo_url,
+    School.fee_range_min,
+    School.fee_range_max,
+)
+
+# Average ratings are read on every school page and dashboard view but only
+# change when a parent rates, so keep a short-lived process cache per school.
+# Rating writes clear it on commit in this process; other workers may serve
+# the previous average for up to the TTL.
+_AVG_RATING_CACHE_TTL = 30  # seconds
+_avg_rating_cache: TTLCache[UUID, float | None] = TTLCache(
+    maxsize=5000, ttl=_AVG_RATING_CACHE_TTL
+)
+_avg_rating_lock = threading.Lock()
+
+
+def invalidate_average_rating(school_id: UUID | None = None) -> None:
+    """Drop the cached average rating for one school, or all when None."""
+    with _avg_rating_lock:
+        if school_id is None:
+            _avg_rating_cache.clear()
+        else:
+            _avg_rating_cache.pop(school_id, None)
+
+
+def _school_applications(school_id: UUID, *columns: Any) -> Select[Any]:
+    """Select ``columns`` from the applications to any of a school's forms.
+
+    Joins through ``admission_forms`` so the planner can drive the lookup from
+    the indexed ``school_id``/``admission_form_id`` keys.
+    """
+    return (
+        select(*columns)
+        .select_from(Application)
+        .join(AdmissionForm, AdmissionForm.id == Application.admission_form_id)
+        .where(AdmissionForm.school_id == school_id)
+    )
 
 
 class SchoolService:
@@ -77,32 +148,69 @@ class SchoolService:
         )
 
         # Store bank details if provided
-        if payload.bank_code and payload.account_number:
+        has_bank = bool(payload.bank_code and payload.account_number)
+        if has_bank:
             school.bank_code = payload.bank_code
             school.account_number = payload.account_number
             school.account_name = payload.account_name
-
-            # Create Paystack subaccount if gateway is configured
-            if paystack_gateway.is_configured():
-                try:
-                    commission_pct = settings.schoolnet_commission_rate / 100
-                    result = paystack_gateway.create_subaccount(
-                        business_name=payload.name,
-                        bank_code=payload.bank_code,
-                        account_number=payload.account_number,
-                        percentage_charge=commission_pct,
-                    )
-                    school.paystack_subaccount_code = result["subaccount_code"]
-                    school.bank_name = result.get("settlement_bank")
-                    school.settlement_bank_verified = True
-                except (ValueError, RuntimeError) as e:
-                    logger.warning("Paystack subaccount creation failed: %s", e)
+            school.settlement_bank_verified = False
 
         self.db.add(school)
         self.db.flush()
+        if has_bank:
+            self._queue_subaccount_sync(school)
         logger.info("Created school: %s (slug=%s)", school.id, school.slug)
         return school
 
+    def _queue_subaccount_sync(self, school: School) -> None:
+        """Provision the Paystack subaccount in Celery, off the request path.
+
+        Queued only once the caller commits, so the worker never reads the
+        previous bank details (or a school row that does not exist yet).
+        """
+        if not paystack_gateway.is_configured():
+            return
+        school_id = str(school.id)
+
+        def _enqueue() -> None:
+            try:
+                from app.tasks.paystack import provision_school_subaccount_task
+
+                provision_school_subaccount_task.delay(school_id)
+            except (ImportError, RuntimeError, ValueError) as e:
+                logger.warning("Failed to queue Paystack subaccount sync: %s", e)
+
+        run_after_commit(self.db, _enqueue)
+
+    def sync_paystack_subaccount(self, school: School) -> None:
+        """Create or update the school's Paystack subaccount from its bank details.
+
+        Raises ``RuntimeError`` for transient gateway failures and ``ValueError``
+        when Paystack rejects the details.
+        """
+        if not (school.bank_code and school.account_number):
+            return
+        if school.paystack_subaccount_code:
+            paystack_gateway.update_subaccount(
+                school.paystack_subaccount_code,
+                bank_code=school.bank_code,
+                account_number=school.account_number,
+            )
+        else:
+            commission_pct = (
+                school.commission_rate or settings.schoolnet_commission_rate
+            ) / 100
+            result = paystack_gateway.create_subaccount(
+                business_name=school.name,
+                bank_code=school.bank_code,
+                account_number=school.account_number,
+                percentage_charge=commission_pct,
+            )
+            school.paystack_subaccount_code = result["subaccount_code"]
+            school.bank_name = result.get("settlement_bank")
+        school.settlement_bank_verified = True
+        self.db.flush()
+
     def get_by_id(self, school_id: UUID) -> School | None:
         school: School | None = self.db.get(School, school_id)
         return school
@@ -193,17 +301,23 @@ class SchoolService:
         special_needs: bool | None = None,
         limit: int = 20,
         offset: int = 0,
+        summary: bool = False,
     ) -> tuple[list[School], int]:
+        """Search active schools.
+
+        With ``summary=True`` only the columns a result card shows are loaded;
+        other attributes lazy-load on access, so use it for listing pages only.
+        """
         stmt = select(School).where(
             School.status == SchoolStatus.active,
             School.is_active.is_(True),
         )
-        if query:
-            stmt = stmt.where(School.name.ilike(f"%{escape_like(query)}%"))
-        if state:
-            stmt = stmt.where(School.state.ilike(f"%{escape_like(state)}%"))
-        if city:
-            stmt = stmt.where(School.city.ilike(f"%{escape_like(city)}%"))
+        if query_pattern := contains_pattern(query):
+            stmt = stmt.where(School.name.ilike(query_pattern, escape="\\"))
+        if state_pattern := contains_pattern(state):
+            stmt = stmt.where(School.state.ilike(state_pattern, escape="\\"))
+        if city_pattern := contains_pattern(city):
+            stmt = stmt.where(School.city.ilike(city_pattern, escape="\\"))
         if school_type:
             stmt = stmt.where(School.school_type == school_type)
         if category:
@@ -214,29 +328,25 @@ class SchoolService:
             stmt = stmt.where(School.fee_range_min >= fee_min)
         if fee_max is not None:
             stmt = stmt.where(School.fee_range_max <= fee_max)
-        if religious_affiliation:
+        if religious_pattern := contains_pattern(religious_affiliation):
             stmt = stmt.where(
-                School.religious_affiliation.ilike(
-                    f"%{escape_like(religious_affiliation)}%"
-                )
+                School.religious_affiliation.ilike(religious_pattern, escape="\\")
             )
-        if curriculum_type:
+        if curriculum_pattern := contains_pattern(curriculum_type):
             stmt = stmt.where(
-                School.curriculum_type.ilike(f"%{escape_like(curriculum_type)}%")
+                School.curriculum_type.ilike(curriculum_pattern, escape="\\")
             )
         if special_needs is True:
             stmt = stmt.where(School.special_needs_support.is_(True))
 
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total = self.db.scalar(count_stmt) or 0
-
-        stmt = (
+        page = (
             stmt.order_by(School.is_featured.desc(), School.name)
             .limit(limit)
             .offset(offset)
         )
-        schools = list(self.db.scalars(stmt).all())
-        return schools, total
+        if summary:
+            page = page.options(load_only(*_SEARCH_CARD_COLUMNS))
+        return fetch_with_total(self.db, stmt, page)
 
     def list_active(self, *, limit: int = 200) -> list[School]:
         """Return active schools, ordered by name."""
@@ -288,32 +398,13 @@ class SchoolService:
         for key, value in update_data.items():
             setattr(school, key, value)
 
-        if bank_changed and school.bank_code and school.account_number:
-            if paystack_gateway.is_configured():
-                try:
-                    if school.paystack_subaccount_code:
-                        paystack_gateway.update_subaccount(
-                            school.paystack_subaccount_code,
-                            bank_code=school.bank_code,
-                            account_number=school.account_number,
-                        )
-                    else:
-                        commission_pct = (
-                            school.commission_rate or settings.schoolnet_commission_rate
-                        ) / 100
-                        result = paystack_gateway.create_subaccount(
-                            business_name=school.name,
-                            bank_code=school.bank_code,
-                            account_number=school.account_number,
-                            percentage_charge=commission_pct,
-                        )
-                        school.paystack_subaccount_code = result["subaccount_code"]
-                        school.bank_name = result.get("settlement_bank")
-                    school.settlement_bank_verified = True
-                except (ValueError, RuntimeError) as e:
-                    logger.warning("Paystack subaccount update failed: %s", e)
+        bank_changed = bool(bank_changed and school.bank_code and school.account_number)
+        if bank_changed:
+            school.settlement_bank_verified = False
 
         self.db.flush()
+        if bank_changed:
+            self._queue_subaccount_sync(school)
         logger.info("Updated school: %s", school.id)
         return school
 
@@ -354,12 +445,18 @@ class SchoolService:
         return school
 
     def get_average_rating(self, school_id: UUID) -> float | None:
+        with _avg_rating_lock:
+            if school_id in _avg_rating_cache:
+                return _avg_rating_cache[school_id]
         stmt = select(func.avg(Rating.score)).where(
             Rating.school_id == school_id,
             Rating.is_active.is_(True),
         )
         result = self.db.scalar(stmt)
-        return round(float(result), 1) if result else None
+        average = round(float(result), 1) if result else None
+        with _avg_rating_lock:
+            _avg_rating_cache[school_id] = average
+        return average
 
     def get_ratings(self, school_id: UUID, limit: int = 20) -> list[Rating]:
         stmt = (
@@ -375,15 +472,9 @@ class SchoolService:
         school = self.db.get(School, school_id)
         if not school or not school.student_capacity:
             return
-        form_ids_stmt = select(AdmissionForm.id).where(
-            AdmissionForm.school_id == school_id
-        )
         accepted_count = (
             self.db.scalar(
-                select(func.count())
-                .select_from(Application)
-                .where(
-                    Application.admission_form_id.in_(form_ids_stmt),
+                _school_applications(school_id, func.count()).where(
                     Application.status == ApplicationStatus.accepted,
                     Application.is_active.is_(True),
                 )
@@ -396,8 +487,9 @@ class SchoolService:
             )
 
     def get_dashboard_stats(self, school_id: UUID) -> SchoolDashboardStats:
-        # Forms — single query with conditional counts
-        form_stats = self.db.execute(
+        # Each aggregate is a one-row subquery; joining them on TRUE returns
+        # every figure in a single round trip.
+        form_stats = (
             select(
                 func.count().label("total"),
                 func.count(
@@ -411,16 +503,11 @@ class SchoolService:
                 AdmissionForm.school_id == school_id,
                 AdmissionForm.is_active.is_(True),
             )
-        ).one()
-        total_forms = form_stats.total or 0
-        active_forms = form_stats.active or 0
-
-        # Applications — single query with conditional counts
-        form_ids_stmt = select(AdmissionForm.id).where(
-            AdmissionForm.school_id == school_id
+            .subquery()
         )
-        app_stats = self.db.execute(
-            select(
+        app_stats = (
+            _school_applications(
+                school_id,
                 func.count().label("total"),
                 func.count(
                     case(
@@ -446,43 +533,54 @@ class SchoolService:
                     )
                 ).label("rejected"),
             )
-            .select_from(Application)
+            .where(Application.is_active.is_(True))
+            .subquery()
+        )
+        # Revenue — sum of paid invoices linked to this school's applications.
+        # IN keeps an invoice shared by several applications from counting twice.
+        invoice_ids_stmt = _school_applications(
+            school_id, Application.invoice_id
+        ).where(Application.invoice_id.isnot(None))
+        revenue = (
+            select(func.coalesce(func.sum(Invoice.amount_paid), 0).label("total"))
             .where(
-                Application.admission_form_id.in_(form_ids_stmt),
-                Application.is_active.is_(True),
+                Invoice.id.in_(invoice_ids_stmt),
+                Invoice.status == InvoiceStatus.paid,
             )
-        ).one()
-        total_apps = app_stats.total or 0
-        pending_apps = app_stats.pending or 0
-        accepted_apps = app_stats.accepted or 0
-        rejected_apps = app_stats.rejected or 0
-
-        # Revenue — sum of paid invoices linked to this school's applications
-        invoice_ids_stmt = select(Application.invoice_id).where(
-            Application.admission_form_id.in_(form_ids_stmt),
-            Application.invoice_id.isnot(None),
+            .subquery()
         )
-        total_revenue: int = (
-            self.db.scalar(
-                select(func.coalesce(func.sum(Invoice.amount_paid), 0)).where(
-                    Invoice.id.in_(invoice_ids_stmt),
-                    Invoice.status == InvoiceStatus.paid,
-                )
-            )
-            or 0
+        rating = (
+            select(func.avg(Rating.score).label("average"))
+            .where(Rating.school_id == school_id, Rating.is_active.is_(True))
+            .subquery()
         )
 
-        avg_rating = self.get_average_rating(school_id)
+        row = self.db.execute(
+            select(
+                form_stats.c.total.label("total_forms"),
+                form_stats.c.active.label("active_forms"),
+                app_stats.c.total.label("total_apps"),
+                app_stats.c.pending,
+                app_stats.c.accepted,
+                app_stats.c.rejected,
+                revenue.c.total.label("revenue"),
+                rating.c.average.label("avg_rating"),
+            ).select_from(
+                form_stats.join(app_stats, true())
+                .join(revenue, true())
+                .join(rating, true())
+            )
+        ).one()
 
         return SchoolDashboardStats(
-            total_forms=total_forms,
-            active_forms=active_forms,
-            total_applications=total_apps,
-            pending_applications=pending_apps,
-            accepted_applications=accepted_apps,
-            rejected_applications=rejected_apps,
-            total_revenue=total_revenue,
-            average_rating=avg_rating,
+            total_forms=row.total_forms or 0,
+            active_forms=row.active_forms or 0,
+            total_applications=row.total_apps or 0,
+            pending_applications=row.pending or 0,
+            accepted_applications=row.accepted or 0,
+            rejected_applications=row.rejected or 0,
+            total_revenue=row.revenue or 0,
+            average_rating=round(float(row.avg_rating), 1) if row.avg_rating else None,
         )
 
     def list_payments(
@@ -495,13 +593,9 @@ class SchoolService:
         """List paid invoices for a school's applications."""
         import math
 
-        form_ids_stmt = select(AdmissionForm.id).where(
-            AdmissionForm.school_id == school_id
-        )
-        invoice_ids_stmt = select(Application.invoice_id).where(
-            Application.admission_form_id.in_(form_ids_stmt),
-            Application.invoice_id.isnot(None),
-        )
+        invoice_ids_stmt = _school_applications(
+            school_id, Application.invoice_id
+        ).where(Application.invoice_id.isnot(None))
         stmt = select(Invoice).where(
             Invoice.id.in_(invoice_ids_stmt),
             Invoice.status == InvoiceStatus.paid,
@@ -1,14 +1,52 @@
 import os
+import threading
 from urllib.parse import urlparse
 
 import httpx
+from cachetools import TTLCache
 from fastapi import HTTPException
 
 
+def _cache_ttl() -> int:
+    try:
+        return max(int(os.getenv("OPENBAO_CACHE_TTL", "60")), 0)
+    except ValueError:
+        return 60
+
+
+# Resolved secrets are cached per (server, namespace, kv version, reference)
+# so settings that consult a secret on every request do not round-trip to
+# OpenBao each time. OPENBAO_CACHE_TTL=0 disables caching.
+_secret_cache: TTLCache[tuple[str, str | None, str, str], str] = TTLCache(
+    maxsize=256, ttl=_cache_ttl()
+)
+_cache_lock = threading.Lock()
+_client: httpx.Client | None = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> httpx.Client:
+    """Shared client so connections (and TLS sessions) to OpenBao are pooled."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(timeout=5.0)
+    return _client
+
+
+def clear_secret_cache() -> None:
+    with _cache_lock:
+        _secret_cache.clear()
+
+
+_REF_PREFIXES = ("bao://", "openbao://", "vault://")
+
+
 def is_openbao_ref(value: str | None) -> bool:
     if not value:
         return False
-    return value.startswith(("bao://", "openbao://", "vault://"))
+    return value.startswith(_REF_PREFIXES)
 
 
 def _openbao_config():
@@ -35,6 +73,11 @@ def _parse_ref(reference: str) -> tuple[str, str, str]:
 
 def resolve_openbao_ref(reference: str) -> str:
     addr, token, namespace, kv_version = _openbao_config()
+    cache_key = (addr, namespace, str(kv_version), reference)
+    with _cache_lock:
+        cached = _secret_cache.get(cache_key)
+    if cached is not None:
+        return cached
     mount, path, field = _parse_ref(reference)
     if str(kv_version) == "1":
         url = f"{addr}/v1/{mount}/{path}"
@@ -48,7 +91,7 @@ def resolve_openbao_ref(reference: str) -> str:
     if namespace:
         headers["X-Vault-Namespace"] = namespace
     try:
-        response = httpx.get(url, headers=headers, timeout=5.0)
+        response = _get_client().get(url, headers=headers)
         response.raise_for_status()
     except httpx.HTTPError as exc:
         raise HTTPException(status_code=500, detail="OpenBao request failed") from exc
@@ -57,12 +100,16 @@ def resolve_openbao_ref(reference: str) -> str:
     secret_data = data if str(kv_version) == "1" else data.get("data", {})
     if field not in secret_data:
         raise HTTPException(status_code=500, detail="OpenBao secret field not found")
-    return str(secret_data[field])
+    value = str(secret_data[field])
+    if _secret_cache.ttl:
+        with _cache_lock:
+            _secret_cache[cache_key] = value
+    return value
 
 
 def resolve_secret(value: str | None) -> str | None:
-    if not value:
+    # Hot path for settings reads: plain values (the norm without OpenBao)
+    # return after a single prefix test, with no helper call in between.
+    if not value or not value.startswith(_REF_PREFIXES):
         return value
-    if is_openbao_ref(value):
-        return resolve_openbao_ref(value)
-    return value
+    return resolve_openbao_ref(value)
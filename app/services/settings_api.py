@@ -6,10 +6,21 @@ from app.services import domain_settings as domain_settings_service
 from app.services import settings_spec
 from app.services.response import list_response
 
-
-def _domain_allowed_keys(domain: SettingDomain) -> str:
-    specs = settings_spec.list_specs(domain)
-    return ", ".join(sorted(spec.key for spec in specs))
+# Domains served by this API, resolved to their services once at import so a
+# missing registration fails at startup rather than on the first request.
+_SERVICES = {
+    domain: settings_spec.DOMAIN_SETTINGS_SERVICE[domain]
+    for domain in (
+        SettingDomain.auth,
+        SettingDomain.audit,
+        SettingDomain.scheduler,
+        SettingDomain.billing,
+    )
+}
+_ALLOWED_KEYS = {
+    domain: ", ".join(sorted(spec.key for spec in settings_spec.list_specs(domain)))
+    for domain in _SERVICES
+}
 
 
 def _normalize_spec_setting(
@@ -17,7 +28,7 @@ def _normalize_spec_setting(
 ) -> DomainSettingUpdate:
     spec = settings_spec.get_spec(domain, key)
     if not spec:
-        allowed = _domain_allowed_keys(domain)
+        allowed = _ALLOWED_KEYS[domain]
         raise ValueError(f"Invalid setting key. Allowed: {allowed}")
     value = payload.value_text if payload.value_text is not None else payload.value_json
     if value is None:
@@ -66,10 +77,9 @@ def _list_domain_settings(
     limit: int,
     offset: int,
 ):
-    service = settings_spec.DOMAIN_SETTINGS_SERVICE.get(domain)
-    if not service:
-        raise ValueError("Unknown settings domain")
-    return service.list(db, None, is_active, order_by, order_dir, limit, offset)
+    return _SERVICES[domain].list(
+        db, None, is_active, order_by, order_dir, limit, offset
+    )
 
 
 def _list_domain_settings_response(
@@ -96,21 +106,15 @@ def _upsert_domain_setting(
     db: Session, domain: SettingDomain, key: str, payload: DomainSettingUpdate
 ):
     normalized_payload = _normalize_spec_setting(domain, key, payload)
-    service = settings_spec.DOMAIN_SETTINGS_SERVICE.get(domain)
-    if not service:
-        raise ValueError("Unknown settings domain")
-    return service.upsert_by_key(db, key, normalized_payload)
+    return _SERVICES[domain].upsert_by_key(db, key, normalized_payload)
 
 
 def _get_domain_setting(db: Session, domain: SettingDomain, key: str):
     spec = settings_spec.get_spec(domain, key)
     if not spec:
-        allowed = _domain_allowed_keys(domain)
+        allowed = _ALLOWED_KEYS[domain]
         raise ValueError(f"Invalid setting key. Allowed: {allowed}")
-    service = settings_spec.DOMAIN_SETTINGS_SERVICE.get(domain)
-    if not service:
-        raise ValueError("Unknown settings domain")
-    return service.get_by_key(db, key)
+    return _SERVICES[domain].get_by_key(db, key)
 
 
 def list_auth_settings_response(
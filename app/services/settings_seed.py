@@ -1,280 +1,138 @@
 import logging
 import os
+from typing import cast
 
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from app.models.domain_settings import SettingValueType
+from app.models.domain_settings import SettingDomain
 from app.models.scheduler import ScheduledTask, ScheduleType
-from app.services.domain_settings import (
-    audit_settings,
-    auth_settings,
-    billing_settings,
-    scheduler_settings,
-)
 from app.services.secrets import is_openbao_ref
+from app.services.settings_spec import (
+    DOMAIN_SETTINGS_SERVICE,
+    SettingSpec,
+    list_specs,
+)
 
 logger = logging.getLogger(__name__)
 
+# JSON specs seeded from a comma-separated env var, mapped to whether the
+# items are upper-cased.
+_CSV_SPECS: dict[tuple[SettingDomain, str], bool] = {
+    (SettingDomain.audit, "methods"): True,
+    (SettingDomain.audit, "skip_paths"): False,
+}
+
+# Specs whose env var falls back to another variable, then a literal default.
+_FALLBACK_SPECS: dict[tuple[SettingDomain, str], tuple[str, str]] = {
+    (SettingDomain.scheduler, "broker_url"): ("REDIS_URL", "redis://localhost:6379/0"),
+    (SettingDomain.scheduler, "result_backend"): (
+        "REDIS_URL",
+        "redis://localhost:6379/1",
+    ),
+}
+
 
 def _csv_list(raw: str | None, upper: bool = True) -> list[str] | None:
     if not raw:
         return None
-    items = [item.strip() for item in raw.split(",") if item.strip()]
-    if upper:
-        return [item.upper() for item in items]
-    return items
+    items = [
+        item.upper() if upper else item
+        for part in raw.split(",")
+        if (item := part.strip())
+    ]
+    return items or None
 
 
-def seed_auth_settings(db: Session) -> None:
-    auth_settings.ensure_by_key(
-        db,
-        key="jwt_algorithm",
-        value_type=SettingValueType.string,
-        value_text=os.getenv("JWT_ALGORITHM", "HS256"),
-    )
-    auth_settings.ensure_by_key(
-        db,
-        key="jwt_access_ttl_minutes",
-        value_type=SettingValueType.integer,
-        value_text=os.getenv("JWT_ACCESS_TTL_MINUTES", "15"),
-    )
-    auth_settings.ensure_by_key(
-        db,
-        key="jwt_refresh_ttl_days",
-        value_type=SettingValueType.integer,
-        value_text=os.getenv("JWT_REFRESH_TTL_DAYS", "30"),
-    )
-    auth_settings.ensure_by_key(
-        db,
-        key="refresh_cookie_name",
-        value_type=SettingValueType.string,
-        value_text=os.getenv("REFRESH_COOKIE_NAME", "refresh_token"),
-    )
-    auth_settings.ensure_by_key(
-        db,
-        key="refresh_cookie_secure",
-        value_type=SettingValueType.boolean,
-        value_text=os.getenv("REFRESH_COOKIE_SECURE", "false"),
-    )
-    auth_settings.ensure_by_key(
-        db,
-        key="refresh_cookie_samesite",
-        value_type=SettingValueType.string,
-        value_text=os.getenv("REFRESH_COOKIE_SAMESITE", "lax"),
-    )
-    auth_settings.ensure_by_key(
-        db,
-        key="refresh_cookie_domain",
-        value_type=SettingValueType.string,
-        value_text=os.getenv("REFRESH_COOKIE_DOMAIN"),
-    )
-    auth_settings.ensure_by_key(
-        db,
-        key="refresh_cookie_path",
-        value_type=SettingValueType.string,
-        value_text=os.getenv("REFRESH_COOKIE_PATH", "/auth"),
-    )
-    auth_settings.ensure_by_key(
-        db,
-        key="totp_issuer",
-        value_type=SettingValueType.string,
-        value_text=os.getenv("TOTP_ISSUER", "schoolnet"),
-    )
-    auth_settings.ensure_by_key(
-        db,
-        key="api_key_rate_window_seconds",
-        value_type=SettingValueType.integer,
-        value_text=os.getenv("API_KEY_RATE_WINDOW_SECONDS", "60"),
-    )
-    auth_settings.ensure_by_key(
-        db,
-        key="api_key_rate_max",
-        value_type=SettingValueType.integer,
-        value_text=os.getenv("API_KEY_RATE_MAX", "5"),
-    )
-    auth_settings.ensure_by_key(
-        db,
-        key="default_auth_provider",
-        value_type=SettingValueType.string,
-        value_text=os.getenv("AUTH_DEFAULT_AUTH_PROVIDER", "local"),
-    )
-    jwt_secret = os.getenv("JWT_SECRET")
-    if jwt_secret and is_openbao_ref(jwt_secret):
-        auth_settings.ensure_by_key(
-            db,
-            key="jwt_secret",
-            value_type=SettingValueType.string,
-            value_text=jwt_secret,
-            is_secret=True,
-        )
-    totp_key = os.getenv("TOTP_ENCRYPTION_KEY")
-    if totp_key and is_openbao_ref(totp_key):
-        auth_settings.ensure_by_key(
-            db,
-            key="totp_encryption_key",
-            value_type=SettingValueType.string,
-            value_text=totp_key,
-            is_secret=True,
+def _default_text(default: object | None) -> str | None:
+    if default is None:
+        return None
+    if isinstance(default, bool):
+        return "true" if default else "false"
+    return str(default)
+
+
+def _row_from_spec(spec: SettingSpec) -> dict | None:
+    """Build the ``ensure_many`` row for ``spec``, or None to skip it."""
+    raw = os.getenv(spec.env_var) if spec.env_var else None
+    if spec.is_secret:
+        # Plain secrets stay in the environment; only OpenBao refs are stored.
+        if not (raw and is_openbao_ref(raw)):
+            return None
+        return {
+            "key": spec.key,
+            "value_type": spec.value_type,
+            "value_text": raw,
+            "is_secret": True,
+        }
+    row: dict = {"key": spec.key, "value_type": spec.value_type}
+    spec_id = (spec.domain, spec.key)
+    if spec_id in _CSV_SPECS:
+        row["value_json"] = _csv_list(raw, upper=_CSV_SPECS[spec_id]) or list(
+            cast(list, spec.default)
         )
+    elif spec_id in _FALLBACK_SPECS:
+        fallback_env, fallback = _FALLBACK_SPECS[spec_id]
+        row["value_text"] = raw or os.getenv(fallback_env) or fallback
+    else:
+        row["value_text"] = raw if raw is not None else _default_text(spec.default)
+    return row
+
+
+def _seed_domain(db: Session, domain: SettingDomain) -> None:
+    rows = [row for spec in list_specs(domain) if (row := _row_from_spec(spec))]
+    DOMAIN_SETTINGS_SERVICE[domain].ensure_many(db, rows)
+
+
+def seed_auth_settings(db: Session) -> None:
+    _seed_domain(db, SettingDomain.auth)
 
 
 def seed_audit_settings(db: Session) -> None:
-    audit_settings.ensure_by_key(
-        db,
-        key="enabled",
-        value_type=SettingValueType.boolean,
-        value_text=os.getenv("AUDIT_ENABLED", "true"),
-    )
-    methods_env = os.getenv("AUDIT_METHODS")
-    methods_value = _csv_list(methods_env, upper=True)
-    audit_settings.ensure_by_key(
-        db,
-        key="methods",
-        value_type=SettingValueType.json,
-        value_json=methods_value or ["POST", "PUT", "PATCH", "DELETE"],
-    )
-    skip_paths_env = os.getenv("AUDIT_SKIP_PATHS")
-    skip_paths_value = _csv_list(skip_paths_env, upper=False)
-    audit_settings.ensure_by_key(
-        db,
-        key="skip_paths",
-        value_type=SettingValueType.json,
-        value_json=skip_paths_value or ["/static", "/web", "/health"],
-    )
-    audit_settings.ensure_by_key(
-        db,
-        key="read_trigger_header",
-        value_type=SettingValueType.string,
-        value_text=os.getenv("AUDIT_READ_TRIGGER_HEADER", "x-audit-read"),
-    )
-    audit_settings.ensure_by_key(
-        db,
-        key="read_trigger_query",
-        value_type=SettingValueType.string,
-        value_text=os.getenv("AUDIT_READ_TRIGGER_QUERY", "audit"),
-    )
+    _seed_domain(db, SettingDomain.audit)
 
 
 def seed_scheduler_settings(db: Session) -> None:
-    broker = (
-        os.getenv("CELERY_BROKER_URL")
-        or os.getenv("REDIS_URL")
-        or "redis://localhost:6379/0"
-    )
-    backend = (
-        os.getenv("CELERY_RESULT_BACKEND")
-        or os.getenv("REDIS_URL")
-        or "redis://localhost:6379/1"
-    )
-    scheduler_settings.ensure_by_key(
-        db,
-        key="broker_url",
-        value_type=SettingValueType.string,
-        value_text=broker,
-    )
-    scheduler_settings.ensure_by_key(
-        db,
-        key="result_backend",
-        value_type=SettingValueType.string,
-        value_text=backend,
-    )
-    scheduler_settings.ensure_by_key(
-        db,
-        key="timezone",
-        value_type=SettingValueType.string,
-        value_text=os.getenv("CELERY_TIMEZONE", "UTC"),
-    )
-    scheduler_settings.ensure_by_key(
-        db,
-        key="beat_max_loop_interval",
-        value_type=SettingValueType.integer,
-        value_text=os.getenv("CELERY_BEAT_MAX_LOOP_INTERVAL", "5"),
-    )
-    scheduler_settings.ensure_by_key(
-        db,
-        key="beat_refresh_seconds",
-        value_type=SettingValueType.integer,
-        value_text=os.getenv("CELERY_BEAT_REFRESH_SECONDS", "30"),
-    )
+    _seed_domain(db, SettingDomain.scheduler)
 
 
 def seed_billing_settings(db: Session) -> None:
-    billing_settings.ensure_by_key(
-        db,
-        key="default_currency",
-        value_type=SettingValueType.string,
-        value_text=os.getenv("BILLING_DEFAULT_CURRENCY", "usd"),
-    )
-    billing_settings.ensure_by_key(
-        db,
-        key="tax_rate_percent",
-        value_type=SettingValueType.integer,
-        value_text=os.getenv("BILLING_TAX_RATE_PERCENT", "0"),
-    )
-    billing_settings.ensure_by_key(
-        db,
-        key="invoice_prefix",
-        value_type=SettingValueType.string,
-        value_text=os.getenv("BILLING_INVOICE_PREFIX", "INV-"),
-    )
-    billing_settings.ensure_by_key(
-        db,
-        key="trial_period_days",
-        value_type=SettingValueType.integer,
-        value_text=os.getenv("BILLING_TRIAL_PERIOD_DAYS", "14"),
-    )
-    billing_settings.ensure_by_key(
-        db,
-        key="dunning_max_retries",
-        value_type=SettingValueType.integer,
-        value_text=os.getenv("BILLING_DUNNING_MAX_RETRIES", "3"),
-    )
-    billing_settings.ensure_by_key(
-        db,
-        key="grace_period_days",
-        value_type=SettingValueType.integer,
-        value_text=os.getenv("BILLING_GRACE_PERIOD_DAYS", "3"),
-    )
-    billing_settings.ensure_by_key(
-        db,
-        key="webhook_tolerance_seconds",
-        value_type=SettingValueType.integer,
-        value_text=os.getenv("BILLING_WEBHOOK_TOLERANCE_SECONDS", "300"),
-    )
+    _seed_domain(db, SettingDomain.billing)
+
+
+# Default periodic tasks as (task_name, display name, interval in seconds).
+_DEFAULT_SCHEDULED_TASKS = (
+    ("app.tasks.ads.expire_stale_ads_task", "Expire stale ads", 3600),  # hourly
+    (
+        "app.tasks.notifications.archive_old_notifications_task",
+        "Archive old notifications",
+        86400,  # daily
+    ),
+)
 
 
 def seed_scheduled_tasks(db: Session) -> None:
     """Ensure default scheduled tasks exist."""
-    task_name = "app.tasks.ads.expire_stale_ads_task"
-    existing = db.scalar(
-        select(ScheduledTask).where(ScheduledTask.task_name == task_name)
-    )
-    if not existing:
-        task = ScheduledTask(
-            name="Expire stale ads",
-            task_name=task_name,
-            schedule_type=ScheduleType.interval,
-            interval_seconds=3600,  # hourly
-            enabled=True,
+    existing = set(
+        db.scalars(
+            select(ScheduledTask.task_name).where(
+                ScheduledTask.task_name.in_(
+                    [task_name for task_name, _, _ in _DEFAULT_SCHEDULED_TASKS]
+                )
+            )
         )
-        db.add(task)
-        db.flush()
-        logger.info("Seeded scheduled task: %s", task_name)
-    # Archive old notifications daily
-    archive_task_name = "app.tasks.notifications.archive_old_notifications_task"
-    existing_archive = db.scalar(
-        select(ScheduledTask).where(ScheduledTask.task_name == archive_task_name)
     )
-    if not existing_archive:
-        archive_task = ScheduledTask(
-            name="Archive old notifications",
-            task_name=archive_task_name,
-            schedule_type=ScheduleType.interval,
-            interval_seconds=86400,  # daily
-            enabled=True,
+    for task_name, name, interval_seconds in _DEFAULT_SCHEDULED_TASKS:
+        if task_name in existing:
+            continue
+        db.add(
+            ScheduledTask(
+                name=name,
+                task_name=task_name,
+                schedule_type=ScheduleType.interval,
+                interval_seconds=interval_seconds,
+                enabled=True,
+            )
         )
-        db.add(archive_task)
-        db.flush()
-        logger.info("Seeded scheduled task: %s", archive_task_name)
+        logger.info("Seeded scheduled task: %s", task_name)
     db.commit()
@@ -1,6 +1,8 @@
+import threading
 from dataclasses import dataclass
 from typing import cast
 
+from cachetools import TTLCache
 from fastapi import HTTPException
 
 from app.models.domain_settings import SettingDomain, SettingValueType
@@ -268,18 +270,60 @@ DOMAIN_SETTINGS_SERVICE = {
 }
 
 
+# Specs are static for the process lifetime, so index them once.
+_SPECS_BY_KEY: dict[tuple[SettingDomain, str], SettingSpec] = {
+    (spec.domain, spec.key): spec for spec in SETTINGS_SPECS
+}
+_SPECS_BY_DOMAIN: dict[SettingDomain, list[SettingSpec]] = {}
+for _spec in SETTINGS_SPECS:
+    _SPECS_BY_DOMAIN.setdefault(_spec.domain, []).append(_spec)
+del _spec
+
+
 def get_spec(domain: SettingDomain, key: str) -> SettingSpec | None:
-    for spec in SETTINGS_SPECS:
-        if spec.domain == domain and spec.key == key:
-            return spec
-    return None
+    return _SPECS_BY_KEY.get((domain, key))
 
 
 def list_specs(domain: SettingDomain) -> list[SettingSpec]:
-    return [spec for spec in SETTINGS_SPECS if spec.domain == domain]
+    return list(_SPECS_BY_DOMAIN.get(domain, ()))
+
+
+# Resolved values are read on request paths but change only through
+# DomainSettings writes, which call invalidate_resolved(). The short TTL bounds
+# staleness for writes made by other processes.
+_RESOLVED_CACHE_TTL = 5.0  # seconds
+_resolved_cache: TTLCache[tuple[SettingDomain, str], object | None] = TTLCache(
+    maxsize=256, ttl=_RESOLVED_CACHE_TTL
+)
+_resolved_lock = threading.Lock()
+
+
+def invalidate_resolved(
+    domain: SettingDomain | None = None, key: str | None = None
+) -> None:
+    """Drop cached resolved values for a key, a whole domain, or everything."""
+    with _resolved_lock:
+        if domain is None:
+            _resolved_cache.clear()
+        elif key is not None:
+            _resolved_cache.pop((domain, key), None)
+        else:
+            for cache_key in [k for k in _resolved_cache if k[0] == domain]:
+                _resolved_cache.pop(cache_key, None)
 
 
 def resolve_value(db, domain: SettingDomain, key: str) -> object | None:
+    cache_key = (domain, key)
+    with _resolved_lock:
+        if cache_key in _resolved_cache:
+            return _resolved_cache[cache_key]
+    value = _resolve_uncached(db, domain, key)
+    with _resolved_lock:
+        _resolved_cache[cache_key] = value
+    return value
+
+
+def _resolve_uncached(db, domain: SettingDomain, key: str) -> object | None:
     spec = get_spec(domain, key)
     if not spec:
         return None
@@ -288,7 +332,7 @@ def resolve_value(db, domain: SettingDomain, key: str) -> object | None:
     if service:
         try:
             setting = service.get_by_key(db, key)
-        except HTTPException:
+        except (HTTPException, settings_service.SettingNotFoundError):
             setting = None
     raw = extract_db_value(setting)
     if raw is None:
@@ -340,50 +384,88 @@ def extract_db_value(setting) -> object | None:
     return None
 
 
+_TRUE_STRINGS = frozenset({"1", "true", "yes", "on"})
+_FALSE_STRINGS = frozenset({"0", "false", "no", "off"})
+
+
+def _coerce_bool(raw: object) -> tuple[object | None, str | None]:
+    if isinstance(raw, bool):
+        return raw, None
+    if isinstance(raw, str):
+        normalized = raw.strip().lower()
+        if normalized in _TRUE_STRINGS:
+            return True, None
+        if normalized in _FALSE_STRINGS:
+            return False, None
+    return None, "Value must be boolean"
+
+
+def _coerce_int(raw: object) -> tuple[object | None, str | None]:
+    if isinstance(raw, int):
+        return raw, None
+    if isinstance(raw, str):
+        try:
+            return int(raw), None
+        except ValueError:
+            return None, "Value must be an integer"
+    return None, "Value must be an integer"
+
+
+def _coerce_str(raw: object) -> tuple[object | None, str | None]:
+    if isinstance(raw, str):
+        return raw, None
+    return str(raw), None
+
+
+def _coerce_passthrough(raw: object) -> tuple[object | None, str | None]:
+    return raw, None
+
+
+_COERCERS = {
+    SettingValueType.boolean: _coerce_bool,
+    SettingValueType.integer: _coerce_int,
+    SettingValueType.string: _coerce_str,
+}
+
+
 def coerce_value(spec: SettingSpec, raw: object) -> tuple[object | None, str | None]:
     if raw is None:
         return None, None
-    if spec.value_type == SettingValueType.boolean:
-        if isinstance(raw, bool):
-            return raw, None
-        if isinstance(raw, str):
-            normalized = raw.strip().lower()
-            if normalized in {"1", "true", "yes", "on"}:
-                return True, None
-            if normalized in {"0", "false", "no", "off"}:
-                return False, None
-        return None, "Value must be boolean"
-    if spec.value_type == SettingValueType.integer:
-        if isinstance(raw, int):
-            return raw, None
-        if isinstance(raw, str):
-            try:
-                return int(raw), None
-            except ValueError:
-                return None, "Value must be an integer"
-        return None, "Value must be an integer"
-    if spec.value_type == SettingValueType.string:
-        if isinstance(raw, str):
-            return raw, None
-        return str(raw), None
-    return raw, None
+    return _COERCERS.get(spec.value_type, _coerce_passthrough)(raw)
+
+
+def _normalize_bool(value: object) -> tuple[str | None, object | None]:
+    bool_value = bool(value)
+    return ("true" if bool_value else "false"), bool_value
+
+
+def _normalize_int(value: object) -> tuple[str | None, object | None]:
+    if isinstance(value, bool):
+        return str(int(value)), None
+    if isinstance(value, int):
+        return str(value), None
+    if isinstance(value, str):
+        return str(int(value)), None
+    # Callers should validate types; if they didn't, fail loudly.
+    raise TypeError("integer setting value must be int or str")
+
+
+def _normalize_str(value: object) -> tuple[str | None, object | None]:
+    return str(value), None
+
+
+def _normalize_json(value: object) -> tuple[str | None, object | None]:
+    return None, value
+
+
+_NORMALIZERS = {
+    SettingValueType.boolean: _normalize_bool,
+    SettingValueType.integer: _normalize_int,
+    SettingValueType.string: _normalize_str,
+}
 
 
 def normalize_for_db(
     spec: SettingSpec, value: object
 ) -> tuple[str | None, object | None]:
-    if spec.value_type == SettingValueType.boolean:
-        bool_value = bool(value)
-        return ("true" if bool_value else "false"), bool_value
-    if spec.value_type == SettingValueType.integer:
-        if isinstance(value, bool):
-            return str(int(value)), None
-        if isinstance(value, int):
-            return str(value), None
-        if isinstance(value, str):
-            return str(int(value)), None
-        # Callers should validate types; if they didn't, fail loudly.
-        raise TypeError("integer setting value must be int or str")
-    if spec.value_type == SettingValueType.string:
-        return str(value), None
-    return None, value
+    return _NORMALIZERS.get(spec.value_type, _normalize_json)(value)
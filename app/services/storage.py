@@ -8,8 +8,10 @@ from __future__ import annotations
 
 import logging
 import os
-import uuid
-from abc import ABC, abstractmethod
+import secrets
+import threading
+from collections.abc import Iterable
+from functools import cache
 from pathlib import Path
 from typing import Any, Protocol, cast
 
@@ -30,28 +32,70 @@ try:
 except ImportError:
     S3_EXISTS_EXCEPTIONS = (OSError, RuntimeError, ValueError)
 
+try:
+    import boto3  # type: ignore[import-untyped]
+except ImportError:  # optional: only needed for the S3 backend
+    boto3 = None  # type: ignore[assignment]
+
+# boto3 clients are thread-safe and slow to build (botocore loads the service
+# model), so every S3Storage with the same configuration shares one.
+_s3_clients: dict[tuple[str | None, ...], _S3Client] = {}
+_s3_clients_lock = threading.Lock()
+# S3 DeleteObjects accepts at most 1000 keys per request.
+_S3_DELETE_BATCH = 1000
+
+
+def _new_storage_key(filename: str) -> str:
+    """Prefix ``filename`` with a random token; long names keep only the suffix."""
+    unique = secrets.token_hex(5)
+    if len(filename) <= 80:
+        return f"{unique}_{filename}"
+    return f"{unique}{Path(filename).suffix}"
+
+
+@cache
+def _resolved_base(base_dir: Path) -> tuple[Path, str]:
+    """Resolved upload directory and its ``dir/`` prefix, computed once per path."""
+    base = base_dir.resolve()
+    return base, str(base) + os.sep
+
+
+def _write_atomic(path: Path, content: bytes) -> None:
+    """Write via a temp file and rename, so readers never see a partial file."""
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    try:
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
 
-class StorageBackend(ABC):
-    """Abstract interface for file storage."""
+class StorageBackend(Protocol):
+    """Interface for file storage, satisfied structurally by each backend."""
 
-    @abstractmethod
     def save(self, content: bytes, filename: str, content_type: str) -> str:
         """Save content and return a storage key."""
+        ...
 
-    @abstractmethod
     def delete(self, storage_key: str) -> None:
         """Delete a stored file by its key."""
+        ...
+
+    def delete_many(self, storage_keys: Iterable[str]) -> None:
+        """Delete several stored files, batching where the backend can."""
+        ...
 
-    @abstractmethod
     def get_url(self, storage_key: str) -> str:
         """Return a public URL for the stored file."""
+        ...
 
-    @abstractmethod
     def exists(self, storage_key: str) -> bool:
         """Check whether a file exists in storage."""
+        ...
 
 
-class LocalStorage(StorageBackend):
+class LocalStorage:
     """Store files on the local filesystem."""
 
     def __init__(
@@ -61,15 +105,15 @@ class LocalStorage(StorageBackend):
         self.url_prefix = (url_prefix or settings.storage_url_prefix).rstrip("/")
 
     def save(self, content: bytes, filename: str, content_type: str) -> str:
-        self.base_dir.mkdir(parents=True, exist_ok=True)
-        unique = uuid.uuid4().hex[:10]
-        ext = Path(filename).suffix or ""
-        storage_key = (
-            f"{unique}_{filename}" if len(filename) <= 80 else f"{unique}{ext}"
-        )
+        storage_key = _new_storage_key(filename)
         file_path = self.base_dir / storage_key
-        with open(file_path, "wb") as f:
-            f.write(content)
+        try:
+            _write_atomic(file_path, content)
+        except FileNotFoundError:
+            # Only the first upload (or one after the directory was removed)
+            # pays for creating it.
+            self.base_dir.mkdir(parents=True, exist_ok=True)
+            _write_atomic(file_path, content)
         logger.info("Saved file: %s (%d bytes)", storage_key, len(content))
         return storage_key
 
@@ -79,6 +123,10 @@ class LocalStorage(StorageBackend):
             os.remove(file_path)
             logger.info("Deleted file: %s", storage_key)
 
+    def delete_many(self, storage_keys: Iterable[str]) -> None:
+        for storage_key in storage_keys:
+            self.delete(storage_key)
+
     def get_url(self, storage_key: str) -> str:
         return f"{self.url_prefix}/{storage_key}"
 
@@ -88,17 +136,17 @@ class LocalStorage(StorageBackend):
 
     def _resolve_path(self, storage_key: str) -> Path | None:
         """Resolve and validate a path to prevent directory traversal."""
-        base = self.base_dir.resolve()
+        base, base_prefix = _resolved_base(self.base_dir)
         target = (base / storage_key).resolve()
-        if not str(target).startswith(str(base) + os.sep) and target != base:
+        if not str(target).startswith(base_prefix) and target != base:
             return None
         return target
 
 
-class S3Storage(StorageBackend):
+class S3Storage:
     """Store files in an S3-compatible bucket.
 
-    boto3 is imported lazily so the dependency is optional for local dev.
+    boto3 is optional for local dev; it is only required once S3 is used.
     """
 
     def __init__(
@@ -114,28 +162,30 @@ class S3Storage(StorageBackend):
         self._access_key = access_key or settings.s3_access_key
         self._secret_key = secret_key or settings.s3_secret_key
         self._endpoint_url = endpoint_url or settings.s3_endpoint_url
-        self._client: _S3Client | None = None
 
     def _get_client(self) -> _S3Client:
-        if self._client is None:
-            import boto3  # type: ignore[import-untyped]
-
-            kwargs: dict[str, str] = {
-                "region_name": self.region,
-                "aws_access_key_id": self._access_key,
-                "aws_secret_access_key": self._secret_key,
-            }
-            if self._endpoint_url:
-                kwargs["endpoint_url"] = self._endpoint_url
-            self._client = cast(_S3Client, boto3.client("s3", **kwargs))
-        return self._client
+        key = (self.region, self._access_key, self._secret_key, self._endpoint_url)
+        client = _s3_clients.get(key)
+        if client is not None:
+            return client
+        if boto3 is None:
+            raise ImportError("boto3 is required for the S3 storage backend")
+        with _s3_clients_lock:
+            client = _s3_clients.get(key)
+            if client is None:
+                kwargs: dict[str, str] = {
+                    "region_name": self.region,
+                    "aws_access_key_id": self._access_key,
+                    "aws_secret_access_key": self._secret_key,
+                }
+                if self._endpoint_url:
+                    kwargs["endpoint_url"] = self._endpoint_url
+                client = cast(_S3Client, boto3.client("s3", **kwargs))
+                _s3_clients[key] = client
+        return client
 
     def save(self, content: bytes, filename: str, content_type: str) -> str:
-        unique = uuid.uuid4().hex[:10]
-        ext = Path(filename).suffix or ""
-        storage_key = (
-            f"{unique}_{filename}" if len(filename) <= 80 else f"{unique}{ext}"
-        )
+        storage_key = _new_storage_key(filename)
         client = self._get_client()
         client.put_object(
             Bucket=self.bucket,
@@ -151,6 +201,33 @@ class S3Storage(StorageBackend):
         client.delete_object(Bucket=self.bucket, Key=storage_key)
         logger.info("Deleted file from S3: %s", storage_key)
 
+    def delete_many(self, storage_keys: Iterable[str]) -> None:
+        keys = list(storage_keys)
+        if not keys:
+            return
+        client = self._get_client()
+        failed: list[str] = []
+        for start in range(0, len(keys), _S3_DELETE_BATCH):
+            batch = keys[start : start + _S3_DELETE_BATCH]
+            response = client.delete_objects(
+                Bucket=self.bucket,
+                Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+            )
+            # In quiet mode the response lists only the keys that failed.
+            for error in response.get("Errors", []):
+                logger.warning(
+                    "Failed to delete file from S3: %s (%s: %s)",
+                    error.get("Key"),
+                    error.get("Code"),
+                    error.get("Message"),
+                )
+                failed.append(error.get("Key"))
+        logger.info("Deleted %d files from S3", len(keys) - len(failed))
+        if failed:
+            raise RuntimeError(
+                f"Failed to delete {len(failed)} of {len(keys)} files from S3"
+            )
+
     def get_url(self, storage_key: str) -> str:
         if self._endpoint_url:
             return f"{self._endpoint_url}/{self.bucket}/{storage_key}"
@@ -165,8 +242,12 @@ class S3Storage(StorageBackend):
             return False
 
 
+@cache
 def get_storage_backend() -> StorageBackend:
-    """Return the configured storage backend instance."""
+    """Return the configured storage backend, built once per process.
+
+    Backends hold only configuration, so one instance serves every request.
+    """
     backend = settings.storage_backend
     if backend == "s3":
         return S3Storage()
@@ -177,4 +258,5 @@ class _S3Client(Protocol):
     # Minimal subset of the boto3 S3 client we rely on.
     def put_object(self, **kwargs: Any) -> Any: ...
     def delete_object(self, **kwargs: Any) -> Any: ...
+    def delete_objects(self, **kwargs: Any) -> Any: ...
     def head_object(self, **kwargs: Any) -> Any: ...
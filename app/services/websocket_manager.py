@@ -2,20 +2,31 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 from uuid import UUID
 
-from starlette.websockets import WebSocket, WebSocketState
+import orjson
+from starlette.websockets import WebSocket, WebSocketDisconnect
 
 logger = logging.getLogger(__name__)
 
+# Raised by a send on a socket that has gone away; the connection is dropped.
+_DEAD_SOCKET_ERRORS = (RuntimeError, ValueError, TypeError, WebSocketDisconnect)
+
+
+def _dumps(data: dict) -> str:
+    # orjson is several times faster than json.dumps. The browser client calls
+    # JSON.parse(event.data), so payloads still go out as text frames.
+    return orjson.dumps(data).decode()
+
 
 class ConnectionManager:
     """Tracks active WebSocket connections per person."""
 
     def __init__(self) -> None:
-        self._connections: dict[str, set[WebSocket]] = {}
+        # A person rarely has more than a few sockets, so a list beats a set.
+        self._connections: dict[str, list[WebSocket]] = {}
 
     async def connect(
         self,
@@ -28,47 +39,55 @@ class ConnectionManager:
             await websocket.accept(subprotocol=subprotocol)
         else:
             await websocket.accept()
-        key = str(person_id)
-        if key not in self._connections:
-            self._connections[key] = set()
-        self._connections[key].add(websocket)
+        self._connections.setdefault(str(person_id), []).append(websocket)
         logger.debug("WebSocket connected: person=%s", person_id)
 
     def disconnect(self, person_id: UUID, websocket: WebSocket) -> None:
         """Remove a WebSocket connection."""
         key = str(person_id)
         connections = self._connections.get(key)
-        if connections:
-            connections.discard(websocket)
+        if connections and websocket in connections:
+            connections.remove(websocket)
             if not connections:
                 del self._connections[key]
         logger.debug("WebSocket disconnected: person=%s", person_id)
 
     async def send_to_person(self, person_id: UUID, data: dict) -> None:
         """Send a JSON message to all connections for a person."""
-        key = str(person_id)
-        connections = self._connections.get(key, set())
-        dead: list[WebSocket] = []
-        for ws in connections:
-            try:
-                if ws.client_state == WebSocketState.CONNECTED:
-                    await ws.send_text(json.dumps(data))
-            except (RuntimeError, ValueError, TypeError):
-                dead.append(ws)
-        for ws in dead:
-            connections.discard(ws)
-        if key in self._connections and not self._connections[key]:
-            del self._connections[key]
+        await self._send_text(str(person_id), _dumps(data))
 
     async def broadcast(self, data: dict) -> None:
         """Send a JSON message to all connected clients."""
-        for person_id in list(self._connections.keys()):
-            await self.send_to_person(UUID(person_id), data)
+        message = _dumps(data)
+        await asyncio.gather(
+            *(self._send_text(key, message) for key in list(self._connections))
+        )
+
+    async def _send_text(self, key: str, message: str) -> None:
+        # Sends run concurrently, so one slow socket does not delay the others;
+        # the snapshot keeps connects/disconnects during the awaits safe. There
+        # is no client_state pre-check: a closed socket fails its send and is
+        # dropped below.
+        connections = self._connections.get(key)
+        if not connections:
+            return
+        targets = list(connections)
+        results = await asyncio.gather(
+            *(ws.send_text(message) for ws in targets), return_exceptions=True
+        )
+        for ws, result in zip(targets, results, strict=True):
+            if isinstance(result, _DEAD_SOCKET_ERRORS):
+                if ws in connections:
+                    connections.remove(ws)
+            elif isinstance(result, BaseException):
+                raise result
+        if key in self._connections and not self._connections[key]:
+            del self._connections[key]
 
     def get_connection_count(self, person_id: UUID | None = None) -> int:
         """Get the number of active connections."""
         if person_id is not None:
-            return len(self._connections.get(str(person_id), set()))
+            return len(self._connections.get(str(person_id), ()))
         return sum(len(conns) for conns in self._connections.values())
 
 
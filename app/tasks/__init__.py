@@ -9,6 +9,7 @@ from app.tasks.notifications import (
     send_notification_email_task,
     send_payment_receipt_email_task,
 )
+from app.tasks.paystack import provision_school_subaccount_task
 
 __all__: list[str] = [
     "expire_stale_ads_task",
@@ -18,4 +19,5 @@ __all__: list[str] = [
     "send_payment_receipt_email_task",
     "send_new_application_email_task",
     "send_daily_admissions_reminders_task",
+    "provision_school_subaccount_task",
 ]
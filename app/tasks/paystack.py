@@ -0,0 +1,40 @@
+"""Celery tasks for Paystack account provisioning."""
+
+import logging
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.celery_app import celery_app
+from app.db import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(bind=True, max_retries=5)
+def provision_school_subaccount_task(self, school_id: str) -> dict:
+    """Create or update a school's Paystack subaccount from its bank details."""
+    db: Session | None = None
+    try:
+        db = SessionLocal()
+        from app.models.school import School
+        from app.services.school import SchoolService
+
+        school = db.get(School, UUID(school_id))
+        if school is None:
+            # Queued after commit, so a missing row was deleted in the meantime.
+            logger.warning("School %s no longer exists; skipping sync", school_id)
+            return {"success": False, "school_id": school_id}
+        SchoolService(db).sync_paystack_subaccount(school)
+        db.commit()
+        logger.info("Paystack subaccount synced for school %s", school_id)
+        return {"success": True, "school_id": school_id}
+    except RuntimeError as exc:
+        logger.warning("Paystack subaccount sync failed (retrying): %s", exc)
+        raise self.retry(exc=exc, countdown=60 * (2**self.request.retries))
+    except ValueError as exc:
+        logger.warning("Paystack rejected subaccount for %s: %s", school_id, exc)
+        return {"success": False, "school_id": school_id}
+    finally:
+        if db:
+            db.close()
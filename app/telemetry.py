@@ -3,16 +3,28 @@ import os
 
 logger = logging.getLogger(__name__)
 
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in _TRUTHY
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        return default
+
 
 def setup_otel(app) -> None:
-    enabled = os.getenv("OTEL_ENABLED", "false").lower() in {"1", "true", "yes", "on"}
-    if not enabled:
+    if not _env_flag("OTEL_ENABLED", False):
         return
     try:
         from opentelemetry import trace
-        from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
-            OTLPSpanExporter,
-        )
         from opentelemetry.instrumentation.celery import CeleryInstrumentor
         from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
         from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
@@ -21,6 +33,18 @@ def setup_otel(app) -> None:
         from opentelemetry.sdk.trace.export import BatchSpanProcessor
 
         from app.db import get_engine
+
+        # gRPC keeps one HTTP/2 channel open to the collector; set
+        # OTEL_EXPORTER_OTLP_PROTOCOL=http/protobuf for HTTP-only collectors.
+        protocol = os.getenv("OTEL_EXPORTER_OTLP_PROTOCOL", "grpc").lower()
+        if protocol.startswith("http"):
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+                OTLPSpanExporter,
+            )
+        else:
+            from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import (
+                OTLPSpanExporter,
+            )
     except Exception:
         logger.exception("OpenTelemetry dependencies not available.")
         return
@@ -32,9 +56,18 @@ def setup_otel(app) -> None:
     trace.set_tracer_provider(provider)
 
     exporter = OTLPSpanExporter(endpoint=endpoint) if endpoint else OTLPSpanExporter()
-    processor = BatchSpanProcessor(exporter)
+    # Larger, less frequent batches amortize export calls; the standard
+    # OTEL_BSP_* variables still override these defaults.
+    processor = BatchSpanProcessor(
+        exporter,
+        max_queue_size=_env_int("OTEL_BSP_MAX_QUEUE_SIZE", 4096),
+        schedule_delay_millis=_env_int("OTEL_BSP_SCHEDULE_DELAY", 2000),
+        max_export_batch_size=_env_int("OTEL_BSP_MAX_EXPORT_BATCH_SIZE", 512),
+    )
     provider.add_span_processor(processor)
 
     FastAPIInstrumentor.instrument_app(app)
-    SQLAlchemyInstrumentor().instrument(engine=get_engine())
+    # Query spans add a wrapper frame to every cursor execute; allow opting out.
+    if _env_flag("OTEL_DB_INSTRUMENT", True):
+        SQLAlchemyInstrumentor().instrument(engine=get_engine())
     CeleryInstrumentor().instrument()
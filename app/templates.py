@@ -6,56 +6,108 @@ instead of creating ad-hoc ``Jinja2Templates`` instances.
 
 from __future__ import annotations
 
-import html
+import os
 import re
 from datetime import date, datetime, timezone
+from functools import lru_cache
 
 from fastapi.templating import Jinja2Templates
-from markupsafe import Markup
+from jinja2 import FileSystemBytecodeCache
+from markupsafe import Markup, escape
+
+from app.config import settings
 
 templates = Jinja2Templates(directory="templates")
 
+if settings.jinja_bytecode_cache_dir:
+    # Compiled templates survive worker restarts; entries are keyed on the
+    # source checksum, so edited templates are still recompiled.
+    os.makedirs(settings.jinja_bytecode_cache_dir, exist_ok=True)
+    templates.env.bytecode_cache = FileSystemBytecodeCache(
+        settings.jinja_bytecode_cache_dir
+    )
+
+# Parsed templates are kept in the environment's cache; in production the
+# files only change on deploy, so skip the per-render mtime check too.
+templates.env.auto_reload = os.getenv("ENVIRONMENT", "dev") != "production"
+
+_HTML_TAG = re.compile(r"<[^>]+>")
+
 
 # ── Filters ──────────────────────────────────────────────
+#
+# List pages run the same filters over many repeated values (statuses,
+# amounts), so the pure ones are memoized. ``_timeago`` depends on the clock
+# and the date filters depend on tzinfo that equal datetimes do not share, so
+# those are left uncached.
 
 
-def _sanitize_html(value: str | None) -> str:
+def _sanitize_html(value: str | None) -> Markup:
     """Strip all HTML tags from user content. Safe for template output."""
     if not value:
-        return ""
-    # Remove HTML tags
-    clean = re.sub(r"<[^>]+>", "", str(value))
-    return html.escape(clean)
+        return Markup("")
+    return _strip_and_escape(str(value))
+
+
+@lru_cache(maxsize=4096)
+def _strip_and_escape(value: str) -> Markup:
+    # Remove HTML tags; the escaped result is Markup so Jinja does not
+    # escape it a second time.
+    return escape(_HTML_TAG.sub("", value))
 
 
 def _nl2br(value: str | None) -> Markup:
     """Convert newlines to ``<br>`` tags for display."""
     if not value:
         return Markup("")
-    escaped = html.escape(str(value))
-    return Markup(escaped.replace("\n", "<br>\n"))  # noqa: S704
-
-
-def _format_date(value: date | datetime | None, fmt: str = "%d %b %Y") -> str:
+    return escape(str(value)).replace("\n", Markup("<br>\n"))
+
+
+_MONTHS = (
+    "Jan",
+    "Feb",
+    "Mar",
+    "Apr",
+    "May",
+    "Jun",
+    "Jul",
+    "Aug",
+    "Sep",
+    "Oct",
+    "Nov",
+    "Dec",
+)
+_DATE_FMT = "%d %b %Y"
+_DATETIME_FMT = "%d %b %Y %H:%M"
+
+
+def _format_date(value: date | datetime | None, fmt: str = _DATE_FMT) -> str:
     """Format a date/datetime for display. Returns empty string for None."""
     if value is None:
         return ""
-    if isinstance(value, datetime):
-        return value.strftime(fmt)
-    if isinstance(value, date):
-        return value.strftime(fmt)
-    return str(value)
+    if not isinstance(value, date):
+        return str(value)
+    if fmt == _DATE_FMT:
+        # The default pattern is built directly, skipping strftime's parser.
+        return f"{value.day:02d} {_MONTHS[value.month - 1]} {value.year}"
+    return value.strftime(fmt)
 
 
-def _format_datetime(value: datetime | None, fmt: str = "%d %b %Y %H:%M") -> str:
+def _format_datetime(value: datetime | None, fmt: str = _DATETIME_FMT) -> str:
     """Format a datetime with time component."""
     if value is None:
         return ""
-    if isinstance(value, datetime):
-        return value.strftime(fmt)
-    return str(value)
+    if not isinstance(value, datetime):
+        return str(value)
+    if fmt == _DATETIME_FMT:
+        return (
+            f"{value.day:02d} {_MONTHS[value.month - 1]} {value.year} "
+            f"{value.hour:02d}:{value.minute:02d}"
+        )
+    return value.strftime(fmt)
 
 
+@lru_cache(maxsize=4096)
 def _format_currency(
     value: float | int | None,
     symbol: str = "$",
@@ -68,6 +120,7 @@ def _format_currency(
     return f"{symbol}{formatted}"
 
 
+@lru_cache(maxsize=4096)
 def _format_naira(value: float | int | None, from_kobo: bool = True) -> str:
     """Format a number as Nigerian Naira (₦).
 
@@ -81,6 +134,7 @@ def _format_naira(value: float | int | None, from_kobo: bool = True) -> str:
     return f"\u20a6{amount:,.0f}"
 
 
+@lru_cache(maxsize=4096)
 def _format_number(value: float | int | None, decimals: int = 2) -> str:
     """Format a number with thousands separators."""
     if value is None:
@@ -88,6 +142,17 @@ def _format_number(value: float | int | None, decimals: int = 2) -> str:
     return f"{value:,.{decimals}f}"
 
 
+# (exclusive upper bound, unit, suffix) in seconds, checked in order; months
+# are 30 days and stop at 12 of them.
+_TIMEAGO_STEPS = (
+    (3600, 60, "m"),
+    (86400, 3600, "h"),
+    (30 * 86400, 86400, "d"),
+    (12 * 30 * 86400, 30 * 86400, "mo"),
+)
+_SECONDS_PER_YEAR = 365 * 86400
+
+
 def _timeago(value: datetime | None) -> str:
     """Produce a human-readable 'time ago' string."""
     if value is None:
@@ -100,20 +165,10 @@ def _timeago(value: datetime | None) -> str:
 
     if seconds < 60:
         return "just now"
-    minutes = seconds // 60
-    if minutes < 60:
-        return f"{minutes}m ago"
-    hours = minutes // 60
-    if hours < 24:
-        return f"{hours}h ago"
-    days = hours // 24
-    if days < 30:
-        return f"{days}d ago"
-    months = days // 30
-    if months < 12:
-        return f"{months}mo ago"
-    years = days // 365
-    return f"{years}y ago"
+    for limit, unit, suffix in _TIMEAGO_STEPS:
+        if seconds < limit:
+            return f"{seconds // unit}{suffix} ago"
+    return f"{seconds // _SECONDS_PER_YEAR}y ago"
 
 
 # ── Register filters ─────────────────────────────────────
@@ -3,11 +3,13 @@
 import logging
 
 from fastapi import APIRouter, Depends, Query, Request
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.orm import Session, load_only
 from starlette.responses import RedirectResponse, Response
 
 from app.api.deps import get_db
-from app.services.common import require_uuid
+from app.models.school import School
+from app.services.common import fetch_with_total, require_uuid
 from app.services.school import SchoolService
 from app.templates import templates
 from app.web.schoolnet_deps import require_platform_admin_auth
@@ -24,19 +26,29 @@ def list_schools(
     db: Session = Depends(get_db),
     auth: dict = Depends(require_platform_admin_auth),
 ) -> Response:
-    from sqlalchemy import func, select
-
-    from app.models.school import School
-
     limit = 20
     offset = (page - 1) * limit
 
     base = select(School).where(School.is_active.is_(True))
     if status:
         base = base.where(School.status == status)
-    total: int = db.scalar(select(func.count()).select_from(base.subquery())) or 0
-    stmt = base.order_by(School.created_at.desc()).limit(limit).offset(offset)
-    schools = list(db.scalars(stmt).all())
+    page_stmt = (
+        base.options(
+            # Only the columns the list table renders.
+            load_only(
+                School.name,
+                School.school_type,
+                School.city,
+                School.state,
+                School.status,
+                School.created_at,
+            )
+        )
+        .order_by(School.created_at.desc())
+        .limit(limit)
+        .offset(offset)
+    )
+    schools, total = fetch_with_total(db, base, page_stmt)
     total_pages = (total + limit - 1) // limit if total else 1
 
     return templates.TemplateResponse(
@@ -7,13 +7,14 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import HTMLResponse
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db
 from app.models.audit import AuditActorType, AuditEvent
 from app.services.audit import audit_events
 from app.services.branding_context import load_branding_context
+from app.services.common import keyset_page, valid_cursor
 from app.templates import templates
 from app.web.schoolnet_deps import require_platform_admin_auth
 
@@ -23,6 +24,8 @@ router = APIRouter(prefix="/admin/audit", tags=["web-audit"])
 
 PAGE_SIZE = 25
 
+ACTOR_TYPES = tuple(at.value for at in AuditActorType)
+
 
 def _base_context(
     request: Request,
@@ -52,18 +55,18 @@ def list_audit_events(
     action: str | None = None,
     entity_type: str | None = None,
     actor_type: str | None = None,
+    cursor: str | None = None,
     db: Session = Depends(get_db),
     auth: dict = Depends(require_platform_admin_auth),
 ) -> HTMLResponse:
-    """List audit events with pagination and filtering."""
+    """List audit events with pagination and filtering.
+
+    "Next" links carry a keyset cursor, so deep pages skip the OFFSET scan.
+    """
     page = max(1, page)
     offset = (page - 1) * PAGE_SIZE
 
-    query = (
-        select(AuditEvent)
-        .where(AuditEvent.is_active.is_(True))
-        .order_by(AuditEvent.occurred_at.desc())
-    )
+    query = select(AuditEvent).where(AuditEvent.is_active.is_(True))
 
     if action:
         query = query.where(AuditEvent.action == action)
@@ -76,16 +79,17 @@ def list_audit_events(
         except ValueError:
             pass  # Ignore invalid actor_type filter
 
-    total = (
-        db.scalar(select(func.count()).select_from(query.order_by(None).subquery()))
-        or 0
+    items, total, next_cursor = keyset_page(
+        db,
+        query,
+        AuditEvent.occurred_at,
+        AuditEvent.id,
+        limit=PAGE_SIZE,
+        offset=offset,
+        cursor=valid_cursor(cursor),
     )
-    items = list(db.scalars(query.limit(PAGE_SIZE).offset(offset)).all())
     total_pages = max(1, (total + PAGE_SIZE - 1) // PAGE_SIZE)
 
-    # Collect distinct values for filter dropdowns
-    actor_types = [at.value for at in AuditActorType]
-
     ctx = _base_context(request, db, auth, title="Audit Log", page_title="Audit Log")
     ctx.update(
         {
@@ -93,10 +97,11 @@ def list_audit_events(
             "total": total,
             "page": page,
             "total_pages": total_pages,
+            "next_cursor": next_cursor,
             "action_filter": action or "",
             "entity_type_filter": entity_type or "",
             "actor_type_filter": actor_type or "",
-            "actor_types": actor_types,
+            "actor_types": ACTOR_TYPES,
         }
     )
     return templates.TemplateResponse("admin/audit/list.html", ctx)
@@ -3,8 +3,6 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
-from urllib.parse import quote_plus
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Form, Request
@@ -15,8 +13,10 @@ from app.api.deps import get_db
 from app.schemas.billing import CouponCreate, CouponUpdate
 from app.services import billing as billing_service
 from app.services.branding_context import load_branding_context
+from app.services.common import valid_cursor
 from app.templates import templates
-from app.web.form_utils import as_int
+from app.web.flash import redirect_with_flash
+from app.web.form_utils import form_values
 from app.web.schoolnet_deps import require_platform_admin_auth
 
 logger = logging.getLogger(__name__)
@@ -54,10 +54,14 @@ def list_coupons(
     request: Request,
     page: int = 1,
     valid: str | None = None,
+    cursor: str | None = None,
     db: Session = Depends(get_db),
     auth: dict = Depends(require_platform_admin_auth),
 ) -> HTMLResponse:
-    """List coupons with pagination and optional valid filter."""
+    """List coupons with pagination and optional valid filter.
+
+    "Next" links carry a keyset cursor, so deep pages skip the OFFSET scan.
+    """
     page = max(1, page)
     offset = (page - 1) * PAGE_SIZE
     valid_filter: bool | None = None
@@ -65,7 +69,7 @@ def list_coupons(
         valid_filter = True
     elif valid == "false":
         valid_filter = False
-    items, total = billing_service.coupons.list(
+    items, total, next_cursor = billing_service.coupons.list(
         db,
         valid=valid_filter,
         code=None,
@@ -73,6 +77,7 @@ def list_coupons(
         order_dir="desc",
         limit=PAGE_SIZE,
         offset=offset,
+        cursor=valid_cursor(cursor),
     )
     total_pages = max(1, (total + PAGE_SIZE - 1) // PAGE_SIZE)
     ctx = _base_context(request, db, auth, title="Coupons", page_title="Coupons")
@@ -82,6 +87,7 @@ def list_coupons(
             "total": total,
             "page": page,
             "total_pages": total_pages,
+            "next_cursor": next_cursor,
             "valid_filter": valid or "",
             "success": request.query_params.get("success"),
             "error": request.query_params.get("error"),
@@ -137,24 +143,7 @@ def create_coupon_submit(
     }
 
     try:
-        redeem_by_val: datetime | None = None
-        if redeem_by:
-            redeem_by_val = datetime.fromisoformat(redeem_by)
-
-        payload = CouponCreate(
-            name=name,
-            code=code,
-            percent_off=as_int(percent_off) if percent_off else None,
-            amount_off=as_int(amount_off) if amount_off else None,
-            currency=currency if currency else None,
-            duration=duration,  # type: ignore[arg-type]
-            duration_in_months=as_int(duration_in_months)
-            if duration_in_months
-            else None,
-            max_redemptions=as_int(max_redemptions) if max_redemptions else None,
-            valid=valid == "on",
-            redeem_by=redeem_by_val,
-        )
+        payload = CouponCreate.model_validate(form_values(data, checkboxes=("valid",)))
         billing_service.coupons.create(db, payload)
         db.commit()
         logger.info("Created coupon via web: %s", payload.code)
@@ -226,25 +215,20 @@ def edit_coupon_submit(
 ) -> RedirectResponse | HTMLResponse:
     """Handle coupon edit form submission."""
     _ = csrf_token
+    data = {
+        "name": name,
+        "percent_off": percent_off,
+        "amount_off": amount_off,
+        "currency": currency,
+        "duration": duration,
+        "duration_in_months": duration_in_months,
+        "max_redemptions": max_redemptions,
+        "valid": valid,
+        "redeem_by": redeem_by,
+    }
 
     try:
-        redeem_by_val: datetime | None = None
-        if redeem_by:
-            redeem_by_val = datetime.fromisoformat(redeem_by)
-
-        payload = CouponUpdate(
-            name=name if name else None,
-            percent_off=as_int(percent_off) if percent_off else None,
-            amount_off=as_int(amount_off) if amount_off else None,
-            currency=currency if currency else None,
-            duration=duration if duration else None,  # type: ignore[arg-type]
-            duration_in_months=as_int(duration_in_months)
-            if duration_in_months
-            else None,
-            max_redemptions=as_int(max_redemptions) if max_redemptions else None,
-            valid=valid == "on",
-            redeem_by=redeem_by_val,
-        )
+        payload = CouponUpdate.model_validate(form_values(data, checkboxes=("valid",)))
         billing_service.coupons.update(db, str(item_id), payload)
         db.commit()
         logger.info("Updated coupon via web: %s", item_id)
@@ -280,14 +264,10 @@ def delete_coupon(
         billing_service.coupons.delete(db, str(item_id))
         db.commit()
         logger.info("Deleted coupon via web: %s", item_id)
-        return RedirectResponse(
-            url="/admin/billing/coupons?success=Coupon+deleted+successfully",
-            status_code=302,
+        return redirect_with_flash(
+            "/admin/billing/coupons", success="Coupon deleted successfully"
         )
     except (ValueError, TypeError, KeyError) as exc:
         db.rollback()
         logger.warning("Failed to delete coupon %s: %s", item_id, exc)
-        return RedirectResponse(
-            url=f"/admin/billing/coupons?error={quote_plus(str(exc))}",
-            status_code=302,
-        )
+        return redirect_with_flash("/admin/billing/coupons", error=str(exc))
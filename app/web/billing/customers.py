@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-from urllib.parse import quote_plus
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Form, Request
@@ -14,8 +13,10 @@ from app.api.deps import get_db
 from app.schemas.billing import CustomerCreate, CustomerUpdate
 from app.services import billing as billing_service
 from app.services.branding_context import load_branding_context
+from app.services.common import valid_cursor
 from app.templates import templates
-from app.web.form_utils import as_int
+from app.web.flash import redirect_with_flash
+from app.web.form_utils import form_values
 from app.web.schoolnet_deps import require_platform_admin_auth
 
 logger = logging.getLogger(__name__)
@@ -23,6 +24,8 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/admin/billing/customers", tags=["web-billing-customers"])
 
 PAGE_SIZE = 25
+# Detail page cap for each related list, applied in SQL.
+RELATED_LIMIT = 50
 
 
 def _base_context(
@@ -52,10 +55,14 @@ def list_customers(
     page: int = 1,
     email: str | None = None,
     is_active: str | None = None,
+    cursor: str | None = None,
     db: Session = Depends(get_db),
     auth: dict = Depends(require_platform_admin_auth),
 ) -> HTMLResponse:
-    """List customers with pagination and optional email search."""
+    """List customers with pagination and optional email search.
+
+    "Next" links carry a keyset cursor, so deep pages skip the OFFSET scan.
+    """
     page = max(1, page)
     offset = (page - 1) * PAGE_SIZE
     active_filter: bool | None = None
@@ -63,7 +70,7 @@ def list_customers(
         active_filter = True
     elif is_active == "false":
         active_filter = False
-    items, total = billing_service.customers.list(
+    items, total, next_cursor = billing_service.customers.list(
         db,
         person_id=None,
         email=email,
@@ -72,6 +79,7 @@ def list_customers(
         order_dir="desc",
         limit=PAGE_SIZE,
         offset=offset,
+        cursor=valid_cursor(cursor),
     )
     total_pages = max(1, (total + PAGE_SIZE - 1) // PAGE_SIZE)
     ctx = _base_context(request, db, auth, title="Customers", page_title="Customers")
@@ -81,6 +89,7 @@ def list_customers(
             "total": total,
             "page": page,
             "total_pages": total_pages,
+            "next_cursor": next_cursor,
             "email_filter": email or "",
             "is_active_filter": is_active or "",
             "success": request.query_params.get("success"),
@@ -129,15 +138,12 @@ def create_customer_submit(
         "is_active": is_active,
     }
 
+    ctx = _base_context(
+        request, db, auth, title="Create Customer", page_title="Create Customer"
+    )
     try:
-        payload = CustomerCreate(
-            name=name,
-            email=email,
-            currency=currency,
-            balance=as_int(balance) or 0,
-            tax_id=tax_id if tax_id else None,
-            external_id=external_id if external_id else None,
-            is_active=is_active == "on",
+        payload = CustomerCreate.model_validate(
+            form_values(data, checkboxes=("is_active",), drop_blank=True)
         )
         billing_service.customers.create(db, payload)
         db.commit()
@@ -149,11 +155,7 @@ def create_customer_submit(
     except (ValueError, TypeError, KeyError) as exc:
         db.rollback()
         logger.warning("Failed to create customer: %s", exc)
-        ctx = _base_context(
-            request, db, auth, title="Create Customer", page_title="Create Customer"
-        )
-        ctx["error"] = str(exc)
-        ctx["form_data"] = data
+        ctx.update({"error": str(exc), "form_data": data})
         return templates.TemplateResponse("admin/billing/customers/create.html", ctx)
 
 
@@ -170,30 +172,26 @@ def customer_detail(
         request, db, auth, title=item.name, page_title="Customer Detail"
     )
     ctx["customer"] = item
-    # Load related subscriptions
-    subs, _ = billing_service.subscriptions.list(
+    ctx["subscriptions"], _ = billing_service.subscriptions.list(
         db,
         customer_id=str(item_id),
         status=None,
         is_active=None,
         order_by="created_at",
         order_dir="desc",
-        limit=50,
+        limit=RELATED_LIMIT,
         offset=0,
     )
-    ctx["subscriptions"] = subs
-    # Load related payment methods
-    pms, _ = billing_service.payment_methods.list(
+    ctx["payment_methods"], _ = billing_service.payment_methods.list(
         db,
         customer_id=str(item_id),
         type=None,
         is_active=None,
         order_by="created_at",
         order_dir="desc",
-        limit=50,
+        limit=RELATED_LIMIT,
         offset=0,
     )
-    ctx["payment_methods"] = pms
     ctx["success"] = request.query_params.get("success")
     ctx["error"] = request.query_params.get("error")
     return templates.TemplateResponse("admin/billing/customers/detail.html", ctx)
@@ -233,15 +231,23 @@ def edit_customer_submit(
     """Handle customer edit form submission."""
     _ = csrf_token
 
+    data = {
+        "name": name,
+        "email": email,
+        "currency": currency,
+        "balance": balance,
+        "tax_id": tax_id,
+        "external_id": external_id,
+        "is_active": is_active,
+    }
+
+    item = billing_service.customers.get(db, str(item_id))
+    ctx = _base_context(
+        request, db, auth, title="Edit Customer", page_title="Edit Customer"
+    )
     try:
-        payload = CustomerUpdate(
-            name=name if name else None,
-            email=email if email else None,
-            currency=currency if currency else None,
-            balance=as_int(balance) if balance else None,
-            tax_id=tax_id if tax_id else None,
-            external_id=external_id if external_id else None,
-            is_active=is_active == "on",
+        payload = CustomerUpdate.model_validate(
+            form_values(data, checkboxes=("is_active",))
         )
         billing_service.customers.update(db, str(item_id), payload)
         db.commit()
@@ -251,14 +257,13 @@ def edit_customer_submit(
             status_code=302,
         )
     except (ValueError, TypeError, KeyError) as exc:
-        db.rollback()
+        # Validation fails before anything is written; only roll back if
+        # the update got as far as changing ``item``, so the record and the
+        # current user are not expired and re-read just to render the form.
+        if db.dirty:
+            db.rollback()
         logger.warning("Failed to update customer %s: %s", item_id, exc)
-        item = billing_service.customers.get(db, str(item_id))
-        ctx = _base_context(
-            request, db, auth, title="Edit Customer", page_title="Edit Customer"
-        )
-        ctx["customer"] = item
-        ctx["error"] = str(exc)
+        ctx.update({"customer": item, "error": str(exc)})
         return templates.TemplateResponse("admin/billing/customers/edit.html", ctx)
 
 
@@ -277,14 +282,10 @@ def delete_customer(
         billing_service.customers.delete(db, str(item_id))
         db.commit()
         logger.info("Deleted customer via web: %s", item_id)
-        return RedirectResponse(
-            url="/admin/billing/customers?success=Customer+deleted+successfully",
-            status_code=302,
+        return redirect_with_flash(
+            "/admin/billing/customers", success="Customer deleted successfully"
         )
     except (ValueError, TypeError, KeyError) as exc:
         db.rollback()
         logger.warning("Failed to delete customer %s: %s", item_id, exc)
-        return RedirectResponse(
-            url=f"/admin/billing/customers?error={quote_plus(str(exc))}",
-            status_code=302,
-        )
+        return redirect_with_flash("/admin/billing/customers", error=str(exc))
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-from urllib.parse import quote_plus
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Form, Request
@@ -13,9 +12,12 @@ from sqlalchemy.orm import Session
 from app.api.deps import get_db
 from app.schemas.billing import EntitlementCreate, EntitlementUpdate
 from app.services import billing as billing_service
+from app.services.billing_options import product_options
 from app.services.branding_context import load_branding_context
+from app.services.common import valid_cursor
 from app.templates import templates
-from app.web.form_utils import as_int
+from app.web.flash import redirect_with_flash
+from app.web.form_utils import form_values
 from app.web.schoolnet_deps import require_platform_admin_auth
 
 logger = logging.getLogger(__name__)
@@ -55,13 +57,17 @@ def list_entitlements(
     request: Request,
     page: int = 1,
     product_id: str | None = None,
+    cursor: str | None = None,
     db: Session = Depends(get_db),
     auth: dict = Depends(require_platform_admin_auth),
 ) -> HTMLResponse:
-    """List entitlements with pagination and optional product_id filter."""
+    """List entitlements with pagination and optional product_id filter.
+
+    "Next" links carry a keyset cursor, so deep pages skip the OFFSET scan.
+    """
     page = max(1, page)
     offset = (page - 1) * PAGE_SIZE
-    items, total = billing_service.entitlements.list(
+    items, total, next_cursor = billing_service.entitlements.list(
         db,
         product_id=product_id,
         feature_key=None,
@@ -69,17 +75,9 @@ def list_entitlements(
         order_dir="desc",
         limit=PAGE_SIZE,
         offset=offset,
+        cursor=valid_cursor(cursor),
     )
     total_pages = max(1, (total + PAGE_SIZE - 1) // PAGE_SIZE)
-    # Load products for filter display
-    all_products, _ = billing_service.products.list(
-        db,
-        is_active=None,
-        order_by="name",
-        order_dir="asc",
-        limit=500,
-        offset=0,
-    )
     ctx = _base_context(
         request, db, auth, title="Entitlements", page_title="Entitlements"
     )
@@ -89,7 +87,7 @@ def list_entitlements(
             "total": total,
             "page": page,
             "total_pages": total_pages,
-            "products": all_products,
+            "next_cursor": next_cursor,
             "product_id_filter": product_id or "",
             "success": request.query_params.get("success"),
             "error": request.query_params.get("error"),
@@ -105,18 +103,10 @@ def create_entitlement_form(
     auth: dict = Depends(require_platform_admin_auth),
 ) -> HTMLResponse:
     """Render the create entitlement form."""
-    all_products, _ = billing_service.products.list(
-        db,
-        is_active=True,
-        order_by="name",
-        order_dir="asc",
-        limit=500,
-        offset=0,
-    )
     ctx = _base_context(
         request, db, auth, title="Create Entitlement", page_title="Create Entitlement"
     )
-    ctx["products"] = all_products
+    ctx["products"] = product_options(db, active_only=True)
     ctx["value_types"] = VALUE_TYPES
     return templates.TemplateResponse("admin/billing/entitlements/create.html", ctx)
 
@@ -143,14 +133,11 @@ def create_entitlement_submit(
         "value_numeric": value_numeric,
     }
 
+    ctx = _base_context(
+        request, db, auth, title="Create Entitlement", page_title="Create Entitlement"
+    )
     try:
-        payload = EntitlementCreate(
-            product_id=UUID(product_id),
-            feature_key=feature_key,
-            value_type=value_type,  # type: ignore[arg-type]
-            value_text=value_text if value_text else None,
-            value_numeric=as_int(value_numeric) if value_numeric else None,
-        )
+        payload = EntitlementCreate.model_validate(form_values(data, drop_blank=True))
         billing_service.entitlements.create(db, payload)
         db.commit()
         logger.info("Created entitlement via web: %s", payload.feature_key)
@@ -161,25 +148,14 @@ def create_entitlement_submit(
     except (ValueError, TypeError, KeyError) as exc:
         db.rollback()
         logger.warning("Failed to create entitlement: %s", exc)
-        all_products, _ = billing_service.products.list(
-            db,
-            is_active=True,
-            order_by="name",
-            order_dir="asc",
-            limit=500,
-            offset=0,
-        )
-        ctx = _base_context(
-            request,
-            db,
-            auth,
-            title="Create Entitlement",
-            page_title="Create Entitlement",
+        ctx.update(
+            {
+                "products": product_options(db, active_only=True),
+                "value_types": VALUE_TYPES,
+                "error": str(exc),
+                "form_data": data,
+            }
         )
-        ctx["products"] = all_products
-        ctx["value_types"] = VALUE_TYPES
-        ctx["error"] = str(exc)
-        ctx["form_data"] = data
         return templates.TemplateResponse("admin/billing/entitlements/create.html", ctx)
 
 
@@ -216,19 +192,11 @@ def edit_entitlement_form(
 ) -> HTMLResponse:
     """Render the edit entitlement form."""
     item = billing_service.entitlements.get(db, str(item_id))
-    all_products, _ = billing_service.products.list(
-        db,
-        is_active=None,
-        order_by="name",
-        order_dir="asc",
-        limit=500,
-        offset=0,
-    )
     ctx = _base_context(
         request, db, auth, title="Edit Entitlement", page_title="Edit Entitlement"
     )
     ctx["entitlement"] = item
-    ctx["products"] = all_products
+    ctx["products"] = product_options(db)
     ctx["value_types"] = VALUE_TYPES
     return templates.TemplateResponse("admin/billing/entitlements/edit.html", ctx)
 
@@ -248,13 +216,19 @@ def edit_entitlement_submit(
     """Handle entitlement edit form submission."""
     _ = csrf_token
 
+    data = {
+        "feature_key": feature_key,
+        "value_type": value_type,
+        "value_text": value_text,
+        "value_numeric": value_numeric,
+    }
+
+    item = billing_service.entitlements.get(db, str(item_id))
+    ctx = _base_context(
+        request, db, auth, title="Edit Entitlement", page_title="Edit Entitlement"
+    )
     try:
-        payload = EntitlementUpdate(
-            feature_key=feature_key if feature_key else None,
-            value_type=value_type if value_type else None,  # type: ignore[arg-type]
-            value_text=value_text if value_text else None,
-            value_numeric=as_int(value_numeric) if value_numeric else None,
-        )
+        payload = EntitlementUpdate.model_validate(form_values(data))
         billing_service.entitlements.update(db, str(item_id), payload)
         db.commit()
         logger.info("Updated entitlement via web: %s", item_id)
@@ -263,28 +237,20 @@ def edit_entitlement_submit(
             status_code=302,
         )
     except (ValueError, TypeError, KeyError) as exc:
-        db.rollback()
+        # Validation fails before anything is written; only roll back if
+        # the update got as far as changing ``item``, so the record and the
+        # current user are not expired and re-read just to render the form.
+        if db.dirty:
+            db.rollback()
         logger.warning("Failed to update entitlement %s: %s", item_id, exc)
-        item = billing_service.entitlements.get(db, str(item_id))
-        all_products, _ = billing_service.products.list(
-            db,
-            is_active=None,
-            order_by="name",
-            order_dir="asc",
-            limit=500,
-            offset=0,
-        )
-        ctx = _base_context(
-            request,
-            db,
-            auth,
-            title="Edit Entitlement",
-            page_title="Edit Entitlement",
+        ctx.update(
+            {
+                "entitlement": item,
+                "products": product_options(db),
+                "value_types": VALUE_TYPES,
+                "error": str(exc),
+            }
         )
-        ctx["entitlement"] = item
-        ctx["products"] = all_products
-        ctx["value_types"] = VALUE_TYPES
-        ctx["error"] = str(exc)
         return templates.TemplateResponse("admin/billing/entitlements/edit.html", ctx)
 
 
@@ -303,14 +269,10 @@ def delete_entitlement(
         billing_service.entitlements.delete(db, str(item_id))
         db.commit()
         logger.info("Deleted entitlement via web: %s", item_id)
-        return RedirectResponse(
-            url="/admin/billing/entitlements?success=Entitlement+deleted+successfully",
-            status_code=302,
+        return redirect_with_flash(
+            "/admin/billing/entitlements", success="Entitlement deleted successfully"
         )
     except (ValueError, TypeError, KeyError) as exc:
         db.rollback()
         logger.warning("Failed to delete entitlement %s: %s", item_id, exc)
-        return RedirectResponse(
-            url=f"/admin/billing/entitlements?error={quote_plus(str(exc))}",
-            status_code=302,
-        )
+        return redirect_with_flash("/admin/billing/entitlements", error=str(exc))
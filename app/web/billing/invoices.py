@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-from urllib.parse import quote_plus
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Form, Request
@@ -14,8 +13,10 @@ from app.api.deps import get_db
 from app.schemas.billing import InvoiceUpdate
 from app.services import billing as billing_service
 from app.services.branding_context import load_branding_context
+from app.services.common import valid_cursor
 from app.templates import templates
-from app.web.form_utils import as_int
+from app.web.flash import redirect_with_flash
+from app.web.form_utils import form_values
 from app.web.schoolnet_deps import require_platform_admin_auth
 
 logger = logging.getLogger(__name__)
@@ -23,6 +24,9 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/admin/billing/invoices", tags=["web-billing-invoices"])
 
 PAGE_SIZE = 25
+# Detail page caps, applied in SQL.
+INVOICE_ITEMS_LIMIT = 100
+PAYMENT_INTENTS_LIMIT = 50
 
 INVOICE_STATUSES = ["draft", "open", "paid", "void", "uncollectible"]
 
@@ -54,13 +58,17 @@ def list_invoices(
     page: int = 1,
     customer_id: str | None = None,
     status: str | None = None,
+    cursor: str | None = None,
     db: Session = Depends(get_db),
     auth: dict = Depends(require_platform_admin_auth),
 ) -> HTMLResponse:
-    """List invoices with pagination and optional filters."""
+    """List invoices with pagination and optional filters.
+
+    "Next" links carry a keyset cursor, so deep pages skip the OFFSET scan.
+    """
     page = max(1, page)
     offset = (page - 1) * PAGE_SIZE
-    items, total = billing_service.invoices.list(
+    items, total, next_cursor = billing_service.invoices.list(
         db,
         customer_id=customer_id,
         subscription_id=None,
@@ -69,19 +77,9 @@ def list_invoices(
         order_dir="desc",
         limit=PAGE_SIZE,
         offset=offset,
+        cursor=valid_cursor(cursor),
     )
     total_pages = max(1, (total + PAGE_SIZE - 1) // PAGE_SIZE)
-    # Load customers for filter display
-    all_customers, _ = billing_service.customers.list(
-        db,
-        person_id=None,
-        email=None,
-        is_active=None,
-        order_by="name",
-        order_dir="asc",
-        limit=500,
-        offset=0,
-    )
     ctx = _base_context(request, db, auth, title="Invoices", page_title="Invoices")
     ctx.update(
         {
@@ -89,7 +87,7 @@ def list_invoices(
             "total": total,
             "page": page,
             "total_pages": total_pages,
-            "customers": all_customers,
+            "next_cursor": next_cursor,
             "customer_id_filter": customer_id or "",
             "status_filter": status or "",
             "statuses": INVOICE_STATUSES,
@@ -108,8 +106,7 @@ def invoice_detail(
     auth: dict = Depends(require_platform_admin_auth),
 ) -> HTMLResponse:
     """Show invoice detail view with items and payment intents."""
-    item = billing_service.invoices.get(db, str(item_id))
-    customer = billing_service.customers.get(db, str(item.customer_id))
+    item = billing_service.invoices.get_with_relations(db, str(item_id))
     ctx = _base_context(
         request,
         db,
@@ -118,29 +115,25 @@ def invoice_detail(
         page_title="Invoice Detail",
     )
     ctx["invoice"] = item
-    ctx["customer"] = customer
-    # Load invoice items
-    inv_items, _ = billing_service.invoice_items.list(
+    ctx["customer"] = item.customer
+    ctx["invoice_items"], _ = billing_service.invoice_items.list(
         db,
         invoice_id=str(item_id),
         order_by="created_at",
         order_dir="asc",
-        limit=100,
+        limit=INVOICE_ITEMS_LIMIT,
         offset=0,
     )
-    ctx["invoice_items"] = inv_items
-    # Load payment intents
-    pi_items, _ = billing_service.payment_intents.list(
+    ctx["payment_intents"], _ = billing_service.payment_intents.list(
         db,
         customer_id=str(item.customer_id),
         invoice_id=str(item_id),
         status=None,
         order_by="created_at",
         order_dir="desc",
-        limit=50,
+        limit=PAYMENT_INTENTS_LIMIT,
         offset=0,
     )
-    ctx["payment_intents"] = pi_items
     ctx["statuses"] = INVOICE_STATUSES
     ctx["success"] = request.query_params.get("success")
     ctx["error"] = request.query_params.get("error")
@@ -187,18 +180,26 @@ def edit_invoice_submit(
     """Handle invoice edit form submission."""
     _ = csrf_token
 
+    data = {
+        "number": number,
+        "status": status,
+        "currency": currency,
+        "subtotal": subtotal,
+        "tax": tax,
+        "total": total,
+        "amount_due": amount_due,
+        "amount_paid": amount_paid,
+        "external_id": external_id,
+        "is_active": is_active,
+    }
+
+    item = billing_service.invoices.get(db, str(item_id))
+    ctx = _base_context(
+        request, db, auth, title="Edit Invoice", page_title="Edit Invoice"
+    )
     try:
-        payload = InvoiceUpdate(
-            number=number if number else None,
-            status=status if status else None,  # type: ignore[arg-type]
-            currency=currency if currency else None,
-            subtotal=as_int(subtotal) if subtotal else None,
-            tax=as_int(tax) if tax else None,
-            total=as_int(total) if total else None,
-            amount_due=as_int(amount_due) if amount_due else None,
-            amount_paid=as_int(amount_paid) if amount_paid else None,
-            external_id=external_id if external_id else None,
-            is_active=is_active == "on",
+        payload = InvoiceUpdate.model_validate(
+            form_values(data, checkboxes=("is_active",))
         )
         billing_service.invoices.update(db, str(item_id), payload)
         db.commit()
@@ -208,17 +209,20 @@ def edit_invoice_submit(
             status_code=302,
         )
     except (ValueError, TypeError, KeyError) as exc:
-        db.rollback()
+        # Validation fails before anything is written; only roll back if
+        # the update got as far as changing ``item``, so the record and the
+        # current user are not expired and re-read just to render the form.
+        if db.dirty:
+            db.rollback()
         logger.warning("Failed to update invoice %s: %s", item_id, exc)
-        item = billing_service.invoices.get(db, str(item_id))
-        customer = billing_service.customers.get(db, str(item.customer_id))
-        ctx = _base_context(
-            request, db, auth, title="Edit Invoice", page_title="Edit Invoice"
+        ctx.update(
+            {
+                "invoice": item,
+                "customer": billing_service.customers.get(db, str(item.customer_id)),
+                "statuses": INVOICE_STATUSES,
+                "error": str(exc),
+            }
         )
-        ctx["invoice"] = item
-        ctx["customer"] = customer
-        ctx["statuses"] = INVOICE_STATUSES
-        ctx["error"] = str(exc)
         return templates.TemplateResponse("admin/billing/invoices/edit.html", ctx)
 
 
@@ -237,14 +241,10 @@ def delete_invoice(
         billing_service.invoices.delete(db, str(item_id))
         db.commit()
         logger.info("Deleted invoice via web: %s", item_id)
-        return RedirectResponse(
-            url="/admin/billing/invoices?success=Invoice+deleted+successfully",
-            status_code=302,
+        return redirect_with_flash(
+            "/admin/billing/invoices", success="Invoice deleted successfully"
         )
     except (ValueError, TypeError, KeyError) as exc:
         db.rollback()
         logger.warning("Failed to delete invoice %s: %s", item_id, exc)
-        return RedirectResponse(
-            url=f"/admin/billing/invoices?error={quote_plus(str(exc))}",
-            status_code=302,
-        )
+        return redirect_with_flash("/admin/billing/invoices", error=str(exc))
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-from urllib.parse import quote_plus
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Form, Request
@@ -14,6 +13,7 @@ from app.api.deps import get_db
 from app.services import billing as billing_service
 from app.services.branding_context import load_branding_context
 from app.templates import templates
+from app.web.flash import redirect_with_flash
 from app.web.schoolnet_deps import require_platform_admin_auth
 
 logger = logging.getLogger(__name__)
@@ -71,17 +71,6 @@ def list_payment_methods(
         offset=offset,
     )
     total_pages = max(1, (total + PAGE_SIZE - 1) // PAGE_SIZE)
-    # Load customers for filter display
-    all_customers, _ = billing_service.customers.list(
-        db,
-        person_id=None,
-        email=None,
-        is_active=None,
-        order_by="name",
-        order_dir="asc",
-        limit=500,
-        offset=0,
-    )
     ctx = _base_context(
         request, db, auth, title="Payment Methods", page_title="Payment Methods"
     )
@@ -91,7 +80,6 @@ def list_payment_methods(
             "total": total,
             "page": page,
             "total_pages": total_pages,
-            "customers": all_customers,
             "customer_id_filter": customer_id or "",
             "type_filter": type or "",
             "types": PAYMENT_METHOD_TYPES,
@@ -141,14 +129,11 @@ def delete_payment_method(
         billing_service.payment_methods.delete(db, str(item_id))
         db.commit()
         logger.info("Deleted payment method via web: %s", item_id)
-        return RedirectResponse(
-            url="/admin/billing/payment-methods?success=Payment+method+deleted+successfully",
-            status_code=302,
+        return redirect_with_flash(
+            "/admin/billing/payment-methods",
+            success="Payment method deleted successfully",
         )
     except (ValueError, TypeError, KeyError) as exc:
         db.rollback()
         logger.warning("Failed to delete payment method %s: %s", item_id, exc)
-        return RedirectResponse(
-            url=f"/admin/billing/payment-methods?error={quote_plus(str(exc))}",
-            status_code=302,
-        )
+        return redirect_with_flash("/admin/billing/payment-methods", error=str(exc))
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-from urllib.parse import quote_plus
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Form, Request
@@ -13,8 +12,10 @@ from sqlalchemy.orm import Session
 from app.api.deps import get_db
 from app.schemas.billing import PriceCreate, PriceUpdate
 from app.services import billing as billing_service
+from app.services.billing_options import product_options
 from app.services.branding_context import load_branding_context
 from app.templates import templates
+from app.web.flash import redirect_with_flash
 from app.web.form_utils import as_int, as_str
 from app.web.schoolnet_deps import require_platform_admin_auth
 
@@ -75,15 +76,6 @@ def list_prices(
         offset=offset,
     )
     total_pages = max(1, (total + PAGE_SIZE - 1) // PAGE_SIZE)
-    # Load products for display
-    all_products, _ = billing_service.products.list(
-        db,
-        is_active=None,
-        order_by="name",
-        order_dir="asc",
-        limit=500,
-        offset=0,
-    )
     ctx = _base_context(request, db, auth, title="Prices", page_title="Prices")
     ctx.update(
         {
@@ -91,7 +83,6 @@ def list_prices(
             "total": total,
             "page": page,
             "total_pages": total_pages,
-            "products": all_products,
             "product_id_filter": product_id or "",
             "is_active_filter": is_active or "",
             "success": request.query_params.get("success"),
@@ -108,18 +99,10 @@ def create_price_form(
     auth: dict = Depends(require_platform_admin_auth),
 ) -> HTMLResponse:
     """Render the create price form."""
-    all_products, _ = billing_service.products.list(
-        db,
-        is_active=True,
-        order_by="name",
-        order_dir="asc",
-        limit=500,
-        offset=0,
-    )
     ctx = _base_context(
         request, db, auth, title="Create Price", page_title="Create Price"
     )
-    ctx["products"] = all_products
+    ctx["products"] = product_options(db, active_only=True)
     return templates.TemplateResponse("admin/billing/prices/create.html", ctx)
 
 
@@ -180,18 +163,10 @@ def create_price_submit(
     except (ValueError, TypeError, KeyError) as exc:
         db.rollback()
         logger.warning("Failed to create price: %s", exc)
-        all_products, _ = billing_service.products.list(
-            db,
-            is_active=True,
-            order_by="name",
-            order_dir="asc",
-            limit=500,
-            offset=0,
-        )
         ctx = _base_context(
             request, db, auth, title="Create Price", page_title="Create Price"
         )
-        ctx["products"] = all_products
+        ctx["products"] = product_options(db, active_only=True)
         ctx["error"] = str(exc)
         ctx["form_data"] = data
         return templates.TemplateResponse("admin/billing/prices/create.html", ctx)
@@ -230,17 +205,8 @@ def edit_price_form(
 ) -> HTMLResponse:
     """Render the edit price form."""
     item = billing_service.prices.get(db, str(item_id))
-    all_products, _ = billing_service.products.list(
-        db,
-        is_active=None,
-        order_by="name",
-        order_dir="asc",
-        limit=500,
-        offset=0,
-    )
     ctx = _base_context(request, db, auth, title="Edit Price", page_title="Edit Price")
     ctx["price"] = item
-    ctx["products"] = all_products
     return templates.TemplateResponse("admin/billing/prices/edit.html", ctx)
 
 
@@ -289,19 +255,10 @@ def edit_price_submit(
         db.rollback()
         logger.warning("Failed to update price %s: %s", item_id, exc)
         item = billing_service.prices.get(db, str(item_id))
-        all_products, _ = billing_service.products.list(
-            db,
-            is_active=None,
-            order_by="name",
-            order_dir="asc",
-            limit=500,
-            offset=0,
-        )
         ctx = _base_context(
             request, db, auth, title="Edit Price", page_title="Edit Price"
         )
         ctx["price"] = item
-        ctx["products"] = all_products
         ctx["error"] = str(exc)
         return templates.TemplateResponse("admin/billing/prices/edit.html", ctx)
 
@@ -321,14 +278,10 @@ def delete_price(
         billing_service.prices.delete(db, str(item_id))
         db.commit()
         logger.info("Deleted price via web: %s", item_id)
-        return RedirectResponse(
-            url="/admin/billing/prices?success=Price+deleted+successfully",
-            status_code=302,
+        return redirect_with_flash(
+            "/admin/billing/prices", success="Price deleted successfully"
         )
     except (ValueError, TypeError, KeyError) as exc:
         db.rollback()
         logger.warning("Failed to delete price %s: %s", item_id, exc)
-        return RedirectResponse(
-            url=f"/admin/billing/prices?error={quote_plus(str(exc))}",
-            status_code=302,
-        )
+        return redirect_with_flash("/admin/billing/prices", error=str(exc))
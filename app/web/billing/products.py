@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-from urllib.parse import quote_plus
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Form, Request
@@ -15,6 +14,7 @@ from app.schemas.billing import ProductCreate, ProductUpdate
 from app.services import billing as billing_service
 from app.services.branding_context import load_branding_context
 from app.templates import templates
+from app.web.flash import redirect_with_flash
 from app.web.schoolnet_deps import require_platform_admin_auth
 
 logger = logging.getLogger(__name__)
@@ -239,14 +239,10 @@ def delete_product(
         billing_service.products.delete(db, str(item_id))
         db.commit()
         logger.info("Deleted product via web: %s", item_id)
-        return RedirectResponse(
-            url="/admin/billing/products?success=Product+deleted+successfully",
-            status_code=302,
+        return redirect_with_flash(
+            "/admin/billing/products", success="Product deleted successfully"
         )
     except (ValueError, TypeError, KeyError) as exc:
         db.rollback()
         logger.warning("Failed to delete product %s: %s", item_id, exc)
-        return RedirectResponse(
-            url=f"/admin/billing/products?error={quote_plus(str(exc))}",
-            status_code=302,
-        )
+        return redirect_with_flash("/admin/billing/products", error=str(exc))
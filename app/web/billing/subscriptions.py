@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-from urllib.parse import quote_plus
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Form, Request
@@ -15,6 +14,7 @@ from app.schemas.billing import SubscriptionUpdate
 from app.services import billing as billing_service
 from app.services.branding_context import load_branding_context
 from app.templates import templates
+from app.web.flash import redirect_with_flash
 from app.web.schoolnet_deps import require_platform_admin_auth
 
 logger = logging.getLogger(__name__)
@@ -80,17 +80,6 @@ def list_subscriptions(
         offset=offset,
     )
     total_pages = max(1, (total + PAGE_SIZE - 1) // PAGE_SIZE)
-    # Load customers for filter display
-    all_customers, _ = billing_service.customers.list(
-        db,
-        person_id=None,
-        email=None,
-        is_active=None,
-        order_by="name",
-        order_dir="asc",
-        limit=500,
-        offset=0,
-    )
     ctx = _base_context(
         request, db, auth, title="Subscriptions", page_title="Subscriptions"
     )
@@ -100,7 +89,6 @@ def list_subscriptions(
             "total": total,
             "page": page,
             "total_pages": total_pages,
-            "customers": all_customers,
             "customer_id_filter": customer_id or "",
             "status_filter": status or "",
             "statuses": SUBSCRIPTION_STATUSES,
@@ -142,7 +130,7 @@ def subscription_detail(
     )
     ctx["subscription_items"] = sub_items
     # Load related invoices
-    invoices, _ = billing_service.invoices.list(
+    invoices, _, _ = billing_service.invoices.list(
         db,
         customer_id=None,
         subscription_id=str(item_id),
@@ -241,14 +229,10 @@ def delete_subscription(
         billing_service.subscriptions.delete(db, str(item_id))
         db.commit()
         logger.info("Deleted subscription via web: %s", item_id)
-        return RedirectResponse(
-            url="/admin/billing/subscriptions?success=Subscription+deleted+successfully",
-            status_code=302,
+        return redirect_with_flash(
+            "/admin/billing/subscriptions", success="Subscription deleted successfully"
         )
     except (ValueError, TypeError, KeyError) as exc:
         db.rollback()
         logger.warning("Failed to delete subscription %s: %s", item_id, exc)
-        return RedirectResponse(
-            url=f"/admin/billing/subscriptions?error={quote_plus(str(exc))}",
-            status_code=302,
-        )
+        return redirect_with_flash("/admin/billing/subscriptions", error=str(exc))
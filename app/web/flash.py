@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from urllib.parse import urlencode
+
+from starlette.responses import RedirectResponse
+
+# Flash messages ride in the query string; exception text can be long, so
+# cap it before it ends up in a URL (and in access logs).
+MAX_FLASH_LENGTH = 200
+
+
+def redirect_with_flash(
+    path: str, *, success: str | None = None, error: str | None = None
+) -> RedirectResponse:
+    """302 to ``path`` with ``success``/``error`` encoded as query params."""
+    flash = {"success": success, "error": error}
+    query = urlencode(
+        {key: value[:MAX_FLASH_LENGTH] for key, value in flash.items() if value}
+    )
+    return RedirectResponse(url=f"{path}?{query}" if query else path, status_code=302)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterable, Mapping
 from typing import Any
 
 from starlette.datastructures import UploadFile
@@ -31,3 +32,25 @@ def as_int(value: Any) -> int | None:
         return int(raw)
     except ValueError:
         return None
+
+
+def form_values(
+    data: Mapping[str, Any],
+    *,
+    checkboxes: Iterable[str] = (),
+    drop_blank: bool = False,
+) -> dict[str, Any]:
+    """Map raw form fields onto Pydantic schema input in one pass.
+
+    Blank inputs become None (or are dropped, so schema defaults apply) and
+    checkbox fields become bools, since browsers omit unchecked boxes. The
+    schema's ``model_validate`` then does all remaining type coercion.
+    """
+    values: dict[str, Any] = {}
+    for key, value in data.items():
+        value = as_str(value) or None
+        if value is not None or not drop_blank:
+            values[key] = value
+    for key in checkboxes:
+        values[key] = data.get(key) == "on"
+    return values
@@ -104,6 +104,7 @@ def school_search(
         fee_max=fee_max_kobo,
         limit=limit,
         offset=offset,
+        summary=True,
     )
     total_pages = (total + limit - 1) // limit if total else 1
     ad_svc = AdService(db)
@@ -284,7 +285,7 @@ def register_parent_submit(
 ) -> Response:
     reg = RegistrationService(db)
     try:
-        reg.register_parent(
+        person = reg.register_parent(
             first_name=first_name,
             last_name=last_name,
             email=email,
@@ -302,14 +303,8 @@ def register_parent_submit(
 
     # Send verification email
     try:
-        from sqlalchemy import select
-
-        from app.models.person import Person
-
-        person = db.scalar(select(Person).where(Person.email == email))
-        if person:
-            token = issue_email_verification_token(db, str(person.id), email)
-            send_verification_email(db, email, token, first_name)
+        token = issue_email_verification_token(db, str(person.id), email)
+        send_verification_email(db, email, token, first_name)
     except (OSError, ValueError) as e:
         logger.warning("Failed to send verification email: %s", e)
 
@@ -345,7 +340,7 @@ def register_school_submit(
 ) -> Response:
     reg = RegistrationService(db)
     try:
-        reg.register_school_admin(
+        person, _school = reg.register_school_admin(
             first_name=first_name,
             last_name=last_name,
             email=email,
@@ -369,14 +364,8 @@ def register_school_submit(
 
     # Send verification email
     try:
-        from sqlalchemy import select
-
-        from app.models.person import Person
-
-        person = db.scalar(select(Person).where(Person.email == email))
-        if person:
-            token = issue_email_verification_token(db, str(person.id), email)
-            send_verification_email(db, email, token, first_name)
+        token = issue_email_verification_token(db, str(person.id), email)
+        send_verification_email(db, email, token, first_name)
     except (OSError, ValueError) as e:
         logger.warning("Failed to send school admin verification email: %s", e)
 
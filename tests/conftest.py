@@ -2,6 +2,7 @@ import asyncio
 import os
 import sys
 import uuid
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from types import ModuleType
 
@@ -18,7 +19,7 @@ import pytest
 import starlette.concurrency
 import starlette.routing
 from jose import jwt
-from sqlalchemy import DateTime, create_engine
+from sqlalchemy import DateTime, create_engine, event
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, sessionmaker
 from sqlalchemy.pool import StaticPool
 
@@ -94,6 +95,7 @@ class MockSettings:
     db_max_overflow = 10
     db_pool_timeout = 30
     db_pool_recycle = 1800
+    db_query_cache_size = 1200
     avatar_upload_dir = "static/avatars"
     avatar_max_size_bytes = 2 * 1024 * 1024
     avatar_allowed_types = "image/jpeg,image/png,image/gif,image/webp"
@@ -102,6 +104,8 @@ class MockSettings:
     brand_tagline = "FastAPI starter"
     brand_logo_url = None
     cors_origins = ""
+    jinja_bytecode_cache_dir = ""
+    password_hash_workers = 0
     storage_backend = "local"
     storage_local_dir = "/tmp/test_uploads"
     storage_url_prefix = "/static/uploads"
@@ -183,6 +187,31 @@ def engine():
     return _test_engine
 
 
+@pytest.fixture()
+def count_queries(engine):
+    """Collect the SQL statements an engine executes inside a ``with`` block.
+
+    ``with count_queries() as statements: ...`` records against the shared
+    test engine; pass another engine to watch that one instead.
+    """
+
+    @contextmanager
+    def _count_queries(bind=None):
+        statements: list[str] = []
+
+        def _record(_conn, _cursor, statement, *_args):
+            statements.append(statement)
+
+        target = bind if bind is not None else engine
+        event.listen(target, "before_cursor_execute", _record)
+        try:
+            yield statements
+        finally:
+            event.remove(target, "before_cursor_execute", _record)
+
+    return _count_queries
+
+
 @pytest.fixture()
 def db_session(engine):
     """Create a database session for testing.
@@ -245,6 +274,26 @@ def auth_env(monkeypatch):
     )
 
 
+@pytest.fixture(autouse=True)
+def _clear_process_caches():
+    """Process-wide caches would otherwise carry rows across tests."""
+    from app.services.auth_dependencies import clear_permission_cache
+    from app.services.billing_options import invalidate_product_options
+    from app.services.branding_context import invalidate_branding_context
+    from app.services.scheduler_config import clear_scheduler_config_cache
+    from app.services.school import invalidate_average_rating
+    from app.services.secrets import clear_secret_cache
+    from app.services.settings_spec import invalidate_resolved
+
+    invalidate_product_options()
+    invalidate_branding_context()
+    invalidate_average_rating()
+    invalidate_resolved()
+    clear_secret_cache()
+    clear_permission_cache()
+    clear_scheduler_config_cache()
+
+
 # ============ FastAPI Test Client Fixtures ============
 
 
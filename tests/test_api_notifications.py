@@ -34,6 +34,32 @@ class TestNotificationAPI:
         assert "items" in data
         assert len(data["items"]) >= 1
 
+    def test_list_my_notifications_cursor(
+        self, client, auth_headers, db_session, person
+    ):
+        for i in range(3):
+            db_session.add(
+                Notification(
+                    recipient_id=person.id,
+                    title=f"Cursor {i}",
+                    type=NotificationType.info,
+                )
+            )
+        db_session.commit()
+
+        first = client.get("/notifications/me?limit=1", headers=auth_headers).json()
+        assert first["next_cursor"]
+        second = client.get(
+            f"/notifications/me?limit=1&cursor={first['next_cursor']}",
+            headers=auth_headers,
+        ).json()
+        assert len(second["items"]) == 1
+        assert second["items"][0]["id"] != first["items"][0]["id"]
+
+    def test_list_my_notifications_invalid_cursor(self, client, auth_headers):
+        response = client.get("/notifications/me?cursor=bogus", headers=auth_headers)
+        assert response.status_code == 400
+
     def test_get_unread_count(self, client, auth_headers, db_session, person):
         for i in range(2):
             db_session.add(
@@ -71,6 +71,28 @@ class TestRolesAPI:
         data = response.json()
         assert len(data["items"]) <= 2
 
+    def test_list_roles_with_cursor(self, client, auth_headers, db_session):
+        for i in range(3):
+            db_session.add(Role(name=f"cursor_role_{i}_{uuid.uuid4().hex[:8]}"))
+        db_session.commit()
+
+        first = client.get(
+            "/rbac/roles?order_by=created_at&limit=2", headers=auth_headers
+        ).json()
+        assert first["next_cursor"]
+        second = client.get(
+            f"/rbac/roles?order_by=created_at&limit=2&cursor={first['next_cursor']}",
+            headers=auth_headers,
+        ).json()
+        first_ids = {item["id"] for item in first["items"]}
+        assert not first_ids & {item["id"] for item in second["items"]}
+
+    def test_list_roles_invalid_cursor(self, client, auth_headers):
+        response = client.get(
+            "/rbac/roles?order_by=created_at&cursor=bogus", headers=auth_headers
+        )
+        assert response.status_code == 400
+
     def test_list_roles_with_ordering(self, client, auth_headers):
         """Test listing roles with custom ordering."""
         response = client.get(
@@ -10,6 +10,7 @@ from starlette.requests import Request
 
 from app.models.auth import ApiKey, SessionStatus
 from app.models.auth import Session as AuthSession
+from app.models.rbac import Permission, PersonRole, Role, RolePermission
 from app.services import auth as auth_service
 from app.services.auth_dependencies import (
     _extract_bearer_token,
@@ -17,6 +18,8 @@ from app.services.auth_dependencies import (
     _is_jwt,
     _make_aware,
     require_audit_auth,
+    require_permission,
+    require_role,
     require_user_auth,
 )
 
@@ -433,3 +436,56 @@ class TestSessionTokenAuth:
                 db=db_session,
             )
         assert exc.value.status_code == 401
+
+
+class TestRoleAndPermissionChecks:
+    """DB-backed role/permission checks resolve in a single query."""
+
+    @staticmethod
+    def _grant(db_session, person, role_name, permission_key=None):
+        role = Role(name=role_name)
+        db_session.add(role)
+        db_session.flush()
+        db_session.add(PersonRole(person_id=person.id, role_id=role.id))
+        if permission_key:
+            permission = Permission(key=permission_key)
+            db_session.add(permission)
+            db_session.flush()
+            db_session.add(RolePermission(role_id=role.id, permission_id=permission.id))
+        db_session.commit()
+
+    def test_require_role_member(self, db_session, person):
+        name = f"role-{uuid.uuid4().hex[:8]}"
+        self._grant(db_session, person, name)
+        auth = {"person_id": str(person.id), "roles": []}
+        assert require_role(name)(auth=auth, db=db_session) is auth
+
+    def test_require_role_not_member(self, db_session, person):
+        name = f"role-{uuid.uuid4().hex[:8]}"
+        db_session.add(Role(name=name))
+        db_session.commit()
+        auth = {"person_id": str(person.id), "roles": []}
+        with pytest.raises(HTTPException) as exc:
+            require_role(name)(auth=auth, db=db_session)
+        assert exc.value.detail == "Forbidden"
+
+    def test_require_role_unknown(self, db_session, person):
+        auth = {"person_id": str(person.id), "roles": []}
+        with pytest.raises(HTTPException) as exc:
+            require_role("no-such-role")(auth=auth, db=db_session)
+        assert exc.value.detail == "Role not found"
+
+    def test_require_permission_granted(self, db_session, person):
+        key = f"perm:{uuid.uuid4().hex[:8]}"
+        self._grant(db_session, person, f"role-{uuid.uuid4().hex[:8]}", key)
+        auth = {"person_id": str(person.id), "roles": [], "scopes": []}
+        assert require_permission(key)(auth=auth, db=db_session) is auth
+
+    def test_require_permission_not_granted(self, db_session, person):
+        key = f"perm:{uuid.uuid4().hex[:8]}"
+        db_session.add(Permission(key=key))
+        db_session.commit()
+        auth = {"person_id": str(person.id), "roles": [], "scopes": []}
+        with pytest.raises(HTTPException) as exc:
+            require_permission(key)(auth=auth, db=db_session)
+        assert exc.value.detail == "Forbidden"
@@ -116,9 +116,10 @@ def test_decode_access_token_uses_openbao_secret(monkeypatch):
     def mock_get(url, **kwargs):
         return mock_response
 
-    import httpx
+    from app.services import secrets
 
-    monkeypatch.setattr(httpx, "get", mock_get)
+    secrets.clear_secret_cache()
+    monkeypatch.setattr(secrets._get_client(), "get", mock_get)
 
     now = datetime.now(timezone.utc)
     payload = {
@@ -166,6 +166,22 @@ class TestRefreshCookieSettingsDict:
         assert settings["path"] == "/"
         assert settings["max_age"] == 30 * 24 * 60 * 60  # 30 days default
 
+    def test_refresh_cookie_settings_reads_db_once(
+        self, db_session, count_queries, monkeypatch
+    ):
+        """All cookie settings come from a single query."""
+
+        monkeypatch.delenv("REFRESH_COOKIE_NAME", raising=False)
+        monkeypatch.delenv("REFRESH_COOKIE_SECURE", raising=False)
+        _upsert_auth_setting(db_session, "refresh_cookie_name", "db_cookie")
+        _upsert_auth_setting(db_session, "refresh_cookie_secure", "true")
+        with count_queries() as statements:
+            settings = AuthFlow.refresh_cookie_settings(db_session)
+
+        assert len(statements) == 1
+        assert settings["key"] == "db_cookie"
+        assert settings["secure"] is True
+
 
 class TestConcurrentRefreshRotation:
     """Tests for concurrent refresh token rotation behavior."""
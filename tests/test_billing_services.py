@@ -169,7 +169,7 @@ def test_list_customers_filter_email(db_session):
     billing_service.customers.create(
         db_session, CustomerCreate(name="Search Test", email=email)
     )
-    items, total = billing_service.customers.list(
+    items, total, _ = billing_service.customers.list(
         db_session,
         person_id=None,
         email=email,
@@ -183,6 +183,31 @@ def test_list_customers_filter_email(db_session):
     assert total == 1
 
 
+def test_list_customers_counts_in_page_query(db_session, count_queries):
+
+    for i in range(3):
+        billing_service.customers.create(
+            db_session,
+            CustomerCreate(name=f"Paged {i}", email=f"paged-{i}@example.com"),
+        )
+    db_session.flush()
+    with count_queries() as statements:
+        items, total, _ = billing_service.customers.list(
+            db_session,
+            person_id=None,
+            email="paged-",
+            is_active=None,
+            order_by="created_at",
+            order_dir="desc",
+            limit=2,
+            offset=0,
+        )
+
+    assert len(items) == 2
+    assert total == 3
+    assert len(statements) == 1
+
+
 def test_update_customer(db_session):
     customer = billing_service.customers.create(
         db_session,
@@ -311,6 +336,35 @@ def test_list_invoices_filter_status(db_session, billing_customer):
     assert len(results) >= 1
 
 
+def test_list_invoices_follows_keyset_cursor(db_session, billing_customer):
+    for _ in range(3):
+        billing_service.invoices.create(
+            db_session,
+            InvoiceCreate(
+                customer_id=billing_customer.id,
+                number=f"INV-{uuid.uuid4().hex[:8]}",
+            ),
+        )
+    kwargs = dict(
+        customer_id=str(billing_customer.id),
+        subscription_id=None,
+        status=None,
+        order_by="created_at",
+        order_dir="desc",
+        limit=2,
+        offset=0,
+    )
+    first, total, cursor = billing_service.invoices.list(db_session, **kwargs)
+    second, second_total, last_cursor = billing_service.invoices.list(
+        db_session, **kwargs, cursor=cursor
+    )
+
+    assert cursor is not None
+    assert (total, second_total) == (3, 3)
+    assert len(second) == 1 and last_cursor is None
+    assert not {i.id for i in first} & {i.id for i in second}
+
+
 def test_update_invoice(db_session, billing_customer):
     inv = billing_service.invoices.create(
         db_session,
@@ -510,7 +564,7 @@ def test_list_coupons_filter_valid(db_session):
             valid=True,
         ),
     )
-    items, total = billing_service.coupons.list(
+    items, total, _next_cursor = billing_service.coupons.list(
         db_session,
         valid=True,
         code=None,
@@ -523,6 +577,40 @@ def test_list_coupons_filter_valid(db_session):
     assert total >= 1
 
 
+def test_list_coupons_follows_keyset_cursor(db_session):
+    code = f"KEYSET{uuid.uuid4().hex[:4].upper()}"
+    for i in range(3):
+        billing_service.coupons.create(
+            db_session,
+            CouponCreate(
+                name=f"Keyset {i}", code=f"{code}{i}", percent_off=5, duration="once"
+            ),
+        )
+    first, total, cursor = billing_service.coupons.list(
+        db_session,
+        valid=None,
+        code=None,
+        order_by="created_at",
+        order_dir="desc",
+        limit=2,
+        offset=0,
+    )
+    second, second_total, _ = billing_service.coupons.list(
+        db_session,
+        valid=None,
+        code=None,
+        order_by="created_at",
+        order_dir="desc",
+        limit=2,
+        offset=0,
+        cursor=cursor,
+    )
+
+    assert cursor is not None
+    assert second_total == total
+    assert not {c.id for c in first} & {c.id for c in second}
+
+
 def test_update_coupon(db_session):
     coupon = billing_service.coupons.create(
         db_session,
@@ -629,7 +717,7 @@ def test_list_entitlements_filter_product(db_session, billing_product):
             value_type="boolean",
         ),
     )
-    items, total = billing_service.entitlements.list(
+    items, total, _ = billing_service.entitlements.list(
         db_session,
         product_id=str(billing_product.id),
         feature_key=None,
@@ -726,3 +814,27 @@ def test_list_webhook_events_filter_provider(db_session):
     assert len(items) >= 1
     assert total >= 1
     assert all(r.provider == "manual" for r in items)
+
+
+def test_product_options_are_cached_until_a_product_changes(db_session, count_queries):
+
+    from app.services.billing_options import product_options
+
+    product = billing_service.products.create(
+        db_session, ProductCreate(name="Options Plan")
+    )
+    first = product_options(db_session)
+    with count_queries() as statements:
+        assert product_options(db_session) == first
+    assert statements == []
+    assert {"value": str(product.id), "label": "Options Plan"} in first
+
+    billing_service.products.update(
+        db_session, str(product.id), ProductUpdate(name="Renamed Plan")
+    )
+    # Cleared on commit, not on flush, so other requests cannot re-cache the
+    # previously committed names in between.
+    assert product_options(db_session) == first
+    db_session.commit()
+    labels = [option["label"] for option in product_options(db_session)]
+    assert "Renamed Plan" in labels
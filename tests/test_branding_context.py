@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+from sqlalchemy import delete
+
+from app.models.domain_settings import DomainSetting, SettingDomain
 from app.services.branding import save_branding
 from app.services.branding_context import (
     branding_context_from_values,
+    invalidate_branding_context,
     load_branding_context,
 )
 from app.templates import templates
@@ -45,3 +49,28 @@ def test_org_branding_partial_escapes_css_content() -> None:
     )
     assert "<script>alert(1)</script>" not in rendered
     assert "&lt;/style&gt;&lt;script&gt;alert(1)&lt;/script&gt;" in rendered
+
+
+def test_load_branding_context_is_cached_until_saved(db_session) -> None:
+    invalidate_branding_context()
+    first = load_branding_context(db_session)
+    assert load_branding_context(db_session) is first
+
+    save_branding(db_session, {"display_name": "Cache Check"})
+    assert load_branding_context(db_session) is first
+    db_session.commit()
+    assert load_branding_context(db_session)["brand"]["name"] == "Cache Check"
+
+    db_session.execute(
+        delete(DomainSetting).where(DomainSetting.domain == SettingDomain.branding)
+    )
+    db_session.commit()
+    invalidate_branding_context()
+
+
+def test_rolled_back_branding_save_is_not_cached(db_session) -> None:
+    invalidate_branding_context()
+    save_branding(db_session, {"display_name": "Never Saved"})
+    assert load_branding_context(db_session)["brand"]["name"] == "Never Saved"
+    db_session.rollback()
+    assert load_branding_context(db_session)["brand"]["name"] != "Never Saved"
@@ -47,3 +47,137 @@ def test_settings_api_invalid_key(db_session):
     with pytest.raises(ValueError) as exc:
         settings_api_service.get_auth_setting(db_session, "bad_key")
     assert "Invalid setting key" in str(exc.value)
+
+
+def test_ensure_many_inserts_only_missing_keys(db_session):
+    settings = domain_settings_service.DomainSettings(domain=SettingDomain.billing)
+    suffix = uuid.uuid4().hex[:8]
+    existing = settings.ensure_by_key(
+        db_session,
+        key=f"kept_{suffix}",
+        value_type=SettingValueType.string,
+        value_text="original",
+    )
+    settings.ensure_many(
+        db_session,
+        [
+            {
+                "key": f"kept_{suffix}",
+                "value_type": SettingValueType.string,
+                "value_text": "replacement",
+            },
+            {
+                "key": f"new_a_{suffix}",
+                "value_type": SettingValueType.integer,
+                "value_text": "1",
+            },
+            {
+                "key": f"new_b_{suffix}",
+                "value_type": SettingValueType.json,
+                "value_json": ["x"],
+            },
+        ],
+    )
+    db_session.refresh(existing)
+
+    assert existing.value_text == "original"
+    new_a = settings.get_by_key(db_session, f"new_a_{suffix}")
+    new_b = settings.get_by_key(db_session, f"new_b_{suffix}")
+    assert new_a.value_text == "1"
+    assert new_b.value_json == ["x"]
+    assert len({existing.id, new_a.id, new_b.id}) == 3
+
+
+def test_seed_scheduled_tasks_is_idempotent(db_session):
+    from sqlalchemy import func, select
+
+    from app.models.scheduler import ScheduledTask
+    from app.services.settings_seed import seed_scheduled_tasks
+
+    seed_scheduled_tasks(db_session)
+    seed_scheduled_tasks(db_session)
+
+    counts = dict(
+        db_session.execute(
+            select(ScheduledTask.task_name, func.count())
+            .where(
+                ScheduledTask.task_name.in_(
+                    [
+                        "app.tasks.ads.expire_stale_ads_task",
+                        "app.tasks.notifications.archive_old_notifications_task",
+                    ]
+                )
+            )
+            .group_by(ScheduledTask.task_name)
+        ).all()
+    )
+    assert counts == {
+        "app.tasks.ads.expire_stale_ads_task": 1,
+        "app.tasks.notifications.archive_old_notifications_task": 1,
+    }
+
+
+def test_resolve_value_is_cached_until_setting_written(db_session, count_queries):
+
+    from app.services import settings_spec
+
+    settings_spec.invalidate_resolved()
+    domain_settings_service.auth_settings.upsert_by_key(
+        db_session,
+        "totp_issuer",
+        DomainSettingUpdate(value_type=SettingValueType.string, value_text="First"),
+    )
+    assert (
+        settings_spec.resolve_value(db_session, SettingDomain.auth, "totp_issuer")
+        == "First"
+    )
+
+    with count_queries() as statements:
+        cached = settings_spec.resolve_value(
+            db_session, SettingDomain.auth, "totp_issuer"
+        )
+    assert cached == "First"
+    assert statements == []
+
+    domain_settings_service.auth_settings.upsert_by_key(
+        db_session,
+        "totp_issuer",
+        DomainSettingUpdate(value_type=SettingValueType.string, value_text="Second"),
+    )
+    # Invalidation waits for the commit; rolling back drops the uncommitted
+    # "First" that the writer's own session put in the cache.
+    assert (
+        settings_spec.resolve_value(db_session, SettingDomain.auth, "totp_issuer")
+        == "First"
+    )
+    db_session.rollback()
+    assert (
+        settings_spec.resolve_value(db_session, SettingDomain.auth, "totp_issuer")
+        != "First"
+    )
+    settings_spec.invalidate_resolved()
+
+
+def test_seed_rows_follow_specs(monkeypatch):
+    from app.services import settings_seed, settings_spec
+
+    monkeypatch.setenv("JWT_SECRET", "plain-secret")
+    monkeypatch.setenv("TOTP_ENCRYPTION_KEY", "bao://secret/auth#totp")
+    monkeypatch.setenv("AUDIT_METHODS", "post, delete")
+    monkeypatch.delenv("CELERY_BROKER_URL", raising=False)
+    monkeypatch.setenv("REDIS_URL", "redis://cache:6379/2")
+
+    def rows(domain):
+        return {
+            row["key"]: row
+            for spec in settings_spec.list_specs(domain)
+            if (row := settings_seed._row_from_spec(spec))
+        }
+
+    auth = rows(SettingDomain.auth)
+    assert "jwt_secret" not in auth
+    assert auth["totp_encryption_key"]["is_secret"] is True
+    assert auth["refresh_cookie_secure"]["value_text"] in {"true", "false"}
+    assert rows(SettingDomain.audit)["methods"]["value_json"] == ["POST", "DELETE"]
+    scheduler = rows(SettingDomain.scheduler)
+    assert scheduler["broker_url"]["value_text"] == "redis://cache:6379/2"
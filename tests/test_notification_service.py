@@ -56,6 +56,21 @@ class TestNotificationService:
         items = notification_service.list_for_recipient(person.id)
         assert len(items) >= 3
 
+    def test_list_for_recipient_keyset(self, notification_service, db_session, person):
+        for i in range(5):
+            notification_service.create(
+                NotificationCreate(recipient_id=person.id, title=f"Page {i}")
+            )
+        db_session.commit()
+
+        everything = notification_service.list_for_recipient(person.id, limit=200)
+        first = notification_service.list_for_recipient(person.id, limit=2)
+        last = first[-1]
+        second = notification_service.list_for_recipient(
+            person.id, limit=2, cursor=(last.created_at, last.id)
+        )
+        assert [n.id for n in first + second] == [n.id for n in everything[:4]]
+
     def test_list_unread_only(self, notification_service, db_session, person):
         notification_service.create(
             NotificationCreate(
@@ -3,13 +3,25 @@
 from __future__ import annotations
 
 import uuid
+from datetime import datetime, timezone
 
 import pytest
 from sqlalchemy import Integer, String, create_engine, select
 from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column, sessionmaker
 from sqlalchemy.pool import StaticPool
 
-from app.services.common import apply_ordering, apply_pagination, coerce_uuid, paginate
+from app.services.common import (
+    apply_ordering,
+    apply_pagination,
+    coerce_uuid,
+    contains_pattern,
+    count_rows,
+    decode_cursor,
+    encode_cursor,
+    fetch_with_total,
+    paginate,
+    valid_cursor,
+)
 
 # ── Test DB setup ────────────────────────────────────────
 
@@ -65,6 +77,10 @@ class TestCoerceUuid:
     def test_invalid_string_returns_none(self) -> None:
         assert coerce_uuid("not-a-uuid") is None
 
+    def test_repeated_string_is_parsed_once(self) -> None:
+        s = str(uuid.uuid4())
+        assert coerce_uuid(s) is coerce_uuid(s)
+
 
 class TestPaginate:
     def test_first_page(self, db: Session) -> None:
@@ -141,3 +157,79 @@ class TestApplyPagination:
         paginated = apply_pagination(query, limit=5, offset=10)
         items = list(db.scalars(paginated).all())
         assert len(items) == 5
+
+
+class TestCursorEncoding:
+    def test_round_trip(self) -> None:
+        cursor = (datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc), uuid.uuid4())
+        assert decode_cursor(encode_cursor(cursor)) == cursor
+
+    def test_invalid_token_raises(self) -> None:
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor("not-a-cursor")
+
+    def test_valid_cursor_drops_bad_tokens(self) -> None:
+        token = encode_cursor((datetime(2026, 1, 2, tzinfo=timezone.utc), uuid.uuid4()))
+        assert valid_cursor(token) == token
+        assert valid_cursor("not-a-cursor") is None
+        assert valid_cursor(None) is None
+
+
+class TestCountRows:
+    def test_filtered_select_is_counted_without_subquery(
+        self, db: Session, count_queries
+    ) -> None:
+        query = select(_Item).where(_Item.name < "Item 010").order_by(_Item.name)
+        with count_queries(_engine) as statements:
+            total = count_rows(db, query)
+
+        assert total == 10
+        assert "ORDER BY" not in statements[0]
+        assert statements[0].count("SELECT") == 1
+
+    def test_distinct_and_limited_selects_keep_their_rows(self, db: Session) -> None:
+        assert count_rows(db, select(_Item.id).limit(5)) == 5
+        assert count_rows(db, select(_Item.name.like("Item 0%")).distinct()) == 1
+
+
+class TestFetchWithTotal:
+    def test_total_comes_from_page_query(self, db: Session, count_queries) -> None:
+        query = select(_Item)
+        page = query.order_by(_Item.id).limit(10).offset(20)
+        with count_queries(_engine) as statements:
+            items, total = fetch_with_total(db, query, page)
+
+        assert len(statements) == 1
+        assert total == 50
+        assert [item.name for item in items][0] == "Item 020"
+        assert all(isinstance(item, _Item) for item in items)
+
+    def test_empty_page_falls_back_to_count(self, db: Session) -> None:
+        query = select(_Item)
+        items, total = fetch_with_total(db, query, query.limit(10).offset(100))
+        assert items == []
+        assert total == 50
+
+    def test_empty_first_page_skips_count(self, db: Session, count_queries) -> None:
+        query = select(_Item).where(_Item.name == "missing")
+        with count_queries(_engine) as statements:
+            items, total = fetch_with_total(db, query, query.limit(10))
+
+        assert (items, total) == ([], 0)
+        assert len(statements) == 1
+
+
+class TestContainsPattern:
+    def test_escapes_wildcards_and_backslash(self) -> None:
+        assert contains_pattern(" 50%_off\\ ") == "%50\\%\\_off\\\\%"
+
+    def test_short_or_blank_terms_are_skipped(self) -> None:
+        assert contains_pattern(None) is None
+        assert contains_pattern("   ") is None
+        assert contains_pattern(" a ") is None
+
+    def test_wildcard_input_matches_literally(self, db: Session) -> None:
+        stmt = select(_Item).where(
+            _Item.name.ilike(contains_pattern("%%"), escape="\\")
+        )
+        assert db.scalars(stmt).all() == []
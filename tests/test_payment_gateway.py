@@ -0,0 +1,95 @@
+"""Tests for the Paystack gateway retry and circuit-breaker behaviour."""
+
+import httpx
+import pytest
+
+from app.services import payment_gateway
+from app.services.payment_gateway import CircuitBreaker, PaystackGateway
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(payment_gateway, "RETRY_BACKOFF_SECONDS", 0)
+
+
+def _gateway(handler, breaker=None) -> PaystackGateway:
+    gateway = PaystackGateway(transport=httpx.MockTransport(handler), breaker=breaker)
+    gateway._secret_key = "sk_test"
+    return gateway
+
+
+class TestPaystackGateway:
+    def test_verify_transaction_success(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.path == "/transaction/verify/ref-1"
+            assert request.headers["Authorization"] == "Bearer sk_test"
+            return httpx.Response(
+                200, json={"status": True, "data": {"status": "success"}}
+            )
+
+        result = _gateway(handler).verify_transaction("ref-1")
+        assert result == {"status": "success"}
+
+    def test_get_retries_server_errors(self):
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            if len(calls) < 3:
+                return httpx.Response(503)
+            return httpx.Response(200, json={"status": True, "data": []})
+
+        assert _gateway(handler).list_banks() == []
+        assert len(calls) == 3
+
+    def test_post_is_not_retried(self):
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(502)
+
+        gateway = _gateway(handler)
+        with pytest.raises(RuntimeError, match="HTTP 502"):
+            gateway.create_subaccount("School", "058", "0123456789", 10.0)
+        assert len(calls) == 1
+
+    def test_transport_error_becomes_runtime_error(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectTimeout("timed out", request=request)
+
+        with pytest.raises(RuntimeError, match="Paystack request failed"):
+            _gateway(handler).verify_transaction("ref-1")
+
+    def test_breaker_opens_and_fails_fast(self):
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(500)
+
+        gateway = _gateway(handler, breaker=CircuitBreaker(fail_max=2))
+        for _ in range(2):
+            with pytest.raises(RuntimeError, match="HTTP 500"):
+                gateway.initialize_transaction(100, "a@b.c", "ref", "http://cb")
+        assert gateway.breaker.is_open
+
+        with pytest.raises(RuntimeError, match="Paystack degraded"):
+            gateway.initialize_transaction(100, "a@b.c", "ref", "http://cb")
+        assert len(calls) == 2
+
+
+class TestCircuitBreaker:
+    def test_half_open_success_closes(self):
+        breaker = CircuitBreaker(fail_max=1, reset_timeout=0)
+        breaker.record_failure()
+        breaker.before_call()  # reset timeout elapsed: call is let through
+        breaker.record_success()
+        assert not breaker.is_open
+
+    def test_success_resets_failure_count(self):
+        breaker = CircuitBreaker(fail_max=2)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert not breaker.is_open
@@ -6,6 +6,7 @@ import pytest
 
 from app.models.school import Rating
 from app.services.rating import RatingService
+from app.services.school import SchoolService
 
 
 class TestRatingCreate:
@@ -41,6 +42,34 @@ class TestRatingCreate:
         assert rating.score == 4
         assert rating.comment == "Great school!"
 
+    def test_create_rating_invalidates_cached_average(
+        self, db_session, school, parent_person, admission_form_with_price
+    ):
+        self._create_application(db_session, parent_person, admission_form_with_price)
+        school_svc = SchoolService(db_session)
+        assert school_svc.get_average_rating(school.id) is None
+
+        RatingService(db_session).create(
+            school_id=school.id, parent_id=parent_person.id, score=3
+        )
+        db_session.commit()
+
+        assert school_svc.get_average_rating(school.id) == 3.0
+
+    def test_rolled_back_rating_does_not_stay_cached(
+        self, db_session, school, parent_person, admission_form_with_price
+    ):
+        self._create_application(db_session, parent_person, admission_form_with_price)
+        school_svc = SchoolService(db_session)
+
+        RatingService(db_session).create(
+            school_id=school.id, parent_id=parent_person.id, score=2
+        )
+        assert school_svc.get_average_rating(school.id) == 2.0
+        db_session.rollback()
+
+        assert school_svc.get_average_rating(school.id) is None
+
     def test_create_rating_invalid_score_low(self, db_session, school, parent_person):
         svc = RatingService(db_session)
         with pytest.raises(ValueError, match="between 1 and 5"):
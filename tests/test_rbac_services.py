@@ -1,8 +1,16 @@
+import uuid
+
+import pytest
+
+from app.models.rbac import Role
 from app.schemas.rbac import (
     PermissionCreate,
     PermissionUpdate,
+    PersonRoleCreate,
+    PersonRoleUpdate,
     RoleCreate,
     RolePermissionCreate,
+    RoleRead,
     RoleUpdate,
 )
 from app.services import rbac as rbac_service
@@ -17,7 +25,7 @@ def test_role_permission_link_flow(db_session):
         db_session,
         RolePermissionCreate(role_id=role.id, permission_id=permission.id),
     )
-    items, total = rbac_service.role_permissions.list(
+    items, total, _ = rbac_service.role_permissions.list(
         db_session,
         role_id=role.id,
         permission_id=None,
@@ -30,11 +38,31 @@ def test_role_permission_link_flow(db_session):
     assert items[0].id == link.id
 
 
+def test_person_role_list_is_one_query(db_session, person, count_queries):
+    role = rbac_service.roles.create(db_session, RoleCreate(name="One Query"))
+    rbac_service.person_roles.create(
+        db_session, PersonRoleCreate(person_id=person.id, role_id=role.id)
+    )
+    with count_queries() as statements:
+        items, total, _ = rbac_service.person_roles.list(
+            db_session,
+            person_id=str(person.id),
+            role_id=None,
+            order_by="assigned_at",
+            order_dir="desc",
+            limit=10,
+            offset=0,
+        )
+
+    assert total == len(items) >= 1
+    assert len(statements) == 1
+
+
 def test_role_permission_soft_delete_filters(db_session):
     role = rbac_service.roles.create(db_session, RoleCreate(name="Settings"))
     rbac_service.roles.update(db_session, str(role.id), RoleUpdate(name="Settings Ops"))
     rbac_service.roles.delete(db_session, str(role.id))
-    active, active_total = rbac_service.roles.list(
+    active, active_total, _ = rbac_service.roles.list(
         db_session,
         is_active=None,
         order_by="created_at",
@@ -42,7 +70,7 @@ def test_role_permission_soft_delete_filters(db_session):
         limit=10,
         offset=0,
     )
-    inactive, inactive_total = rbac_service.roles.list(
+    inactive, inactive_total, _ = rbac_service.roles.list(
         db_session,
         is_active=False,
         order_by="created_at",
@@ -56,6 +84,51 @@ def test_role_permission_soft_delete_filters(db_session):
     assert any(item.id == role.id for item in inactive)
 
 
+def test_roles_list_keyset_cursor(db_session):
+    for i in range(3):
+        rbac_service.roles.create(db_session, RoleCreate(name=f"Keyset {i}"))
+    everything, _, _ = rbac_service.roles.list(
+        db_session,
+        is_active=None,
+        order_by="created_at",
+        order_dir="asc",
+        limit=500,
+        offset=0,
+    )
+    first, _, cursor = rbac_service.roles.list(
+        db_session,
+        is_active=None,
+        order_by="created_at",
+        order_dir="asc",
+        limit=2,
+        offset=0,
+    )
+    assert cursor is not None
+    second, _, _ = rbac_service.roles.list(
+        db_session,
+        is_active=None,
+        order_by="created_at",
+        order_dir="asc",
+        limit=2,
+        offset=0,
+        cursor=cursor,
+    )
+    assert [r.id for r in first + second] == [r.id for r in everything[:4]]
+
+
+def test_roles_list_cursor_requires_keyset_order(db_session):
+    with pytest.raises(ValueError, match="cursor pagination"):
+        rbac_service.roles.list(
+            db_session,
+            is_active=None,
+            order_by="name",
+            order_dir="asc",
+            limit=2,
+            offset=0,
+            cursor="anything",
+        )
+
+
 def test_permission_update(db_session):
     permission = rbac_service.permissions.create(
         db_session, PermissionCreate(key="settings:write", description="Settings Write")
@@ -66,3 +139,107 @@ def test_permission_update(db_session):
         PermissionUpdate(description="Settings Write Access"),
     )
     assert updated.description == "Settings Write Access"
+    assert updated.key == "settings:write"
+    assert updated.is_active is True
+
+
+def test_role_permission_create_reports_missing_target(db_session):
+    role = rbac_service.roles.create(db_session, RoleCreate(name="Missing Perm"))
+    with pytest.raises(rbac_service.PermissionNotFoundError):
+        rbac_service.role_permissions.create(
+            db_session,
+            RolePermissionCreate(role_id=role.id, permission_id=uuid.uuid4()),
+        )
+    with pytest.raises(rbac_service.RoleNotFoundError):
+        rbac_service.role_permissions.create(
+            db_session,
+            RolePermissionCreate(role_id=uuid.uuid4(), permission_id=uuid.uuid4()),
+        )
+
+
+def test_person_role_update_reports_missing_person(db_session, person):
+    role = rbac_service.roles.create(db_session, RoleCreate(name="Link Update"))
+    link = rbac_service.person_roles.create(
+        db_session, PersonRoleCreate(person_id=person.id, role_id=role.id)
+    )
+    with pytest.raises(rbac_service.PersonNotFoundError):
+        rbac_service.person_roles.update(
+            db_session, str(link.id), PersonRoleUpdate(person_id=uuid.uuid4())
+        )
+
+
+def test_roles_list_returns_read_rows_outside_identity_map(db_session):
+    role = rbac_service.roles.create(db_session, RoleCreate(name="Row Reader"))
+    items, _, _ = rbac_service.roles.list(
+        db_session,
+        is_active=None,
+        order_by="name",
+        order_dir="asc",
+        limit=500,
+        offset=0,
+    )
+    row = next(item for item in items if item.id == role.id)
+    assert not isinstance(row, Role)
+    assert RoleRead.model_validate(row).name == "Row Reader"
+
+
+def test_person_role_delete_removes_role_name(db_session, person):
+    role = rbac_service.roles.create(db_session, RoleCreate(name="Cached Member"))
+    link = rbac_service.person_roles.create(
+        db_session, PersonRoleCreate(person_id=person.id, role_id=role.id)
+    )
+    assert "Cached Member" in rbac_service.get_person_role_names(db_session, person.id)
+
+    rbac_service.person_roles.delete(db_session, str(link.id))
+    assert "Cached Member" not in rbac_service.get_person_role_names(
+        db_session, person.id
+    )
+    with pytest.raises(rbac_service.PersonRoleNotFoundError):
+        rbac_service.person_roles.delete(db_session, str(link.id))
+
+
+def test_permission_delete_missing_raises(db_session):
+    with pytest.raises(rbac_service.PermissionNotFoundError):
+        rbac_service.permissions.delete(db_session, str(uuid.uuid4()))
+
+
+def test_role_create_and_update_skip_refresh_select(db_session, count_queries):
+    with count_queries() as statements:
+        role = rbac_service.roles.create(db_session, RoleCreate(name="No Refresh"))
+        rbac_service.roles.update(
+            db_session, str(role.id), RoleUpdate(description="updated")
+        )
+
+    assert [statement.split()[0].upper() for statement in statements] == [
+        "INSERT",
+        "UPDATE",
+    ]
+    assert role.created_at is not None
+    assert role.updated_at is not None
+
+
+def test_person_role_update_skips_check_for_unchanged_targets(
+    db_session, count_queries, person
+):
+    role = rbac_service.roles.create(db_session, RoleCreate(name="Unchanged Target"))
+    link = rbac_service.person_roles.create(
+        db_session, PersonRoleCreate(person_id=person.id, role_id=role.id)
+    )
+    with count_queries() as statements:
+        rbac_service.person_roles.update(
+            db_session,
+            str(link.id),
+            PersonRoleUpdate(person_id=person.id, role_id=role.id),
+        )
+
+    assert statements == []
+
+
+def test_rbac_service_singletons_are_stateless():
+    for service in (
+        rbac_service.roles,
+        rbac_service.permissions,
+        rbac_service.role_permissions,
+        rbac_service.person_roles,
+    ):
+        assert not hasattr(service, "__dict__")
@@ -1,9 +1,11 @@
 """Tests for RegistrationService — parent and school admin registration."""
 
 import pytest
+from sqlalchemy import event
 
 from app.models.auth import UserCredential
 from app.models.rbac import Role
+from app.services.auth_flow import verify_password
 from app.services.registration import RegistrationService
 from tests.conftest import _unique_email
 
@@ -73,6 +75,7 @@ class TestRegisterParent:
         cred = db_session.scalar(stmt)
         assert cred is not None
         assert cred.password_hash is not None
+        assert verify_password("SecurePassword123", cred.password_hash)
 
     def test_register_parent_assigns_role(self, db_session, parent_role):
         svc = RegistrationService(db_session)
@@ -106,6 +109,36 @@ class TestRegisterParent:
                 password="Pass4567",
             )
 
+    def test_duplicate_email_cancels_pending_hash(
+        self, db_session, parent_role, monkeypatch
+    ):
+        from concurrent.futures import Future
+
+        from app.services import registration
+
+        svc = RegistrationService(db_session)
+        email = _unique_email()
+        svc.register_parent(
+            first_name="Jane", last_name="Doe", email=email, password="Pass1234"
+        )
+        db_session.commit()
+
+        submitted: list[Future] = []
+
+        class _IdleExecutor:
+            def submit(self, fn, *args):
+                future: Future = Future()
+                submitted.append(future)
+                return future
+
+        monkeypatch.setattr(registration, "_hash_executor", _IdleExecutor())
+        with pytest.raises(ValueError, match="already exists"):
+            svc.register_parent(
+                first_name="John", last_name="Doe", email=email, password="Pass4567"
+            )
+
+        assert [future.cancelled() for future in submitted] == [True]
+
 
 class TestRegisterSchoolAdmin:
     def test_register_school_admin(self, db_session, school_admin_role):
@@ -235,3 +268,50 @@ class TestPasswordValidation:
                 email=_unique_email(),
                 password="PASSWORD123",
             )
+
+
+class TestRoleNames:
+    def test_register_parent_seeds_fresh_role_names(self, db_session, parent_role):
+        svc = RegistrationService(db_session)
+        person = svc.register_parent(
+            first_name="Cache",
+            last_name="Check",
+            email=_unique_email(),
+            password="SecurePassword123",
+        )
+        db_session.commit()
+        assert "parent" in svc.get_person_role_names(person.id)
+
+    def test_register_without_active_role_skips_link(self, db_session):
+        from sqlalchemy import select
+
+        from app.models.rbac import PersonRole
+
+        svc = RegistrationService(db_session)
+        person = svc._create_account(
+            "No", "Role", _unique_email(), None, "SecurePassword123", "ghost_role"
+        )
+        db_session.commit()
+        links = db_session.scalars(
+            select(PersonRole).where(PersonRole.person_id == person.id)
+        ).all()
+        assert links == []
+
+    def test_register_parent_single_flush(self, db_session, parent_role):
+        svc = RegistrationService(db_session)
+        flushes = []
+
+        def _record(*_args):
+            flushes.append(1)
+
+        event.listen(db_session, "after_flush", _record)
+        try:
+            svc.register_parent(
+                first_name="One",
+                last_name="Flush",
+                email=_unique_email(),
+                password="SecurePassword123",
+            )
+        finally:
+            event.remove(db_session, "after_flush", _record)
+        assert len(flushes) == 1
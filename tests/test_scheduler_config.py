@@ -0,0 +1,132 @@
+"""Tests for Celery configuration loading from env and domain settings."""
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.exc import OperationalError
+
+from app.models.domain_settings import DomainSetting, SettingDomain
+from app.models.scheduler import ScheduledTask
+from app.services import scheduler_config
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    scheduler_config.clear_scheduler_config_cache()
+    yield
+    scheduler_config.clear_scheduler_config_cache()
+
+
+def _set(db_session, key: str, value: str) -> None:
+    setting = db_session.scalar(
+        select(DomainSetting).where(
+            DomainSetting.domain == SettingDomain.scheduler, DomainSetting.key == key
+        )
+    )
+    if setting is None:
+        setting = DomainSetting(domain=SettingDomain.scheduler, key=key)
+        db_session.add(setting)
+    setting.value_text = value
+    setting.is_active = True
+    db_session.commit()
+
+
+def _clear_celery_env(monkeypatch) -> None:
+    for env_key in (
+        "CELERY_BROKER_URL",
+        "CELERY_RESULT_BACKEND",
+        "CELERY_TIMEZONE",
+        "CELERY_BEAT_MAX_LOOP_INTERVAL",
+        "CELERY_BEAT_REFRESH_SECONDS",
+    ):
+        monkeypatch.delenv(env_key, raising=False)
+
+
+def test_get_celery_config_reads_db_in_one_query(
+    db_session, count_queries, monkeypatch
+):
+    _clear_celery_env(monkeypatch)
+    _set(db_session, "timezone", "Africa/Lagos")
+    _set(db_session, "beat_refresh_seconds", "45")
+
+    with count_queries() as statements:
+        config = scheduler_config.get_celery_config()
+
+    assert len(statements) == 1
+    assert config["timezone"] == "Africa/Lagos"
+    assert config["beat_refresh_seconds"] == 45
+    assert config["beat_max_loop_interval"] == 5
+
+
+def test_get_celery_config_env_overrides_skip_db(count_queries, monkeypatch):
+    monkeypatch.setenv("CELERY_BROKER_URL", "redis://broker:6379/0")
+    monkeypatch.setenv("CELERY_RESULT_BACKEND", "redis://broker:6379/1")
+    monkeypatch.setenv("CELERY_TIMEZONE", "UTC")
+    monkeypatch.setenv("CELERY_BEAT_MAX_LOOP_INTERVAL", "7")
+    monkeypatch.setenv("CELERY_BEAT_REFRESH_SECONDS", "11")
+
+    with count_queries() as statements:
+        config = scheduler_config.get_celery_config()
+
+    assert statements == []
+    assert config["broker_url"] == "redis://broker:6379/0"
+    assert config["beat_max_loop_interval"] == 7
+    assert config["beat_refresh_seconds"] == 11
+
+
+def test_get_celery_config_is_cached(db_session, count_queries, monkeypatch):
+    _clear_celery_env(monkeypatch)
+    _set(db_session, "timezone", "Africa/Lagos")
+    scheduler_config.get_celery_config()
+
+    with count_queries() as statements:
+        config = scheduler_config.get_celery_config()
+
+    assert statements == []
+    assert config["timezone"] == "Africa/Lagos"
+
+
+def test_get_celery_config_falls_back_to_stale_on_db_error(db_session, monkeypatch):
+    _clear_celery_env(monkeypatch)
+    _set(db_session, "timezone", "Africa/Lagos")
+    scheduler_config.get_celery_config()
+    monkeypatch.setattr(scheduler_config, "CONFIG_CACHE_TTL_SECONDS", 0)
+    scheduler_config._config_cache["expires"] = 0.0
+
+    def _fail(*_args):
+        raise OperationalError("SELECT", {}, Exception("db down"))
+
+    monkeypatch.setattr(scheduler_config, "_get_setting_values", _fail)
+    config = scheduler_config.get_celery_config()
+    assert config["timezone"] == "Africa/Lagos"
+
+
+def test_build_beat_schedule_reuses_cache_until_tasks_change(db_session):
+    task = ScheduledTask(name="Cache test", task_name="app.tasks.noop")
+    db_session.add(task)
+    db_session.commit()
+
+    first = scheduler_config.build_beat_schedule()
+    assert f"scheduled_task_{task.id}" in first
+    assert scheduler_config.build_beat_schedule() == first
+
+    task.enabled = False
+    db_session.commit()
+    assert f"scheduled_task_{task.id}" not in scheduler_config.build_beat_schedule()
+
+
+def test_build_beat_schedule_entry_fields(db_session):
+    task = ScheduledTask(
+        name="Entry fields",
+        task_name="app.tasks.entry",
+        interval_seconds=0,
+        args_json=[1],
+        kwargs_json={"a": 2},
+    )
+    db_session.add(task)
+    db_session.commit()
+
+    entry = scheduler_config.build_beat_schedule()[f"scheduled_task_{task.id}"]
+    assert entry["task"] == "app.tasks.entry"
+    assert entry["schedule"].total_seconds() == 1
+    assert entry["args"] == [1]
+    assert entry["kwargs"] == {"a": 2}
@@ -2,6 +2,9 @@
 
 import uuid
 
+import pytest
+from sqlalchemy import inspect
+
 from app.models.school import (
     Application,
     ApplicationStatus,
@@ -9,7 +12,9 @@ from app.models.school import (
     SchoolStatus,
 )
 from app.schemas.school import SchoolCreate, SchoolUpdate
-from app.services.school import SchoolService
+from app.services import school as school_service
+from app.services.school import SchoolService, _unique_slug
+from app.tasks import paystack as paystack_tasks
 
 
 class TestSchoolServiceCreate:
@@ -45,6 +50,30 @@ class TestSchoolServiceCreate:
         assert s2.slug == "same-name-school-1"
         assert s1.id != s2.id
 
+    def test_unique_slug_continues_after_highest_suffix(self, db_session, school_owner):
+        svc = SchoolService(db_session)
+        for name in ("Gap School", "Gap School 5", "Gap School Annex"):
+            svc.create(
+                SchoolCreate(name=name, school_type="primary", category="private"),
+                owner_id=school_owner.id,
+            )
+            db_session.flush()
+
+        school = svc.create(
+            SchoolCreate(name="Gap School", school_type="primary", category="private"),
+            owner_id=school_owner.id,
+        )
+        db_session.commit()
+
+        assert school.slug == "gap-school-6"
+
+    def test_unique_slug_free_base_is_single_query(self, db_session, count_queries):
+        with count_queries() as statements:
+            slug = _unique_slug(db_session, "Never Used Slug School")
+
+        assert slug == "never-used-slug-school"
+        assert len(statements) == 1
+
 
 class TestSchoolServiceGet:
     def test_get_by_id(self, db_session, school):
@@ -99,6 +128,15 @@ class TestSchoolServiceSearch:
         assert total == 0
         assert results == []
 
+    def test_search_summary_loads_card_columns_only(self, db_session, school):
+        db_session.expire_all()
+        svc = SchoolService(db_session)
+        results, total = svc.search(query="Test Academy", summary=True)
+        assert total >= 1
+        state = inspect(results[0])
+        assert "name" not in state.unloaded
+        assert "description" in state.unloaded
+
     def test_search_pagination(self, db_session, school):
         svc = SchoolService(db_session)
         results, total = svc.search(limit=1, offset=0)
@@ -138,6 +176,80 @@ class TestSchoolServiceUpdate:
         assert suspended.status == SchoolStatus.suspended
 
 
+class TestSchoolServicePaystack:
+    def test_create_queues_subaccount_instead_of_calling_gateway(
+        self, db_session, school_owner, monkeypatch
+    ):
+        gateway = school_service.paystack_gateway
+        queued = []
+        monkeypatch.setattr(gateway, "is_configured", lambda: True)
+        monkeypatch.setattr(
+            gateway,
+            "create_subaccount",
+            lambda **_kwargs: pytest.fail("gateway called on request path"),
+        )
+        monkeypatch.setattr(
+            paystack_tasks.provision_school_subaccount_task, "delay", queued.append
+        )
+
+        school = SchoolService(db_session).create(
+            SchoolCreate(
+                name="Queued Bank School",
+                school_type="primary",
+                category="private",
+                bank_code="058",
+                account_number="0123456789",
+            ),
+            owner_id=school_owner.id,
+        )
+        assert queued == []
+        db_session.commit()
+
+        assert queued == [str(school.id)]
+        assert school.settlement_bank_verified is False
+        assert school.paystack_subaccount_code is None
+
+    def test_update_rolled_back_does_not_queue_subaccount(
+        self, db_session, school, monkeypatch
+    ):
+        queued = []
+        monkeypatch.setattr(
+            school_service.paystack_gateway, "is_configured", lambda: True
+        )
+        monkeypatch.setattr(
+            paystack_tasks.provision_school_subaccount_task, "delay", queued.append
+        )
+
+        svc = SchoolService(db_session)
+        svc.update(school, SchoolUpdate(bank_code="058", account_number="0123456789"))
+        db_session.rollback()
+        svc.update(school, SchoolUpdate(name="Renamed School"))
+        db_session.commit()
+
+        assert queued == []
+
+    def test_provision_task_backfills_subaccount(self, db_session, school, monkeypatch):
+        school.bank_code = "058"
+        school.account_number = "0123456789"
+        db_session.commit()
+        monkeypatch.setattr(
+            school_service.paystack_gateway,
+            "create_subaccount",
+            lambda **_kwargs: {
+                "subaccount_code": "ACCT_test",
+                "settlement_bank": "GTBank",
+            },
+        )
+
+        result = paystack_tasks.provision_school_subaccount_task(str(school.id))
+
+        db_session.refresh(school)
+        assert result["success"] is True
+        assert school.paystack_subaccount_code == "ACCT_test"
+        assert school.bank_name == "GTBank"
+        assert school.settlement_bank_verified is True
+
+
 class TestSchoolServiceRatings:
     def test_get_average_rating_no_ratings(self, db_session, school):
         svc = SchoolService(db_session)
@@ -186,3 +298,27 @@ class TestSchoolServiceDashboard:
         assert stats.active_forms >= 1
         assert stats.total_applications >= 1
         assert stats.pending_applications >= 1
+
+    def test_get_dashboard_stats_single_query(self, db_session, count_queries, school):
+        with count_queries() as statements:
+            stats = SchoolService(db_session).get_dashboard_stats(school.id)
+
+        assert len(statements) == 1
+        assert stats.total_revenue >= 0
+
+    def test_check_capacity_counts_accepted_applications(
+        self, db_session, school, admission_form_with_price, parent_person
+    ):
+        db_session.add(
+            Application(
+                admission_form_id=admission_form_with_price.id,
+                parent_id=parent_person.id,
+                application_number=f"SCH-CAP-{uuid.uuid4().hex[:5].upper()}",
+                status=ApplicationStatus.accepted,
+            )
+        )
+        school.student_capacity = 1
+        db_session.commit()
+
+        with pytest.raises(ValueError, match="capacity"):
+            SchoolService(db_session).check_capacity(school.id)
@@ -7,6 +7,13 @@ from app.services import secrets
 from tests.mocks import FakeHTTPXResponse
 
 
+@pytest.fixture(autouse=True)
+def clear_secret_cache():
+    secrets.clear_secret_cache()
+    yield
+    secrets.clear_secret_cache()
+
+
 def test_is_openbao_ref_valid():
     """Test detecting valid OpenBao references."""
     assert secrets.is_openbao_ref("openbao://secret/data/myapp#password") is True
@@ -55,10 +62,7 @@ def test_resolve_openbao_ref_kv_v2(monkeypatch):
     def mock_get(url, **kwargs):
         return mock_response
 
-    # Patch httpx.get
-    import httpx
-
-    monkeypatch.setattr(httpx, "get", mock_get)
+    monkeypatch.setattr(secrets._get_client(), "get", mock_get)
 
     result = secrets.resolve_openbao_ref("openbao://secret/data/myapp#password")
     assert result == "secret-password-123"
@@ -81,9 +85,7 @@ def test_resolve_openbao_ref_kv_v1(monkeypatch):
     def mock_get(url, **kwargs):
         return mock_response
 
-    import httpx
-
-    monkeypatch.setattr(httpx, "get", mock_get)
+    monkeypatch.setattr(secrets._get_client(), "get", mock_get)
 
     result = secrets.resolve_openbao_ref("openbao://kv/myapp#api_key")
     assert result == "key-abc-123"
@@ -102,9 +104,7 @@ def test_resolve_openbao_ref_with_namespace(monkeypatch):
         captured_headers.update(headers or {})
         return FakeHTTPXResponse(json_data={"data": {"data": {"secret": "ns-value"}}})
 
-    import httpx
-
-    monkeypatch.setattr(httpx, "get", mock_get)
+    monkeypatch.setattr(secrets._get_client(), "get", mock_get)
 
     result = secrets.resolve_openbao_ref("openbao://secret/data/app#secret")
     assert result == "ns-value"
@@ -130,10 +130,26 @@ def test_resolve_openbao_ref_missing_field_error(monkeypatch):
     def mock_get(url, **kwargs):
         return mock_response
 
-    import httpx
-
-    monkeypatch.setattr(httpx, "get", mock_get)
+    monkeypatch.setattr(secrets._get_client(), "get", mock_get)
 
     with pytest.raises(HTTPException) as exc:
         secrets.resolve_openbao_ref("openbao://secret/data/myapp#missing_field")
     assert exc.value.status_code == 500
+
+
+def test_resolve_openbao_ref_is_cached(monkeypatch):
+    """Repeated lookups of the same reference hit OpenBao once."""
+    monkeypatch.setenv("OPENBAO_ADDR", "https://vault.test.local:8200")
+    monkeypatch.setenv("OPENBAO_TOKEN", "test-token")
+    monkeypatch.setenv("OPENBAO_KV_VERSION", "2")
+    calls = []
+
+    def mock_get(url, **kwargs):
+        calls.append(url)
+        return FakeHTTPXResponse(json_data={"data": {"data": {"value": "cached"}}})
+
+    monkeypatch.setattr(secrets._get_client(), "get", mock_get)
+
+    for _ in range(3):
+        assert secrets.resolve_secret("openbao://secret/data/cached") == "cached"
+    assert len(calls) == 1
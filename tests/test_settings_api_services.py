@@ -115,3 +115,31 @@ def test_list_settings_response(db_session):
     )
     assert response["count"] == len(response["items"])
     assert response["count"] >= 2
+
+
+@pytest.mark.parametrize(
+    ("key", "raw", "coerced", "stored"),
+    [
+        ("refresh_cookie_secure", " Yes ", True, ("true", True)),
+        ("jwt_access_ttl_minutes", "20", 20, ("20", None)),
+        ("jwt_algorithm", 256, "256", ("256", None)),
+    ],
+)
+def test_coerce_and_normalize_dispatch_by_value_type(key, raw, coerced, stored):
+    from app.models.domain_settings import SettingDomain
+    from app.services import settings_spec
+
+    spec = settings_spec.get_spec(SettingDomain.auth, key)
+    assert settings_spec.coerce_value(spec, raw) == (coerced, None)
+    assert settings_spec.normalize_for_db(spec, coerced) == stored
+
+
+def test_coerce_value_rejects_bad_boolean():
+    from app.models.domain_settings import SettingDomain
+    from app.services import settings_spec
+
+    spec = settings_spec.get_spec(SettingDomain.auth, "refresh_cookie_secure")
+    assert settings_spec.coerce_value(spec, "maybe") == (
+        None,
+        "Value must be boolean",
+    )
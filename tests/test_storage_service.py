@@ -35,6 +35,10 @@ class TestLocalStorage:
         saved = (Path(storage_dir) / key).read_bytes()
         assert saved == content
 
+    def test_save_leaves_no_temp_file(self, local_storage, storage_dir):
+        key = local_storage.save(b"payload", "atomic.txt", "text/plain")
+        assert sorted(p.name for p in Path(storage_dir).iterdir()) == [key]
+
     def test_get_url(self, local_storage):
         url = local_storage.get_url("abc123_test.txt")
         assert url == "/static/uploads/abc123_test.txt"
@@ -54,6 +58,13 @@ class TestLocalStorage:
         local_storage.delete(key)
         assert not local_storage.exists(key)
 
+    def test_delete_many_removes_each_file(self, local_storage):
+        keys = [
+            local_storage.save(b"x", f"many{i}.txt", "text/plain") for i in range(3)
+        ]
+        local_storage.delete_many(keys)
+        assert not any(local_storage.exists(key) for key in keys)
+
     def test_delete_nonexistent_noop(self, local_storage):
         # Should not raise
         local_storage.delete("nonexistent.txt")
@@ -64,6 +75,81 @@ class TestLocalStorage:
         assert len(key) < len(long_name)
         assert key.endswith(".txt")
 
+    def test_save_creates_missing_directory(self, tmp_path):
+        base = tmp_path / "not" / "yet" / "there"
+        storage = LocalStorage(base_dir=str(base), url_prefix="/static/uploads")
+        key = storage.save(b"data", "first.txt", "text/plain")
+        assert (base / key).read_bytes() == b"data"
+
     def test_directory_traversal_prevented(self, local_storage):
         result = local_storage._resolve_path("../../etc/passwd")
         assert result is None
+
+
+class TestS3Storage:
+    def test_instances_share_client_per_config(self, monkeypatch):
+        from types import SimpleNamespace
+
+        from app.services import storage
+
+        created = []
+
+        def _client(service, **kwargs):
+            created.append(kwargs)
+            return object()
+
+        monkeypatch.setattr(storage, "boto3", SimpleNamespace(client=_client))
+        monkeypatch.setattr(storage, "_s3_clients", {})
+        config = {"bucket": "b", "region": "us-east-1", "access_key": "k"}
+
+        first = storage.S3Storage(**config)._get_client()
+        second = storage.S3Storage(**config)._get_client()
+        other = storage.S3Storage(**{**config, "region": "eu-west-1"})._get_client()
+
+        assert first is second
+        assert other is not first
+        assert len(created) == 2
+
+    def test_delete_many_batches_delete_objects(self, monkeypatch):
+        from app.services import storage
+
+        calls = []
+
+        class _FakeClient:
+            def delete_objects(self, **kwargs):
+                calls.append(kwargs)
+                return {}
+
+        s3 = storage.S3Storage(bucket="b", region="us-east-1")
+        monkeypatch.setattr(s3, "_get_client", _FakeClient)
+
+        s3.delete_many(f"key-{i}" for i in range(2500))
+
+        assert [len(call["Delete"]["Objects"]) for call in calls] == [1000, 1000, 500]
+        assert calls[0]["Bucket"] == "b"
+
+    def test_delete_many_raises_for_failed_keys(self, monkeypatch):
+        from app.services import storage
+
+        class _FakeClient:
+            def delete_objects(self, **kwargs):
+                return {
+                    "Errors": [
+                        {"Key": "key-1", "Code": "AccessDenied", "Message": "no"}
+                    ]
+                }
+
+        s3 = storage.S3Storage(bucket="b", region="us-east-1")
+        monkeypatch.setattr(s3, "_get_client", _FakeClient)
+
+        with pytest.raises(RuntimeError, match="1 of 3"):
+            s3.delete_many(["key-0", "key-1", "key-2"])
+
+
+def test_get_storage_backend_is_reused():
+    from app.services.storage import get_storage_backend
+
+    backend = get_storage_backend()
+
+    assert isinstance(backend, LocalStorage)
+    assert get_storage_backend() is backend
@@ -43,6 +43,10 @@ class TestSanitizeHtml:
         result = _sanitize_html("<div><p>hello</p></div>")
         assert result == "hello"
 
+    def test_rendered_output_is_escaped_once(self) -> None:
+        tpl = templates.env.from_string("{{ value | sanitize_html }}")
+        assert tpl.render(value="<b>A & B</b>") == "A &amp; B"
+
 
 class TestNl2br:
     def test_newlines_to_br(self) -> None:
@@ -99,6 +103,12 @@ class TestFormatCurrency:
     def test_large_number(self) -> None:
         assert _format_currency(1000000) == "$1,000,000.00"
 
+    def test_repeated_values_are_memoized(self) -> None:
+        _format_currency(987.65)
+        hits = _format_currency.cache_info().hits
+        assert _format_currency(987.65) == "$987.65"
+        assert _format_currency.cache_info().hits == hits + 1
+
     def test_none_returns_empty(self) -> None:
         assert _format_currency(None) == ""
 
@@ -55,6 +55,47 @@ class TestWebBillingCustomers:
         )
         assert response.status_code == 200
 
+    def test_detail(self, client, admin_token, billing_customer):
+        response = client.get(
+            f"/admin/billing/customers/{billing_customer.id}",
+            cookies={"access_token": admin_token},
+        )
+        assert response.status_code == 200
+        assert billing_customer.email.encode() in response.content
+
+    def test_delete_error_redirects_with_encoded_flash(self, client, admin_token):
+        import uuid
+        from urllib.parse import parse_qs, urlsplit
+
+        csrf = client.get("/login").cookies.get("csrf_token", "")
+        response = client.post(
+            f"/admin/billing/customers/{uuid.uuid4()}/delete",
+            data={"csrf_token": csrf},
+            cookies={"access_token": admin_token, "csrf_token": csrf},
+            follow_redirects=False,
+        )
+        assert response.status_code == 302
+        location = urlsplit(response.headers["location"])
+        assert location.path == "/admin/billing/customers"
+        assert parse_qs(location.query) == {"error": ["Customer not found"]}
+
+    def test_edit_error_rerenders_without_reloading(
+        self, client, count_queries, admin_token, billing_customer
+    ):
+        csrf = client.get("/login").cookies.get("csrf_token", "")
+        with count_queries() as statements:
+            response = client.post(
+                f"/admin/billing/customers/{billing_customer.id}/edit",
+                data={"name": "x" * 300, "csrf_token": csrf},
+                cookies={"access_token": admin_token, "csrf_token": csrf},
+            )
+        selects = [s for s in statements if s.startswith("SELECT")]
+
+        assert response.status_code == 200
+        assert billing_customer.email.encode() in response.content
+        # Session, current user and customer are each read once.
+        assert len(selects) == 3
+
 
 class TestWebBillingSubscriptions:
     def test_list(self, client, admin_token):
@@ -75,6 +116,86 @@ class TestWebBillingInvoices:
         assert response.status_code == 200
         assert b"Invoices" in response.content
 
+    def test_list_loads_customers_with_the_page(
+        self, client, db_session, admin_token, count_queries
+    ):
+        from app.models.billing import Customer, Invoice
+
+        for i in range(10):
+            customer = Customer(name=f"List Customer {i}", email=f"list-{i}@x.com")
+            db_session.add(customer)
+            db_session.flush()
+            db_session.add(Invoice(customer_id=customer.id, number=f"INV-LIST-{i}"))
+        db_session.commit()
+
+        with count_queries() as statements:
+            response = client.get(
+                "/admin/billing/invoices",
+                cookies={"access_token": admin_token},
+            )
+
+        assert response.status_code == 200
+        assert b"List Customer 9" in response.content
+        selects = [s for s in statements if s.startswith("SELECT")]
+        # Customers come in on the page query; one SELECT per row would
+        # make this 16.
+        assert not [s for s in selects if s.startswith("SELECT customers.")]
+        assert len(selects) <= 6
+
+    def test_detail_shows_line_items(
+        self, client, db_session, admin_token, billing_customer
+    ):
+        from app.schemas.billing import InvoiceCreate, InvoiceItemCreate
+        from app.services import billing as billing_service
+
+        invoice = billing_service.invoices.create(
+            db_session,
+            InvoiceCreate(customer_id=billing_customer.id, number="INV-DETAIL"),
+        )
+        billing_service.invoice_items.create(
+            db_session,
+            InvoiceItemCreate(
+                invoice_id=invoice.id, description="Setup fee", amount=1000
+            ),
+        )
+        db_session.commit()
+
+        response = client.get(
+            f"/admin/billing/invoices/{invoice.id}",
+            cookies={"access_token": admin_token},
+        )
+        assert response.status_code == 200
+        assert b"Setup fee" in response.content
+        assert billing_customer.name.encode() in response.content
+
+    def test_detail_caps_line_items_in_sql(
+        self, client, db_session, admin_token, billing_customer, monkeypatch
+    ):
+        from app.schemas.billing import InvoiceCreate, InvoiceItemCreate
+        from app.services import billing as billing_service
+        from app.web.billing import invoices as invoice_routes
+
+        invoice = billing_service.invoices.create(
+            db_session,
+            InvoiceCreate(customer_id=billing_customer.id, number="INV-CAPPED"),
+        )
+        for description in ("First fee", "Second fee"):
+            billing_service.invoice_items.create(
+                db_session,
+                InvoiceItemCreate(
+                    invoice_id=invoice.id, description=description, amount=100
+                ),
+            )
+        db_session.commit()
+        monkeypatch.setattr(invoice_routes, "INVOICE_ITEMS_LIMIT", 1)
+
+        response = client.get(
+            f"/admin/billing/invoices/{invoice.id}",
+            cookies={"access_token": admin_token},
+        )
+        assert response.status_code == 200
+        assert (b"First fee" in response.content) != (b"Second fee" in response.content)
+
 
 class TestWebBillingPaymentMethods:
     def test_list(self, client, admin_token):
@@ -102,6 +223,47 @@ class TestWebBillingCoupons:
         )
         assert response.status_code == 200
 
+    def test_form_values_are_coerced_by_schema(self):
+        from app.schemas.billing import CouponCreate
+        from app.web.form_utils import form_values
+
+        payload = CouponCreate.model_validate(
+            form_values(
+                {
+                    "name": "Spring",
+                    "code": "SPRING",
+                    "percent_off": "15",
+                    "amount_off": "",
+                    "duration": "once",
+                    "max_redemptions": None,
+                    "valid": None,
+                    "redeem_by": "2026-03-31",
+                },
+                checkboxes=("valid",),
+            )
+        )
+        assert payload.percent_off == 15
+        assert payload.amount_off is None
+        assert payload.valid is False
+        assert payload.redeem_by is not None
+        assert payload.redeem_by.day == 31
+
+    def test_blank_form_values_fall_back_to_schema_defaults(self):
+        from app.schemas.billing import CustomerCreate
+        from app.web.form_utils import form_values
+
+        payload = CustomerCreate.model_validate(
+            form_values(
+                {"name": "Acme", "email": "a@example.com", "balance": "", "tax_id": ""},
+                checkboxes=("is_active",),
+                drop_blank=True,
+            )
+        )
+        assert payload.balance == 0
+        assert payload.currency == "usd"
+        assert payload.tax_id is None
+        assert payload.is_active is False
+
 
 class TestWebBillingEntitlements:
     def test_list(self, client, admin_token):
@@ -119,6 +281,15 @@ class TestWebBillingEntitlements:
         )
         assert response.status_code == 200
 
+    def test_create_page_lists_products(self, client, admin_token, billing_product):
+        response = client.get(
+            "/admin/billing/entitlements/create",
+            cookies={"access_token": admin_token},
+        )
+        assert response.status_code == 200
+        assert f'value="{billing_product.id}"'.encode() in response.content
+        assert billing_product.name.encode() in response.content
+
 
 class TestWebBillingWebhookEvents:
     def test_list(self, client, admin_token):
@@ -126,3 +126,13 @@ class TestWebFileUploads:
             cookies={"access_token": admin_token},
         )
         assert response.status_code == 200
+
+
+class TestWebSchools:
+    def test_list(self, client, school, admin_token):
+        response = client.get(
+            "/admin/schools",
+            cookies={"access_token": admin_token},
+        )
+        assert response.status_code == 200
+        assert school.name.encode() in response.content
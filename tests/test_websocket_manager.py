@@ -1,10 +1,12 @@
 """Tests for WebSocket connection manager."""
 
+import asyncio
+import json
 import uuid
 from unittest.mock import AsyncMock, MagicMock, PropertyMock
 
 import pytest
-from starlette.websockets import WebSocketState
+from starlette.websockets import WebSocketDisconnect, WebSocketState
 
 from app.services.websocket_manager import ConnectionManager
 
@@ -59,8 +61,12 @@ class TestConnectionManager:
         person_id = uuid.uuid4()
         ws = _make_ws()
         await manager.connect(person_id, ws)
-        await manager.send_to_person(person_id, {"type": "test"})
+        await manager.send_to_person(person_id, {"type": "test", "title": "Café"})
         ws.send_text.assert_called_once()
+        assert json.loads(ws.send_text.call_args.args[0]) == {
+            "type": "test",
+            "title": "Café",
+        }
 
     @pytest.mark.asyncio
     async def test_send_to_person_no_connections(self, manager):
@@ -80,6 +86,28 @@ class TestConnectionManager:
         ws1.send_text.assert_called_once()
         ws2.send_text.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_sends_to_connections_concurrently(self, manager):
+        person_id = uuid.uuid4()
+        both_started = asyncio.Event()
+        started = []
+
+        async def _send(_message):
+            # Completes only once every socket is mid-send: a serial loop
+            # would never get here.
+            started.append(1)
+            if len(started) == 2:
+                both_started.set()
+            await both_started.wait()
+
+        for _ in range(2):
+            ws = _make_ws()
+            ws.send_text = AsyncMock(side_effect=_send)
+            await manager.connect(person_id, ws)
+
+        await asyncio.wait_for(manager.send_to_person(person_id, {"t": 1}), 1)
+        assert len(started) == 2
+
     @pytest.mark.asyncio
     async def test_broadcast(self, manager):
         p1 = uuid.uuid4()
@@ -103,5 +131,15 @@ class TestConnectionManager:
         await manager.send_to_person(person_id, {"type": "fail"})
         assert manager.get_connection_count(person_id) == 0
 
+    @pytest.mark.asyncio
+    async def test_disconnected_client_is_dropped(self, manager):
+        person_id = uuid.uuid4()
+        ws = _make_ws()
+        ws.send_text.side_effect = WebSocketDisconnect(code=1006)
+        await manager.connect(person_id, ws)
+
+        await manager.send_to_person(person_id, {"type": "gone"})
+        assert manager.get_connection_count(person_id) == 0
+
     def test_get_connection_count_total(self, manager):
         assert manager.get_connection_count() == 0